@@ -2,7 +2,23 @@ import os.path
 
 from clocks.autoclock import *
 from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
 import urllib.parse
+import argparse
+import threading
+import json
+import time
+import uuid
+import sys
+from enum import Enum
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import resource
+except ImportError:
+    #not available on windows, we just won't report memory use
+    resource = None
 
 # #clock = AutoWallClock(centred_second_hand=True, dial_style=DialStyle.LINES_ARC, has_dial=True, gear_style=GearStyle.CURVES)
 # clock = AutoWallClock(dial_style=DialStyle.ROMAN, dial_seconds_style=DialStyle.LINES_ARC, has_dial=True, gear_style=GearStyle.ARCS, hand_style=HandStyle.BAROQUE, hand_has_outline=False,
@@ -12,87 +28,454 @@ import urllib.parse
 # else:
 #     show_object(clock.model.getClock(with_pendulum=True))
 
-
-class AutoclockHTTPHandler(BaseHTTPRequestHandler):
-
-
-    def sanitise_options(self, options):
-        clean_options = {}
-        # sanitise input
-        if "pendulum_period_s" in options:
-            clean_options["pendulum_period_s"] = int(options["pendulum_period_s"][0])
-        if "has_dial" in options:
-            clean_options["has_dial"] = options["has_dial"][0].lower() == "true"
-        if "dial_style" in options:
-            try:
-                clean_options["dial_style"] = DialStyle(options["dial_style"][0])
-            except:
-                print("dial style not recognised")
-        if "dial_seconds_style" in options:
-            try:
-                clean_options["dial_seconds_style"] = DialStyle(options["dial_seconds_style"][0])
-            except:
-                print("dial seconds style not recognised")
-
-        if "gear_style" in options:
-            gear_string = options["gear_style"][0]
-            if gear_string == "None":
-                gear_string = None
+CACHE_DIR = "autoclock"
+#how often each (raw) set of options has been requested, persisted so a restarted server knows what's popular
+REQUEST_COUNTS_FILE = os.path.join(CACHE_DIR, "request_counts.json")
+
+DEFAULT_OPTIONS = {
+    "pendulum_period_s": 2,
+    "has_dial": True,
+    "dial_style": DialStyle.LINES_ARC,
+    "dial_seconds_style": DialStyle.CONCENTRIC_CIRCLES,
+    "gear_style": GearStyle.CURVES,
+    "hand_style": HandStyle.SIMPLE_ROUND,
+    "hand_has_outline": True,
+    "escapement_style": AnchorStyle.CURVED_MATCHING_WHEEL,
+    "days": 8,
+    "centred_second_hand": True,
+    "width": 300,
+    "fidelity": FIDELITY_FULL,
+}
+
+def sanitise_options(options):
+    '''
+    options is as from urllib.parse.parse_qs: each value is a list of strings
+    '''
+    clean_options = {}
+    # sanitise input
+    if "pendulum_period_s" in options:
+        clean_options["pendulum_period_s"] = int(options["pendulum_period_s"][0])
+    if "has_dial" in options:
+        clean_options["has_dial"] = options["has_dial"][0].lower() == "true"
+    if "dial_style" in options:
+        try:
+            clean_options["dial_style"] = DialStyle(options["dial_style"][0])
+        except:
+            print("dial style not recognised")
+    if "dial_seconds_style" in options:
+        try:
+            clean_options["dial_seconds_style"] = DialStyle(options["dial_seconds_style"][0])
+        except:
+            print("dial seconds style not recognised")
+
+    if "gear_style" in options:
+        gear_string = options["gear_style"][0]
+        if gear_string == "None":
+            gear_string = None
+        try:
+            clean_options["gear_style"] = GearStyle(gear_string)
+        except:
+            print("gear style not recognised")
+
+    if "hand_style" in options:
+        try:
+            clean_options["hand_style"] = HandStyle(options["hand_style"][0])
+        except:
+            print("hand style not recognised")
+
+    if "hand_has_outline" in options:
+        clean_options["hand_has_outline"] = options["hand_has_outline"][0].lower() == "true"
+
+    if "escapement_style" in options:
+        try:
+            clean_options["escapement_style"] = AnchorStyle(options["escapement_style"][0])
+        except:
+            print("escapement style not recognised")
+
+    if "days" in options:
+        clean_options["days"] = int(options["days"][0])
+
+    if "centred_second_hand" in options:
+        clean_options["centred_second_hand"] = options["centred_second_hand"][0].lower() == "true"
+
+    if "width" in options:
+        clean_options["width"] = int(options["width"][0])
+        if clean_options["width"] < 100:
+            clean_options["width"] = 100
+        if clean_options["width"] > 2000:
+            clean_options["width"] = 2000
+
+    if "fidelity" in options:
+        if options["fidelity"][0] in [FIDELITY_FULL, FIDELITY_DRAFT]:
+            clean_options["fidelity"] = options["fidelity"][0]
+        else:
+            print("fidelity not recognised")
+
+    return clean_options
+
+def get_full_options(clean_options):
+    options = DEFAULT_OPTIONS.copy()
+    options.update(clean_options)
+    return options
+
+def get_full_fidelity_options(options):
+    '''
+    drafts are cheap, so request counts (and the warm-up) are about the full fidelity version
+    '''
+    options = options.copy()
+    options["fidelity"] = FIDELITY_FULL
+    return options
+
+def options_to_query(options):
+    '''
+    Turn a full set of options back into the parse_qs form so it can be stored as json and fed back through sanitise_options
+    '''
+    query = {}
+    for key, value in options.items():
+        if isinstance(value, Enum):
+            value = value.value
+        query[key] = [str(value)]
+    return query
+
+def make_clock(options, progress_callback=None, budget=None):
+    return AutoWallClock(dial_style=options["dial_style"],
+                         dial_seconds_style=options["dial_seconds_style"],
+                         has_dial=options["has_dial"],
+                         gear_style=options["gear_style"],
+                         hand_style=options["hand_style"],
+                         hand_has_outline=options["hand_has_outline"],
+                         pendulum_period_s=options["pendulum_period_s"],
+                         escapement_style=options["escapement_style"],
+                         days=options["days"],
+                         centred_second_hand=options["centred_second_hand"],
+                         progress_callback=progress_callback,
+                         budget=budget,
+                         fidelity=options["fidelity"])
+
+def make_dial(options, progress_callback=None, budget=None):
+    return DialWithHands(style=options["dial_style"],
+                         hand_style=options["hand_style"],
+                         hand_has_outline=options["hand_has_outline"],
+                         centred_second_hand=options["centred_second_hand"],
+                         progress_callback=progress_callback,
+                         budget=budget,
+                         fidelity=options["fidelity"])
+
+def is_degraded(thing):
+    return isinstance(thing, AutoWallClock) and thing.is_degraded()
+
+class SVGCache:
+    '''
+    Generated SVGs are kept on disk in CACHE_DIR (as they always have been) and also held in memory once read or generated, so popular
+    configurations are served without touching the disk.
+
+    At most max_bytes of SVGs are held in memory, the least recently used are dropped first (they're still on disk).
+
+    Also keeps count of how often each configuration is requested so the warm-up can pre-generate the most popular ones after a restart.
+    The counts are saved at most once every save_interval_s.
+    '''
+    def __init__(self, cache_dir=CACHE_DIR, counts_file=REQUEST_COUNTS_FILE, max_bytes=200*1024*1024, save_interval_s=30):
+        self.cache_dir = cache_dir
+        self.counts_file = counts_file
+        self.max_bytes = max_bytes
+        self.save_interval_s = save_interval_s
+        #name: svg, most recently used last
+        self.svgs = OrderedDict()
+        self.svg_bytes = 0
+        self.save_timer = None
+        self.lock = threading.Lock()
+        #so two requests (or a request and the warm-up) for the same clock don't both generate it. A fixed set shared out by hash of the name,
+        #rather than one per name ever requested
+        self.generating_locks = [threading.Lock() for i in range(64)]
+        self.request_counts = {}
+        if os.path.exists(self.counts_file):
             try:
-                clean_options["gear_style"] = GearStyle(gear_string)
-            except:
-                print("gear style not recognised")
+                with open(self.counts_file, "r") as file:
+                    self.request_counts = json.load(file)
+            except (OSError, ValueError) as e:
+                print("Failed to read request counts: {}".format(e))
+
+    def record_request(self, kind, options):
+        query = options_to_query(options)
+        key = kind + "?" + urllib.parse.urlencode(sorted([(k, v[0]) for k, v in query.items()]))
+        with self.lock:
+            if key not in self.request_counts:
+                self.request_counts[key] = {"kind": kind, "options": query, "count": 0}
+            self.request_counts[key]["count"] += 1
+            if self.save_timer is None:
+                #batch up all the requests in the next save_interval_s into one write
+                self.save_timer = threading.Timer(self.save_interval_s, self.save_request_counts)
+                self.save_timer.daemon = True
+                self.save_timer.start()
+
+    def save_request_counts(self):
+        with self.lock:
+            self.save_timer = None
+            counts_json = json.dumps(self.request_counts)
+        try:
+            with open(self.counts_file, "w") as file:
+                file.write(counts_json)
+        except OSError as e:
+            print("Failed to save request counts: {}".format(e))
+
+    def remember_svg(self, name, svg_binary):
+        '''
+        must hold self.lock
+        '''
+        if name in self.svgs:
+            self.svg_bytes -= len(self.svgs.pop(name))
+        self.svgs[name] = svg_binary
+        self.svg_bytes += len(svg_binary)
+        while self.svg_bytes > self.max_bytes and len(self.svgs) > 1:
+            _, old_svg = self.svgs.popitem(last=False)
+            self.svg_bytes -= len(old_svg)
+
+    def get_most_requested(self, n):
+        '''
+        returns list of (kind, full options) for the n most requested configurations
+        '''
+        with self.lock:
+            counts = sorted(self.request_counts.values(), key=lambda c: c["count"], reverse=True)
+        return [(count["kind"], get_full_options(sanitise_options(count["options"]))) for count in counts[:n]]
 
-        if "hand_style" in options:
+    def get_svg(self, thing):
+        '''
+        thing is an AutoWallClock or a DialWithHands (anything with a name and output_svg)
+        '''
+        with self.lock:
+            if thing.name in self.svgs:
+                self.svgs.move_to_end(thing.name)
+                return self.svgs[thing.name]
+        generating_lock = self.generating_locks[hash(thing.name) % len(self.generating_locks)]
+
+        with generating_lock:
+            with self.lock:
+                if thing.name in self.svgs:
+                    #generated by someone else while we waited
+                    return self.svgs[thing.name]
+            cache_file = os.path.join(self.cache_dir, thing.name + ".svg")
+            if os.path.exists(cache_file):
+                print("{} exists in cache".format(cache_file))
+                with open(cache_file, "rb") as file:
+                    svg_binary = file.read()
+            else:
+                print("Generating SVG")
+                svg_binary = thing.output_svg(self.cache_dir).encode()
+            if is_degraded(thing):
+                #ran out of time, don't remember the simplified version so the next request tries again for the full clock
+                return svg_binary
+            with self.lock:
+                self.remember_svg(thing.name, svg_binary)
+        return svg_binary
+
+    def get_memory_bytes(self):
+        with self.lock:
+            return self.svg_bytes
+
+    def generate_in_background(self, thing):
+        '''
+        start generating thing (if it's not already cached) without waiting, used to produce the full clock after a draft has been served
+        '''
+        with self.lock:
+            if thing.name in self.svgs:
+                return
+        def generate():
             try:
-                clean_options["hand_style"] = HandStyle(options["hand_style"][0])
-            except:
-                print("hand style not recognised")
-
-        if "hand_has_outline" in options:
-            clean_options["hand_has_outline"] = options["hand_has_outline"][0].lower() == "true"
-
-        if "escapement_style" in options:
+                self.get_svg(thing)
+            except Exception as e:
+                print("Failed to generate {} in background: {}".format(thing.name, e))
+        threading.Thread(target=generate, daemon=True).start()
+
+class WarmUp:
+    '''
+    Pre-generate the default and most requested configurations in the background after startup so a restarted server is quick for
+    the configurations people actually ask for
+    '''
+    def __init__(self, cache, n=10):
+        self.cache = cache
+        self.n = n
+        self.jobs = [("clock", DEFAULT_OPTIONS.copy()), ("dial", DEFAULT_OPTIONS.copy())]
+        for job in cache.get_most_requested(n):
+            if job not in self.jobs:
+                self.jobs.append(job)
+        self.done = 0
+        self.failed = 0
+        self.started = None
+        self.finished = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.started = time.time()
+        self.thread.start()
+
+    def is_ready(self):
+        return self.finished is not None
+
+    def run(self):
+        for kind, options in self.jobs:
+            thing = make_clock(options) if kind == "clock" else make_dial(options)
+            print("Warming {} ({}/{})".format(thing.name, self.done + self.failed + 1, len(self.jobs)))
             try:
-                clean_options["escapement_style"] = AnchorStyle(options["escapement_style"][0])
-            except:
-                print("escapement style not recognised")
-
-        if "days" in options:
-            clean_options["days"] = int(options["days"][0])
-
-        if "centred_second_hand" in options:
-            clean_options["centred_second_hand"] = options["centred_second_hand"][0].lower() == "true"
-
-        if "width" in options:
-            clean_options["width"] = int(options["width"][0])
-            if clean_options["width"] < 100:
-                clean_options["width"] = 100
-            if clean_options["width"] > 2000:
-                clean_options["width"] = 2000
+                self.cache.get_svg(thing)
+                self.done += 1
+            except Exception as e:
+                #don't let one broken configuration stop the rest warming up
+                print("Failed to warm {}: {}".format(thing.name, e))
+                self.failed += 1
+        self.finished = time.time()
+        print("Warm up complete: {} generated, {} failed in {:.1f}s".format(self.done, self.failed, self.finished - self.started))
+
+class GenerationJob:
+    '''
+    A clock or dial being generated in the background for the json api. Progress reported by the clock is recorded as a list of events
+    which can be streamed to the client with server-sent events.
+
+    Cancelling is cooperative: the next time the clock reports progress, GenerationCancelled is raised and generation stops.
+    If the time budget runs out a simplified clock is produced instead and the job's "degraded" is set
+    '''
+    #how long to keep finished jobs around for clients to fetch the result
+    EXPIRE_S = 60*60
+
+    def __init__(self, kind, options, time_budget_s=None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.options = options
+        #"queued", "running", "done", "failed", "cancelled"
+        self.state = "queued"
+        self.events = []
+        self.result = None
+        self.error = None
+        self.degraded = False
+        self.time_budget_s = time_budget_s
+        self.budget = None
+        self.cancelled = False
+        self.created = time.time()
+        self.finished = None
+        self.condition = threading.Condition()
+
+    def is_finished(self):
+        return self.state in ["done", "failed", "cancelled"]
+
+    def add_event(self, event_type, data):
+        with self.condition:
+            data["job_id"] = self.id
+            data["time"] = time.time() - self.created
+            self.events.append((event_type, data))
+            self.condition.notify_all()
+
+    def progress(self, stage, fraction=0):
+        #the train search reports very often, only pass on whole percentage changes
+        with self.condition:
+            if len(self.events) > 0:
+                last_type, last_data = self.events[-1]
+                if last_type == "progress" and last_data["stage"] == stage and int(last_data["fraction"]*100) == int(fraction*100):
+                    return
+            self.add_event("progress", {"stage": stage, "fraction": fraction})
+
+    def cancel(self):
+        self.cancelled = True
+        if self.budget is not None:
+            self.budget.cancel()
+
+    def start(self, executor):
+        '''
+        queue the job on executor, it stays "queued" until one of the executor's workers is free
+        '''
+        executor.submit(self.run)
+
+    def run(self):
+        if self.cancelled:
+            #cancelled while still queued, don't bother starting
+            self.state = "cancelled"
+            self.finished = time.time()
+            self.add_event("state", {"state": self.state, "error": self.error, "degraded": self.degraded})
+            return
+        #budget timer starts when the job actually starts running
+        self.budget = GenerationBudget(self.time_budget_s)
+        self.state = "running"
+        self.add_event("state", {"state": self.state})
+        try:
+            if self.kind == "clock":
+                thing = make_clock(self.options, progress_callback=self.progress, budget=self.budget)
+            else:
+                thing = make_dial(self.options, progress_callback=self.progress, budget=self.budget)
+            svg_cache.record_request(self.kind, get_full_fidelity_options(self.options))
+            self.result = svg_cache.get_svg(thing)
+            self.degraded = is_degraded(thing)
+            self.state = "done"
+        except GenerationCancelled:
+            print("Job {} cancelled".format(self.id))
+            self.state = "cancelled"
+        except Exception as e:
+            print("Job {} failed: {}".format(self.id, e))
+            self.error = str(e)
+            self.state = "failed"
+        self.finished = time.time()
+        self.add_event("state", {"state": self.state, "error": self.error, "degraded": self.degraded})
+
+    def get_status(self):
+        last_progress = None
+        with self.condition:
+            for event_type, data in reversed(self.events):
+                if event_type == "progress":
+                    last_progress = data
+                    break
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "state": self.state,
+            "error": self.error,
+            "degraded": self.degraded,
+            "progress": last_progress,
+            "events_url": "/jobs/{}/events".format(self.id),
+            "result_url": "/jobs/{}/result".format(self.id),
+        }
+
+def get_process_memory_bytes():
+    '''
+    current resident memory, only available on linux
+    '''
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def get_process_peak_memory_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    #ru_maxrss is in bytes on mac and kilobytes on linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+svg_cache = None
+warm_up = None
+#time limit for json api jobs which don't specify their own
+default_time_budget_s = None
+jobs = {}
+jobs_lock = threading.Lock()
+#json api jobs are run by a fixed number of workers so lots of POSTs can't start lots of generations at once
+job_executor = None
+#beyond this many unfinished jobs new ones are refused rather than queued
+MAX_UNFINISHED_JOBS = 50
+
+def expire_jobs():
+    with jobs_lock:
+        for job_id in list(jobs.keys()):
+            job = jobs[job_id]
+            if job.is_finished() and time.time() - job.finished > GenerationJob.EXPIRE_S:
+                del jobs[job_id]
 
-        return clean_options
+class AutoclockHTTPHandler(BaseHTTPRequestHandler):
 
     def svg_dial(self, clean_options):
 
-
-
-        dial = DialWithHands(style=clean_options["dial_style"],
-                             hand_style=clean_options["hand_style"],
-                             hand_has_outline=clean_options["hand_has_outline"],
-                             centred_second_hand=clean_options["centred_second_hand"]
-                             )
-
-        cache_file = os.path.join("autoclock", dial.name + ".svg")
-        svg_binary = None
-        if os.path.exists(cache_file):
-            print("{} exists in cache".format(cache_file))
-            with open(cache_file, "rb") as file:
-                svg_binary = file.read()
-        else:
-            print("Generating SVG")
-            svg_binary = dial.output_svg("autoclock").encode()
-        self.wfile.write(svg_binary)
+        dial = make_dial(clean_options, budget=GenerationBudget(default_time_budget_s))
+        svg_cache.record_request("dial", get_full_fidelity_options(clean_options))
+        self.wfile.write(svg_cache.get_svg(dial))
+        if dial.fidelity == FIDELITY_DRAFT:
+            #the full version will probably be asked for next
+            svg_cache.generate_in_background(dial.get_full_fidelity())
         print("Finished get request")
 
     def svg_clock(self, clean_options):
@@ -102,40 +485,175 @@ class AutoclockHTTPHandler(BaseHTTPRequestHandler):
         #     clean_options[option] = options[option][0]
         # print(clean_options)
 
-        
-
-        clock = AutoWallClock(dial_style=clean_options["dial_style"],
-                              dial_seconds_style=clean_options["dial_seconds_style"],
-                              has_dial=clean_options["has_dial"],
-                              gear_style=clean_options["gear_style"],
-                              hand_style=clean_options["hand_style"],
-                              hand_has_outline=clean_options["hand_has_outline"],
-                              pendulum_period_s=clean_options["pendulum_period_s"],
-                              escapement_style=clean_options["escapement_style"],
-                              days=clean_options["days"],
-                              centred_second_hand=clean_options["centred_second_hand"])
-
-        cache_file = os.path.join("autoclock", clock.name + ".svg")
-        svg_binary = None
-        if os.path.exists(cache_file):
-            print("{} exists in cache".format(cache_file))
-            with open(cache_file, "rb") as file:
-                svg_binary = file.read()
-        else:
-            print("Generating SVG")
-            svg_binary = clock.output_svg("autoclock").encode()
-        self.wfile.write(svg_binary)
+        clock = make_clock(clean_options, budget=GenerationBudget(default_time_budget_s))
+        svg_cache.record_request("clock", get_full_fidelity_options(clean_options))
+        self.wfile.write(svg_cache.get_svg(clock))
+        if clock.fidelity == FIDELITY_DRAFT:
+            #the full version will probably be asked for next
+            svg_cache.generate_in_background(clock.get_full_fidelity())
         print("Finished get request")
 
-    def do_GET(self):
+    def send_json(self, data, code=200):
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(data).encode())
+
+    def get_job(self, job_id):
+        with jobs_lock:
+            job = jobs.get(job_id, None)
+        if job is None:
+            self.send_json({"error": "unknown job {}".format(job_id)}, code=404)
+        return job
+
+    def job_events(self, job):
         '''
-        THIS IS NOT (very) SAFE
+        stream the job's events as server-sent events until it finishes (or the client goes away)
         '''
         self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        sent = 0
+        try:
+            while True:
+                with job.condition:
+                    while sent >= len(job.events) and not job.is_finished():
+                        job.condition.wait(timeout=15)
+                        if sent >= len(job.events) and not job.is_finished():
+                            #keep the connection alive
+                            self.wfile.write(b": keepalive\n\n")
+                            self.wfile.flush()
+                    new_events = job.events[sent:]
+                    sent = len(job.events)
+                for event_type, data in new_events:
+                    self.wfile.write("event: {}\ndata: {}\n\n".format(event_type, json.dumps(data)).encode())
+                self.wfile.flush()
+                if job.is_finished() and sent >= len(job.events):
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            print("Client stopped listening to job {}".format(job.id))
+
+    def job_result(self, job):
+        if job.state != "done":
+            self.send_json(job.get_status(), code=409)
+            return
+        self.send_response(200)
         self.send_header("Content-Type", "image/svg+xml")
         self.end_headers()
+        self.wfile.write(job.result)
+
+    def jobs_get(self, path_parts):
+        '''
+        /jobs/<id>, /jobs/<id>/events or /jobs/<id>/result
+        '''
+        if len(path_parts) < 2:
+            with jobs_lock:
+                self.send_json([job.get_status() for job in jobs.values()])
+            return
+        job = self.get_job(path_parts[1])
+        if job is None:
+            return
+        if len(path_parts) == 2:
+            self.send_json(job.get_status())
+        elif path_parts[2] == "events":
+            self.job_events(job)
+        elif path_parts[2] == "result":
+            self.job_result(job)
+        else:
+            self.send_json({"error": "not found"}, code=404)
+
+    def do_POST(self):
+        '''
+        POST /jobs with a json body of options (same names as the /generate_clock query string, plus "kind": "clock" or "dial")
+        returns the job id and where to get the progress events and result
+        '''
+        parsed_path = urllib.parse.urlparse(self.path)
+        if parsed_path.path.rstrip("/") != "/jobs":
+            self.send_json({"error": "not found"}, code=404)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length).decode()) if length > 0 else {}
+            if not isinstance(body, dict):
+                raise ValueError("expected a json object")
+        except ValueError as e:
+            self.send_json({"error": "invalid json: {}".format(e)}, code=400)
+            return
+
+        kind = body.pop("kind", "clock")
+        time_budget_s = body.pop("time_budget_s", default_time_budget_s)
+        try:
+            time_budget_s = float(time_budget_s) if time_budget_s is not None else None
+        except (TypeError, ValueError):
+            self.send_json({"error": "time_budget_s must be a number"}, code=400)
+            return
+        if kind not in ["clock", "dial"]:
+            self.send_json({"error": "kind must be clock or dial"}, code=400)
+            return
+        #put into the same form as parse_qs so it can be sanitised the same way as the old GET api
+        options = {key: value if isinstance(value, list) else [str(value)] for key, value in body.items()}
+        job = GenerationJob(kind, get_full_options(sanitise_options(options)), time_budget_s=time_budget_s)
+        expire_jobs()
+        with jobs_lock:
+            if len([other for other in jobs.values() if not other.is_finished()]) >= MAX_UNFINISHED_JOBS:
+                self.send_json({"error": "too many jobs queued, try again later"}, code=503)
+                return
+            jobs[job.id] = job
+        job.start(job_executor)
+        self.send_json(job.get_status(), code=202)
+
+    def do_DELETE(self):
+        '''
+        DELETE /jobs/<id> to cancel a job
+        '''
+        path_parts = [part for part in urllib.parse.urlparse(self.path).path.split("/") if len(part) > 0]
+        if len(path_parts) != 2 or path_parts[0] != "jobs":
+            self.send_json({"error": "not found"}, code=404)
+            return
+        job = self.get_job(path_parts[1])
+        if job is None:
+            return
+        job.cancel()
+        self.send_json(job.get_status())
+
+    def status(self):
+        '''
+        report if the warm up has finished and how much memory we're using
+        '''
+        status = {
+            "ready": warm_up is None or warm_up.is_ready(),
+            "warm_up_total": len(warm_up.jobs) if warm_up is not None else 0,
+            "warm_up_done": warm_up.done if warm_up is not None else 0,
+            "warm_up_failed": warm_up.failed if warm_up is not None else 0,
+            "cached_svgs": len(svg_cache.svgs),
+            "jobs_running": len([job for job in list(jobs.values()) if job.state == "running"]),
+            "jobs_queued": len([job for job in list(jobs.values()) if job.state == "queued"]),
+            "cached_svg_bytes": svg_cache.get_memory_bytes(),
+            "process_rss_bytes": get_process_memory_bytes(),
+            "process_peak_rss_bytes": get_process_peak_memory_bytes(),
+        }
+        self.send_json(status)
+
+    def do_GET(self):
+        '''
+        THIS IS NOT (very) SAFE
+        '''
         print("Get request: {}".format(self.path) )
         parsed_path = urllib.parse.urlparse(self.path)
+
+        if parsed_path.path.startswith("/status"):
+            self.status()
+            return
+
+        path_parts = [part for part in parsed_path.path.split("/") if len(part) > 0]
+        if len(path_parts) > 0 and path_parts[0] == "jobs":
+            self.jobs_get(path_parts)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "image/svg+xml")
+        self.end_headers()
         path_list = os.path.split(parsed_path.path)
         print("path_list", path_list)
 
@@ -147,26 +665,12 @@ class AutoclockHTTPHandler(BaseHTTPRequestHandler):
 
                 options = urllib.parse.parse_qs(parsed_path.query)
                 print(options)
-                clean_options = self.sanitise_options(options)
-
-                default_options = {
-                    "pendulum_period_s": 2,
-                    "has_dial": True,
-                    "dial_style": DialStyle.LINES_ARC,
-                    "dial_seconds_style": DialStyle.CONCENTRIC_CIRCLES,
-                    "gear_style": GearStyle.CURVES,
-                    "hand_style": HandStyle.SIMPLE_ROUND,
-                    "hand_has_outline": True,
-                    "escapement_style": AnchorStyle.CURVED_MATCHING_WHEEL,
-                    "days": 8,
-                    "centred_second_hand": True,
-                    "width": 300,
-                }
-
-                default_options.update(clean_options)
+                clean_options = sanitise_options(options)
+
+                default_options = get_full_options(clean_options)
                 print(default_options)
-                
-                
+
+
                 if len(path_list) == 1 or path_list[1].endswith("clock") or len(path_list[1]) == 0:
                     print("Request for autoclock")
                     self.svg_clock(default_options)
@@ -174,10 +678,31 @@ class AutoclockHTTPHandler(BaseHTTPRequestHandler):
                     print("Request for dial")
                     self.svg_dial(default_options)
 
+class ThreadingAutoclockHTTPServer(ThreadingMixIn, HTTPServer):
+    #so /status (and cached SVGs) can be served while the warm up or another request is generating
+    daemon_threads = True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Autoclock SVG server")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--warm", type=int, default=0, help="After startup pre-generate the defaults and this many of the most requested configurations")
+    parser.add_argument("--time-budget", type=float, default=None, help="Seconds to spend generating a clock before falling back to a simplified preview")
+    parser.add_argument("--cache-mb", type=float, default=200, help="Most SVGs to hold in memory, in megabytes. Older ones are read back from disk when needed")
+    parser.add_argument("--job-workers", type=int, default=2, help="How many json api jobs can be generating at once, the rest wait in a queue")
+    args = parser.parse_args()
 
+    default_time_budget_s = args.time_budget
+    job_executor = ThreadPoolExecutor(max_workers=args.job_workers)
 
-httpd = HTTPServer(('0.0.0.0', 8000), AutoclockHTTPHandler)
+    svg_cache = SVGCache(max_bytes=int(args.cache_mb*1024*1024))
 
+    if args.warm > 0:
+        warm_up = WarmUp(svg_cache, n=args.warm)
+        warm_up.start()
 
+    httpd = ThreadingAutoclockHTTPServer(('0.0.0.0', args.port), AutoclockHTTPHandler)
 
-httpd.serve_forever()
\ No newline at end of file
+    try:
+        httpd.serve_forever()
+    finally:
+        svg_cache.save_request_counts()
@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 
 import cadquery as cq
 from cadquery import exporters
@@ -790,6 +791,36 @@ Thread an M{hand_metric_size} dome nut on top and use two spanners to lock this
 
         return rod_lengths, rod_zs, beyond_back_of_arbors
 
+    def validate(self):
+        '''
+        plates.validate() plus checks on the arbor rod lengths.
+
+        Note that creating the Assembly already builds a few models (winding key, ratchet, pillar rods) so for the quickest check call validate() on the plates
+        before creating the Assembly
+        '''
+        result = self.plates.validate()
+
+        start = time.time()
+        rod_lengths, rod_zs, beyond_back_of_arbors = self.get_arbor_rod_lengths()
+        inside_front_plate_z = self.plates.get_plate_thick(back=True) + self.plates.plate_distance
+        for i, rod_length in enumerate(rod_lengths):
+            if rod_length < 0:
+                #no rod (eg spring barrel)
+                continue
+            arbor_for_plate = self.plates.arbors_for_plate[i]
+            front_bearing = arbor_for_plate.get_bearing(front=True)
+            if front_bearing is None or (arbor_for_plate.arbor.type == ArborType.ANCHOR and self.plates.escapement_on_back):
+                continue
+            #assumes the bearing is on the inside of the front plate, which is the shortest the rod can be
+            if rod_zs[i] + rod_length < inside_front_plate_z + front_bearing.height:
+                result["problems"].append("Arbor {} rod ({:.1f}mm) does not reach the front bearing".format(i, rod_length))
+        result["info"]["arbor_rod_lengths"] = rod_lengths
+        result["info"]["arbor_rod_zs"] = rod_zs
+        result["timings"]["arbor_rods"] = time.time() - start
+
+        result["valid"] = len(result["problems"]) == 0
+        return result
+
     def get_pendulum_rod_lengths(self):
         '''
         Calculate lengths of threaded rod needed to make the pendulum
@@ -833,14 +864,22 @@ Thread an M{hand_metric_size} dome nut on top and use two spanners to lock this
 
         return rod_infos
 
-    def get_clock(self, with_rods=False, with_key=False, with_pendulum=False, moon_angle_deg=90):
+    def get_clock(self, with_rods=False, with_key=False, with_pendulum=False, moon_angle_deg=90, progress_callback=None):
         '''
         Probably fairly intimately tied in with the specific clock plates, which is fine while there's only one used in anger
+
+        progress_callback: optional function(stage, fraction) called between building each major part. It may raise an exception to abort
+        generating the clock (used by the autoclock to cancel or limit the time spent)
         '''
 
-        clock = self.plates.get_assembled()
+        def report_progress(stage, fraction=0):
+            if progress_callback is not None:
+                progress_callback(stage, fraction)
+
+        clock = self.plates.get_assembled(progress_callback=progress_callback)
 
         for a,arbor in enumerate(self.plates.arbors_for_plate):
+            report_progress("arbors", a / len(self.plates.arbors_for_plate))
             clock = clock.add(arbor.get_assembled())
 
 
@@ -850,6 +889,7 @@ Thread an M{hand_metric_size} dome nut on top and use two spanners to lock this
 
 
 
+        report_progress("motion_works")
         motion_works_model = self.motion_works.get_assembled(motion_works_relative_pos=self.plates.motion_works_relative_pos, minute_angle=self.minuteAngle, time_setter_relative_pos=self.plates.time_setter_relative_pos)
 
         clock = clock.add(motion_works_model.translate((self.plates.hands_position[0], self.plates.hands_position[1], self.motion_works_z)))
@@ -869,6 +909,7 @@ Thread an M{hand_metric_size} dome nut on top and use two spanners to lock this
 
 
         if self.dial is not None:
+            report_progress("dial")
             dial = self.dial.get_assembled()#get_dial().rotate((0,0,0),(0,1,0),180)
             clock = clock.add(dial.translate(self.dial_pos))
             if self.dial.has_eyes():
@@ -876,6 +917,7 @@ Thread an M{hand_metric_size} dome nut on top and use two spanners to lock this
 
 
         #hands on the motion work, showing the time
+        report_progress("hands")
         hands = self.hands.get_assembled(time_minute = time_min, time_hour=time_hour, include_seconds=False, gap_size =self.motion_works.hour_hand_slot_height - self.hands.thick)
 
 
@@ -30,7 +30,13 @@ from .cosmetics import *
 from .dial import *
 from .assembly import *
 from.gear_trains import *
-from .cq_svg import exportSVG
+from .cq_svg import exportSVG, drawFlatShapes
+from .draft import DraftSVG, draw_gear, draw_dial, draw_hands, get_escape_wheel_polygon, get_dial_layer_colour, get_hand_layer_colour
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from enum import Enum
+import hashlib
+import json
+import time
 import os
 
 try:
@@ -45,13 +51,38 @@ Tools for a configurable clock, destined to be driven by a web GUI
 DEFAULT_SVG_EXPORT_OPTIONS = {"width": 300, "height": 300, "showAxes": False, "strokeWidth": 0.5,
             "showHidden": False}
 
-def gen_gear_previews(out_path="autoclock", module=1):
+GEAR_PREVIEW_TRAIN_FILE = "gear_preview_train.json"
+
+def get_gear_preview_train():
     #lots copy pasted from gearDemo
-    train = GoingTrain(pendulum_period=2, fourth_wheel=False, max_weight_drop=1200, use_pulley=True, chain_at_back=False, powered_wheels=1, runtime_hours=7.5 * 24)
+    return GoingTrain(pendulum_period=2, fourth_wheel=False, max_weight_drop=1200, use_pulley=True, chain_at_back=False, powered_wheels=1, runtime_hours=7.5 * 24)
+
+def gen_gear_preview_train(out_path="autoclock"):
+    '''
+    Calculating the train for the gear previews is the slow bit, so it's done once (as a job the gear previews depend on) and saved for them to load
+    '''
+    train = get_gear_preview_train()
+    train.calculate_ratios(max_wheel_teeth=130, min_pinion_teeth=9, wheel_min_teeth=60, pinion_max_teeth=15, max_error=0.1, module_reduction=0.9)
+    with open(os.path.join(out_path, GEAR_PREVIEW_TRAIN_FILE), "w") as file:
+        json.dump(train.trains[0]["train"], file)
+
+def get_gear_preview_arbors(module=1, out_path=None):
+    '''
+    The going train and motion works used to demo the gear styles. Calculating the train is slow, so this is cached (per process) and shared
+    between all the gear style previews. If gen_gear_preview_train has already saved the train in out_path, that is used instead of calculating it again.
+    '''
+    if module in _gear_preview_arbors_cache:
+        return _gear_preview_arbors_cache[module]
+    train = get_gear_preview_train()
 
     moduleReduction = 0.9
 
-    train.calculate_ratios(max_wheel_teeth=130, min_pinion_teeth=9, wheel_min_teeth=60, pinion_max_teeth=15, max_error=0.1, module_reduction=moduleReduction)
+    train_file = None if out_path is None else os.path.join(out_path, GEAR_PREVIEW_TRAIN_FILE)
+    if train_file is not None and os.path.exists(train_file):
+        with open(train_file, "r") as file:
+            train.set_ratios(json.load(file))
+    else:
+        train.calculate_ratios(max_wheel_teeth=130, min_pinion_teeth=9, wheel_min_teeth=60, pinion_max_teeth=15, max_error=0.1, module_reduction=moduleReduction)
     # train.setChainWheelRatio([93, 10])
 
     train.gen_cord_wheels(ratchet_thick=4, rod_metric_thread=4, cord_thick=1.5, cord_coil_thick=14, style=None, use_key=True, prefered_diameter=25)
@@ -67,42 +98,67 @@ def gen_gear_previews(out_path="autoclock", module=1):
     # get a chain wheel, a normal wheel, an escape wheel and part of the motion works for a good spread of sizes and inner radii
     demoArbours = [train.get_arbor_with_conventional_naming(i) for i in demoArboursNums]
     demoArbours.append(motionWorks.get_minute_arbor())
+
+    _gear_preview_arbors_cache[module] = demoArbours
+    return demoArbours
+
+_gear_preview_arbors_cache = {}
+
+def gen_gear_preview(gear_style, out_path="autoclock", module=1):
+    demoArbours = get_gear_preview_arbors(module, out_path=out_path)
     gap = 5
 
+    demo_file_name = "gear_demo_{}.svg".format( gear_style.value)
+    preview_file_name = "gear_preview_{}.svg".format(gear_style.value)
+    preview_3d_file_name = "gear_preview_{}.tjs".format(gear_style.value)
+
+    # demo = getGearDemo(justStyle=gear_style)
+    demo = cq.Workplane("XY")
+    y = 0
+    for arbour in demoArbours:
+        arbour.style = gear_style
+        y += arbour.get_max_radius() + gap
+        demo = demo.add(arbour.get_shape().translate((0, y, 0)))
+        y += arbour.get_max_radius()
+
+    print("Exporting gear demo for {}".format(gear_style.value))
+    # exporters.export(demo, os.path.join(out_path,demo_file_name),  opt={"width":480,"height":1024, "showAxes":False, "strokeWidth":0.2, "showHidden":False,"marginLeft": 480*0.125, "marginTop": 1024*0.125,})
+    exportSVG(demo, os.path.join(out_path,demo_file_name),  opts={"width":500,"height":500, "showAxes":False, "strokeWidth":0.5, "showHidden":False})
+
+    preview = demoArbours[1].get_shape()#getGearDemo(justStyle=gear_style, oneGear=True)
+    exportSVG(preview, os.path.join(out_path,preview_file_name),  opts={"width":150,"height":150, "showAxes":False, "strokeWidth":0.5,
+                                                                              "showHidden":False, "projectionDir": (0, 0, 1)})
+    cq.exporters.export(preview,os.path.join(out_path, preview_3d_file_name))
+
+def get_gear_preview_jobs(out_path="autoclock", module=1):
+    train_job = PreviewJob("gears", gen_gear_preview_train, {}, out_path, [GEAR_PREVIEW_TRAIN_FILE])
+    return [train_job] + [PreviewJob("gears", gen_gear_preview, {"gear_style": gear_style, "module": module}, out_path,
+                       ["gear_demo_{}.svg".format(gear_style.value), "gear_preview_{}.svg".format(gear_style.value), "gear_preview_{}.tjs".format(gear_style.value)],
+                       depends_on=[train_job.name])
+            for gear_style in GearStyle]
+
+def gen_gear_previews(out_path="autoclock", module=1):
     for gear_style in GearStyle:
-        demo_file_name = "gear_demo_{}.svg".format( gear_style.value)
-        preview_file_name = "gear_preview_{}.svg".format(gear_style.value)
-        preview_3d_file_name = "gear_preview_{}.tjs".format(gear_style.value)
-
-        # demo = getGearDemo(justStyle=gear_style)
-        demo = cq.Workplane("XY")
-        y = 0
-        for arbour in demoArbours:
-            arbour.style = gear_style
-            y += arbour.get_max_radius() + gap
-            demo = demo.add(arbour.get_shape().translate((0, y, 0)))
-            y += arbour.get_max_radius()
-
-        print("Exporting gear demo for {}".format(gear_style.value))
-        # exporters.export(demo, os.path.join(out_path,demo_file_name),  opt={"width":480,"height":1024, "showAxes":False, "strokeWidth":0.2, "showHidden":False,"marginLeft": 480*0.125, "marginTop": 1024*0.125,})
-        exportSVG(demo, os.path.join(out_path,demo_file_name),  opts={"width":500,"height":500, "showAxes":False, "strokeWidth":0.5, "showHidden":False})
-
-        preview = demoArbours[1].get_shape()#getGearDemo(justStyle=gear_style, oneGear=True)
-        exportSVG(preview, os.path.join(out_path,preview_file_name),  opts={"width":150,"height":150, "showAxes":False, "strokeWidth":0.5,
-                                                                                  "showHidden":False, "projectionDir": (0, 0, 1)})
-        cq.exporters.export(preview,os.path.join(out_path, preview_3d_file_name))
+        gen_gear_preview(gear_style, out_path=out_path, module=module)
+
+def gen_anchor_preview(style, out_path="autoclock", two_d = True):
+    file_name = "anchor_preview_{}.svg".format(style.value)
+    print("Exporting Anchor {}".format(style.value))
+    demo = getAnchorDemo(style)
+    opts = {"width": 300, "height": 300, "showAxes": False, "strokeWidth": 0.5,
+            "showHidden": False}
+    if two_d:
+        opts["projectionDir"]= (0, 0, 1)
+
+    exportSVG(demo, os.path.join(out_path, file_name), opts=opts)
+
+def get_anchor_preview_jobs(out_path="autoclock", two_d = True):
+    return [PreviewJob("anchors", gen_anchor_preview, {"style": style, "two_d": two_d}, out_path, ["anchor_preview_{}.svg".format(style.value)])
+            for style in AnchorStyle]
 
 def gen_anchor_previews(out_path="autoclock", two_d = True):
     for style in AnchorStyle:
-        file_name = "anchor_preview_{}.svg".format(style.value)
-        print("Exporting Anchor {}".format(style.value))
-        demo = getAnchorDemo(style)
-        opts = {"width": 300, "height": 300, "showAxes": False, "strokeWidth": 0.5,
-                "showHidden": False}
-        if two_d:
-            opts["projectionDir"]= (0, 0, 1)
-
-        exportSVG(demo, os.path.join(out_path, file_name), opts=opts)
+        gen_anchor_preview(style, out_path=out_path, two_d=two_d)
 
 def gen_grasshopper_previews(out_path="autoclock", two_d = True):
     file_name="grasshopper_preview.svg"
@@ -126,37 +182,218 @@ def gen_shape_preview(demo, name, out_path="autoclock", size=300):
 
     exportSVG(demo, os.path.join(out_path, file_name), opts=opts)
 
-def gen_hand_previews(out_path="autoclock", length=120, size=600, only_these=None):
+def get_flat_drawing(dial=None, hands=None, include_seconds=True):
+    '''
+    The real dial and hands, but drawn straight from their upwards facing faces in colour rather than projecting the 3D shapes, which is far quicker.
+    '''
+    layers = []
+    if dial is not None:
+        layers += [(get_dial_layer_colour(name), shape) for name, shape in dial.get_assembled_layers()]
+    if hands is not None:
+        layers += [(get_hand_layer_colour(colour), shape) for colour, shape in hands.get_assembled_layers(include_seconds=include_seconds)]
+    drawing = DraftSVG()
+    drawFlatShapes(drawing, layers)
+    return drawing
+
+def get_hand_preview_file_name(style, centred_seconds, outline):
+    outline_string = "_with_outline" if outline > 0 else ""
+    seconds_string = "_centred_seconds" if centred_seconds else ""
+    return "hands_{}{}{}.svg".format(style.value, outline_string, seconds_string)
+
+def gen_hand_preview(style, centred_seconds, outline, out_path="autoclock", length=120, size=600):
     motionWorks = MotionWorks(extra_height=30 + 30, style=GearStyle.ARCS, thick=2, compensate_loose_arbour=True)
 
+    outline_string="_with_outline" if outline > 0 else ""
+    seconds_string = "_centred_seconds" if centred_seconds else ""
+
+    print("Generating preview for {}{}{}".format(style.value, outline_string.replace("_"," "), seconds_string.replace("_", " ")))
+
+    hands = Hands(style=style, length=length, outline=outline, second_hand_centred=centred_seconds,
+                  thick=3, minute_fixing="square", minute_fixing_d1=motionWorks.get_minute_hand_square_size(),
+                  hourfixing_d=motionWorks.get_hour_hand_hole_d())
+    file_name = get_hand_preview_file_name(style, centred_seconds, outline)
+
+    get_flat_drawing(hands=hands).export(os.path.join(out_path, file_name), width=size, height=size)
+
+def get_hand_preview_jobs(out_path="autoclock", length=120, size=600, only_these=None):
+    jobs = []
     for style in HandStyle:
         if only_these is None or style in only_these:
             for centred_seconds in [True, False]:
                 for outline in [0, 1]:
+                    jobs.append(PreviewJob("hands", gen_hand_preview, {"style": style, "centred_seconds": centred_seconds, "outline": outline, "length": length, "size": size},
+                                           out_path, [get_hand_preview_file_name(style, centred_seconds, outline)]))
+    return jobs
 
-                    outline_string="_with_outline" if outline > 0 else ""
-                    seconds_string = "_centred_seconds" if centred_seconds else ""
-
-                    print("Generating preview for {}{}{}".format(style.value, outline_string.replace("_"," "), seconds_string.replace("_", " ")))
+def gen_hand_previews(out_path="autoclock", length=120, size=600, only_these=None):
+    for style in HandStyle:
+        if only_these is None or style in only_these:
+            for centred_seconds in [True, False]:
+                for outline in [0, 1]:
+                    gen_hand_preview(style, centred_seconds, outline, out_path=out_path, length=length, size=size)
 
-                    hands = Hands(style=style, length=length, outline=outline, second_hand_centred=centred_seconds,
-                                  thick=3, minute_fixing="square", minute_fixing_d1=motionWorks.get_minute_hand_square_size(),
-                                  hourfixing_d=motionWorks.get_hour_hand_hole_d())
-                    demo = hands.get_assembled()#include_seconds=centred_seconds
+def gen_dial_preview(style, out_path="autoclock", diameter=180, image_size=300):
+    dial = Dial(diameter, style=style)
 
-                    file_name = "hands_{}{}{}.svg".format(style.value,outline_string, seconds_string)
+    print("Generating preview for {} dial".format(style.value))
+    file_name = "dial_{}.svg".format(style.value)
+    get_flat_drawing(dial=dial).export(os.path.join(out_path, file_name), width=image_size, height=image_size)
 
-                    exportSVG(demo, os.path.join(out_path, file_name), opts={"width": size, "height": size, "showAxes": False, "strokeWidth": 0.5,
-                                                                               "showHidden": False, "projectionDir": (0, 0, 1)})
+def get_dial_preview_jobs(out_path="autoclock", diameter=180, image_size=300):
+    return [PreviewJob("dials", gen_dial_preview, {"style": style, "diameter": diameter, "image_size": image_size}, out_path, ["dial_{}.svg".format(style.value)])
+            for style in DialStyle]
 
 def gen_dial_previews(out_path="autoclock", diameter=180, image_size=300):
     for style in DialStyle:
-        dial = Dial(diameter, style=style)
+        gen_dial_preview(style, out_path=out_path, diameter=diameter, image_size=image_size)
+
+#bump to regenerate every preview after a change the code fingerprint can't see (eg upgrading cadquery)
+PREVIEW_VERSION = 1
+
+def get_code_fingerprint():
+    '''
+    hash of the source of the clocks package, so previews are regenerated when the code that makes them changes. Cached per process
+    '''
+    global _code_fingerprint
+    if _code_fingerprint is None:
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        sha = hashlib.sha1()
+        for file_name in sorted(os.listdir(package_dir)):
+            if file_name.endswith(".py"):
+                with open(os.path.join(package_dir, file_name), "rb") as file:
+                    sha.update(file_name.encode())
+                    sha.update(file.read())
+        _code_fingerprint = sha.hexdigest()
+    return _code_fingerprint
+
+_code_fingerprint = None
+
+class PreviewJob:
+    '''
+    One preview asset (possibly several files) to be generated by calling function(out_path=out_path, **kwargs)
+
+    function must be a module level function and kwargs picklable so the job can be run in another process.
+    depends_on is a list of the names of jobs which must have finished first.
+    '''
+    def __init__(self, asset_class, function, kwargs, out_path, out_files, depends_on=None):
+        self.asset_class = asset_class
+        self.function = function
+        self.kwargs = kwargs
+        self.out_path = out_path
+        self.out_files = out_files
+        self.depends_on = depends_on if depends_on is not None else []
+        self.name = "{}_{}".format(asset_class, "_".join([os.path.splitext(f)[0] for f in out_files]))
+
+    def get_hash(self):
+        '''
+        hash of everything that affects the output (but not where it's written), including the version of the code generating it
+        '''
+        kwarg_strings = ["{}={}".format(key, self.kwargs[key].value if isinstance(self.kwargs[key], Enum) else self.kwargs[key]) for key in sorted(self.kwargs.keys())]
+        return hashlib.sha1("{}({}) v{} {}".format(self.function.__name__, ",".join(kwarg_strings), PREVIEW_VERSION, get_code_fingerprint()).encode()).hexdigest()
+
+    def is_up_to_date(self, hashes):
+        for out_file in self.out_files:
+            if not os.path.exists(os.path.join(self.out_path, out_file)) or hashes.get(out_file, None) != self.get_hash():
+                return False
+        return True
+
+def run_preview_job(job):
+    '''
+    Executed in a worker process, returns (job name, time taken)
+    '''
+    start = time.time()
+    job.function(out_path=job.out_path, **job.kwargs)
+    return job.name, time.time() - start
+
+PREVIEW_HASHES_FILE = "preview_hashes.json"
+
+def run_preview_jobs(jobs, processes=None, force=False):
+    '''
+    Run a graph of PreviewJobs over a process pool. A job is only submitted once all the jobs it depends on have finished.
+
+    Jobs whose output files already exist and were generated from the same parameters (recorded in preview_hashes.json alongside the output) are skipped
+    unless force is True.
+
+    Prints a timing summary per asset class.
+    '''
+    jobs_by_name = {job.name: job for job in jobs}
+    hashes_by_path = {}
+    for out_path in set([job.out_path for job in jobs]):
+        hashes_file = os.path.join(out_path, PREVIEW_HASHES_FILE)
+        hashes_by_path[out_path] = {}
+        if os.path.exists(hashes_file):
+            with open(hashes_file, "r") as file:
+                hashes_by_path[out_path] = json.load(file)
+
+    #asset class: [jobs run, jobs skipped, total cpu seconds]
+    timings = {}
+    for job in jobs:
+        if job.asset_class not in timings:
+            timings[job.asset_class] = [0, 0, 0.0]
+
+    finished = set()
+    pending = []
+    for job in jobs:
+        if not force and job.is_up_to_date(hashes_by_path[job.out_path]):
+            print("Skipping {}, already up to date".format(job.name))
+            timings[job.asset_class][1] += 1
+            finished.add(job.name)
+        else:
+            pending.append(job)
+
+    for job in pending:
+        for dependency in job.depends_on:
+            if dependency not in jobs_by_name:
+                raise ValueError("Preview job {} depends on unknown job {}".format(job.name, dependency))
+
+    start = time.time()
+    failed = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        running = {}
+        while len(pending) > 0 or len(running) > 0:
+            ready = [job for job in pending if all([dependency in finished for dependency in job.depends_on])]
+            for job in ready:
+                pending.remove(job)
+                running[executor.submit(run_preview_job, job)] = job
+            if len(running) == 0:
+                #everything left depends on something that failed
+                failed.extend([job.name for job in pending])
+                break
+            done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                try:
+                    _, taken = future.result()
+                except Exception as e:
+                    print("Failed to generate {}: {}".format(job.name, e))
+                    failed.append(job.name)
+                    continue
+                finished.add(job.name)
+                timings[job.asset_class][0] += 1
+                timings[job.asset_class][2] += taken
+                for out_file in job.out_files:
+                    hashes_by_path[job.out_path][out_file] = job.get_hash()
+
+    for out_path in hashes_by_path:
+        with open(os.path.join(out_path, PREVIEW_HASHES_FILE), "w") as file:
+            json.dump(hashes_by_path[out_path], file, indent=2)
+
+    print("Preview generation took {:.1f}s".format(time.time() - start))
+    for asset_class in timings:
+        generated, skipped, taken = timings[asset_class]
+        print("{}: {} generated, {} skipped, {:.1f}s total{}".format(asset_class, generated, skipped, taken, ", {:.1f}s average".format(taken/generated) if generated > 0 else ""))
+    if len(failed) > 0:
+        print("Failed: {}".format(", ".join(failed)))
+
+    return failed
+
+def gen_all_previews(out_path="autoclock", processes=None, force=False):
+    '''
+    Generate all the gear, anchor, hand and dial previews in parallel
+    '''
+    jobs = get_gear_preview_jobs(out_path) + get_anchor_preview_jobs(out_path) + get_hand_preview_jobs(out_path) + get_dial_preview_jobs(out_path)
+    return run_preview_jobs(jobs, processes=processes, force=force)
 
-        print("Generating preview for {} dial".format(style.value))
-        file_name = "dial_{}.svg".format(style.value)
-        exportSVG(dial.get_dial(), os.path.join(out_path, file_name),opts={"width": image_size, "height": image_size, "showAxes": False, "strokeWidth": 0.5,
-                                                                           "showHidden": False, "projectionDir": (0, 0, -1)})
 def gen_motion_works_preview(out_path="autoclock", motion_works=None, image_size=300):
     if motion_works is None:
         motion_works = MotionWorks(compact=False)
@@ -225,9 +462,78 @@ THIS FILE IS AUTOGENERATED FROM PYTHON, DO NOT EDIT MANUALLY
         outfile.writelines("\n")
         outfile.writelines(enum_to_typescript(DialStyle))
 
+class GenerationCancelled(Exception):
+    pass
+
+class GenerationBudgetExhausted(GenerationCancelled):
+    pass
+
+class GenerationBudget:
+    '''
+    Cooperative cancellation and an optional time limit for generating a clock, so an abandoned request from the web GUI doesn't keep
+    a CPU busy for minutes.
+
+    Generation calls check() between stages (and often during the train search). If cancel() has been called this raises GenerationCancelled.
+    The first time check(can_degrade=True) is called after the time budget has run out it raises GenerationBudgetExhausted,
+    giving the caller a chance to switch to a simplified preview - after that only cancellation is raised.
+    '''
+    def __init__(self, time_budget_s=None):
+        self.time_budget_s = time_budget_s
+        self.started = time.time()
+        self.cancelled = False
+        #set once we've run out of time
+        self.exhausted = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def get_fresh(self):
+        '''
+        a new budget with the same time limit, for another generation which starts now
+        '''
+        return GenerationBudget(self.time_budget_s)
+
+    def get_elapsed(self):
+        return time.time() - self.started
+
+    def is_over_time(self):
+        return self.time_budget_s is not None and self.get_elapsed() > self.time_budget_s
+
+    def check(self, can_degrade=True):
+        '''
+        can_degrade: if False (eg during the train search, where there is nothing simpler to fall back to) running out of time is only recorded,
+        so later stages know to produce a simplified result
+        '''
+        if self.cancelled:
+            raise GenerationCancelled()
+        if not self.exhausted and self.is_over_time():
+            self.exhausted = True
+            print("Generation time budget of {}s exhausted after {:.1f}s".format(self.time_budget_s, self.get_elapsed()))
+            if can_degrade:
+                raise GenerationBudgetExhausted()
+
+FIDELITY_FULL = "full"
+#quick 2D preview without building any 3D geometry
+FIDELITY_DRAFT = "draft"
+
+#(pendulum period, runtime hours, escapement teeth, module reduction) -> trains from calculate_ratios. The train search is the slowest part of a draft
+#and gives the same answer for the draft and full versions of a clock (and for every style), so only do it once per process
+_going_train_ratios_cache = {}
+
 class DialWithHands:
-    def __init__(self, diameter=180, style=DialStyle.LINES_ARC, hand_style=HandStyle.SIMPLE_ROUND, centred_second_hand=False, hand_has_outline=True):
+    def __init__(self, diameter=180, style=DialStyle.LINES_ARC, hand_style=HandStyle.SIMPLE_ROUND, centred_second_hand=False, hand_has_outline=True, progress_callback=None,
+                 budget=None, fidelity=FIDELITY_FULL):
+        '''
+        progress_callback: optional function(stage, fraction), see AutoWallClock
+        budget: optional GenerationBudget, only used for cancellation as there's no simpler dial to fall back to
+        fidelity: FIDELITY_FULL or FIDELITY_DRAFT, see AutoWallClock
+        '''
+        if fidelity not in [FIDELITY_FULL, FIDELITY_DRAFT]:
+            raise ValueError("Unknown fidelity {}".format(fidelity))
+        self.fidelity = fidelity
         self.diameter = diameter
+        self.progress_callback = progress_callback
+        self.budget = budget
         self.style = style
         self.hand_style = hand_style
         self.centred_second_hand = centred_second_hand
@@ -236,11 +542,28 @@ class DialWithHands:
         centred_string = "_centred_second" if centred_second_hand else ""
         outline_string = "_outline" if hand_has_outline else ""
 
-        self.name = f"dial_{diameter}_{style.value}_{hand_style.value}{centred_string}{outline_string}"
+        draft_string = "_draft" if fidelity == FIDELITY_DRAFT else ""
+
+        self.name = f"dial_{diameter}_{style.value}_{hand_style.value}{centred_string}{outline_string}{draft_string}"
         self.generated = False
 
+    def get_full_fidelity(self):
+        '''
+        the same dial but print-ready, so a draft can be shown while this generates.
+        Gets a fresh budget with the same time limit (the draft's has already been running) and doesn't report progress to the draft's callback
+        '''
+        return DialWithHands(diameter=self.diameter, style=self.style, hand_style=self.hand_style, centred_second_hand=self.centred_second_hand, hand_has_outline=self.hand_has_outline,
+                             budget=None if self.budget is None else self.budget.get_fresh(), fidelity=FIDELITY_FULL)
+
+    def report_progress(self, stage, fraction=0):
+        if self.budget is not None:
+            self.budget.check(can_degrade=False)
+        if self.progress_callback is not None:
+            self.progress_callback(stage, fraction)
+
     def gen_dial(self):
         self.generated = True
+        self.report_progress("dial")
         self.dial = Dial(outside_d= self.diameter, style=self.style)
 
         outline = 1 if self.hand_has_outline else 0
@@ -256,7 +579,19 @@ class DialWithHands:
         # self.autoclock = AutoWallClock(centred_second_hand=self.centred_second_hand, has_dial=True, dial_style=self.style,hand_style=self.hand_style,hand_has_outline=self.hand_has_outline)
         # self.autoclock.gen_clock()
 
-        self.dial_demo = self.dial.get_dial().rotate((0,0,0), (0,1,0),180).add(self.hands.get_assembled(include_seconds=self.centred_second_hand))
+        self.report_progress("hands")
+        if self.fidelity == FIDELITY_DRAFT:
+            self.dial_demo = None
+            return
+        self.dial_demo = get_flat_drawing(dial=self.dial, hands=self.hands, include_seconds=self.centred_second_hand)
+
+    def get_draft(self):
+        if not self.generated:
+            self.gen_dial()
+        drawing = DraftSVG()
+        draw_dial(drawing, self.dial, (0,0))
+        draw_hands(drawing, self.hands, (0,0), second_centre=(0,0) if self.centred_second_hand else None)
+        return drawing
 
     def output_svg(self, path, width=-1):
         if not self.generated:
@@ -266,7 +601,12 @@ class DialWithHands:
         if width < 0:
             width = 400
         print("Exporting {}".format(out))
-        svg = exportSVG(self.dial_demo, out, opts={"width":width, "strokeWidth": 0.25, "showHidden": False, "projectionDir": (0, 0, 1)})
+        self.report_progress("export")
+        if self.fidelity == FIDELITY_DRAFT:
+            #no png, the point of the draft is to be quick
+            return self.get_draft().export(out, width=width, height=width)
+        svg = self.dial_demo.export(out, width=width, height=width)
+        self.report_progress("export_png")
         svg2png(url=out, write_to=basename+".png", background_color="rgb(255,255,255)", output_width=600)
         svg2png(url=out, write_to=basename + "_small.png", background_color="rgb(255,255,255)", output_width=300)
         return svg
@@ -275,10 +615,28 @@ class DialWithHands:
 class AutoWallClock:
 
     def __init__(self, pendulum_period_s=2, days=8, centred_second_hand=False, has_dial=False, gear_style=GearStyle.CIRCLES,
-                 escapement_style=AnchorStyle.CURVED_MATCHING_WHEEL, dial_style=DialStyle.LINES_ARC, dial_seconds_style=None, hand_style=HandStyle.SIMPLE_ROUND, hand_has_outline=True):
+                 escapement_style=AnchorStyle.CURVED_MATCHING_WHEEL, dial_style=DialStyle.LINES_ARC, dial_seconds_style=None, hand_style=HandStyle.SIMPLE_ROUND, hand_has_outline=True,
+                 progress_callback=None, budget=None, fidelity=FIDELITY_FULL):
         '''
         Attempt to automatically configure a valid wall clock
+
+        progress_callback: optional function(stage, fraction) called as the clock is generated and exported, so a GUI can show progress.
+        stage is a string ("escapement", "train_options", "train_evaluation", "gears", "plates", "hands", "assembly", "export" etc) and fraction is
+        how far through that stage we are (0-1), only meaningful for the train search stages.
+
+        budget: optional GenerationBudget to allow cancelling and to limit the time spent. If the time runs out a simplified preview
+        (no gear styles) is produced instead, see is_degraded()
+
+        fidelity: FIDELITY_FULL for print-ready geometry, or FIDELITY_DRAFT for a quick 2D front view drawn straight from the layout: no gear styles,
+        fillets, text or holes and polygonal teeth. Use get_full_fidelity() to get the full version afterwards
         '''
+        if fidelity not in [FIDELITY_FULL, FIDELITY_DRAFT]:
+            raise ValueError("Unknown fidelity {}".format(fidelity))
+        self.fidelity = fidelity
+        self.progress_callback = progress_callback
+        self.budget = budget
+        #true if we ran out of time and produced a simplified clock
+        self.degraded = False
 
         # currently based on clock 12
         self.hours = max(1,days-1) * 24 + 6
@@ -324,11 +682,69 @@ class AutoWallClock:
                                                                                                                           escapement=escapement_style.value,
                                                                                                                           dial_style=dial_style_string,
                                                                                                                           hands=hand_style.value + ("_outline" if hand_has_outline else ""))
+        if fidelity == FIDELITY_DRAFT:
+            self.name += "_draft"
 
         self.clock_generated = False
 
+    def get_full_fidelity(self):
+        '''
+        the same clock but print-ready, so a draft can be shown while this generates. Budget and progress as DialWithHands.get_full_fidelity
+        '''
+        return AutoWallClock(pendulum_period_s=self.pendulum_period_s, days=self.days, centred_second_hand=self.centred_second_hand, has_dial=self.has_dial,
+                             gear_style=self.gear_style, escapement_style=self.escapement_style, dial_style=self.dial_style, dial_seconds_style=self.dial_seconds_style,
+                             hand_style=self.hand_style, hand_has_outline=self.hand_has_outline, budget=None if self.budget is None else self.budget.get_fresh(), fidelity=FIDELITY_FULL)
+
+    def report_progress(self, stage, fraction=0, can_degrade=True):
+        if self.budget is not None:
+            self.budget.check(can_degrade=can_degrade)
+        if self.progress_callback is not None:
+            self.progress_callback(stage, fraction)
+
+    def report_progress_cannot_degrade(self, stage, fraction=0):
+        #used for the train search (can't skip it, so running out of time just means everything after will be simplified)
+        #and the final export (already committed to the shape being exported)
+        self.report_progress(stage, fraction, can_degrade=False)
+
+    def is_degraded(self):
+        return self.degraded
+
+    def get_output_name(self):
+        '''
+        simplified previews must not overwrite (or be mistaken for) the full version in the cache
+        '''
+        if self.degraded:
+            return self.name + "_simplified"
+        return self.name
+
+    def degrade(self):
+        '''
+        Strip out the slow bits (currently the gear styles) so a preview can still be produced after the time budget has run out
+        '''
+        print("Generating simplified clock")
+        self.degraded = True
+        for arbor in self.train.get_all_arbors():
+            arbor.style = GearStyle.SOLID
+        self.motionWorks.style = GearStyle.SOLID
+
+    def get_gear_style(self):
+        if self.fidelity == FIDELITY_DRAFT:
+            return GearStyle.SOLID
+        if self.budget is not None and self.budget.exhausted:
+            self.degraded = True
+        return GearStyle.SOLID if self.degraded else self.gear_style
+
+    def get_clock_shape(self):
+        try:
+            return self.model.get_clock(progress_callback=self.report_progress)
+        except GenerationBudgetExhausted:
+            self.degrade()
+            #budget is now marked as exhausted, so this will only abort if cancelled
+            return self.model.get_clock(progress_callback=self.report_progress)
+
     def gen_clock(self):
         self.clock_generated = True
+        self.report_progress("escapement", can_degrade=False)
         #TODO auto optimal pallets
         if self.pendulum_period_s > 1.5:
             #viable for second hand with 2s pendulum
@@ -349,20 +765,29 @@ class AutoWallClock:
                                 use_pulley=True, chain_at_back=False, powered_wheels=1, runtime_hours=self.hours, huygens_maintaining_power=self.huygens)
 
         self.moduleReduction = 0.85
-        self.train.calculate_ratios(max_wheel_teeth=130, min_pinion_teeth=9, wheel_min_teeth=60, pinion_max_teeth=15, max_error=0.1, module_reduction=self.moduleReduction)
+        ratios_key = (self.pendulum_period_s, self.hours, self.escapement.teeth, self.moduleReduction)
+        if ratios_key in _going_train_ratios_cache:
+            self.train.trains = list(_going_train_ratios_cache[ratios_key])
+            self.report_progress_cannot_degrade("train_evaluation", 1)
+        else:
+            self.train.calculate_ratios(max_wheel_teeth=130, min_pinion_teeth=9, wheel_min_teeth=60, pinion_max_teeth=15, max_error=0.1, module_reduction=self.moduleReduction,
+                                        progress_callback=self.report_progress_cannot_degrade)
+            _going_train_ratios_cache[ratios_key] = list(self.train.trains)
 
-        self.train.gen_cord_wheels(ratchet_thick=4, rod_metric_thread=4, cord_thick=1, cord_coil_thick=14, style=self.gear_style, use_key=True, prefered_diameter=25, loose_on_rod=False, prefer_small=True)
+        self.report_progress("gears", can_degrade=False)
+        gear_style = self.get_gear_style()
+        self.train.gen_cord_wheels(ratchet_thick=4, rod_metric_thread=4, cord_thick=1, cord_coil_thick=14, style=gear_style, use_key=True, prefered_diameter=25, loose_on_rod=False, prefer_small=True)
 
 
 
-        self.train.gen_gears(module_size=self.module_size, module_reduction=self.moduleReduction, thick=2.4, thickness_reduction=0.9, powered_wheel_thick=4, pinion_thick_multiplier=3, style=self.gear_style,
+        self.train.gen_gears(module_size=self.module_size, module_reduction=self.moduleReduction, thick=2.4, thickness_reduction=0.9, powered_wheel_thick=4, pinion_thick_multiplier=3, style=gear_style,
                              powered_wheel_module_increase=1, powered_wheel_pinion_thick_multiplier=2, pendulum_fixing=self.pendulumFixing)
 
         bearing = None
         if self.centred_second_hand:
             bearing = get_bearing_info(3)
 
-        self.motionWorks = MotionWorks(style=self.gear_style, thick=3, compensate_loose_arbour=False, bearing=bearing, compact=True, module=1)
+        self.motionWorks = MotionWorks(style=gear_style, thick=3, compensate_loose_arbour=False, bearing=bearing, compact=True, module=1)
 
         self.pendulum = Pendulum(self.train.escapement, self.train.pendulum_length, anchorHoleD=3, anchorThick=12, nutMetricSize=3, crutchLength=0, hand_avoider_inner_d=self.ring_d,
                                  bob_d=self.bob_d, bob_thick=10, useNylocForAnchor=False)
@@ -386,6 +811,7 @@ class AutoWallClock:
             self.dial = Dial(outside_d=dial_diameter, bottom_fixing=bottom_fixing, top_fixing=top_fixing, seconds_style=self.dial_seconds_style, style=self.dial_style)
             self.hand_length = self.dial.outside_d * 0.45
 
+        self.report_progress("plates", can_degrade=False)
         front_thick = 9
         back_thick = 11
         motionWorksAbove = True
@@ -409,6 +835,7 @@ class AutoWallClock:
         if self.has_dial and not self.centred_second_hand and (self.train.has_seconds_hand_on_escape_wheel() or self.train.has_second_hand_on_last_wheel()):
             self.second_hand_length = self.dial.second_hand_mini_dial_d*0.5
 
+        self.report_progress("hands", can_degrade=False)
         outline = 1 if self.hand_has_outline else 0
         minute_fixing = "circle" if bearing is not None else "square"
         outlineSameAsBody = False
@@ -420,24 +847,84 @@ class AutoWallClock:
 
         self.pulley = BearingPulley(diameter=self.train.powered_wheel.diameter, bearing=get_bearing_info(4), wheel_screws=MachineScrew(2, countersunk=True, length=8))
 
+        if self.fidelity == FIDELITY_DRAFT:
+            #nothing needs the full assembly
+            self.model = None
+            return
+
+        self.report_progress("assembly", can_degrade=False)
         self.model = Assembly(self.plates, hands=self.hands, time_seconds=30, pulley=self.pulley, pendulum=self.pendulum)
 
+    def get_draft(self):
+        '''
+        Front view of the clock drawn straight from the layout of the plates, without building any 3D geometry
+        '''
+        if not self.clock_generated:
+            self.gen_clock()
+        drawing = DraftSVG()
+        plates = self.plates
+
+        #plates are the stroke lines between the bearings and the pillars
+        for i in range(len(plates.bearing_positions) - 1):
+            drawing.add_line(plates.bearing_positions[i][:2], plates.bearing_positions[i + 1][:2], plates.plate_width)
+        for pillar_pos in plates.bottom_pillar_positions:
+            drawing.add_circle(pillar_pos[:2], plates.bottom_pillar_r, stroke="none")
+        for pillar_pos in plates.top_pillar_positions:
+            drawing.add_circle(pillar_pos[:2], plates.top_pillar_r, stroke="none")
+
+        for i, bearing_pos in enumerate(plates.bearing_positions):
+            arbor = self.train.get_arbor_with_conventional_naming(i)
+            centre = bearing_pos[:2]
+            if arbor.get_type() == ArborType.ANCHOR:
+                drawing.add_circle(centre, arbor.get_max_radius()*0.3, fill="rgb(150,150,150)")
+                continue
+            if arbor.get_type() == ArborType.ESCAPE_WHEEL:
+                drawing.add_polygon(get_escape_wheel_polygon(arbor.escapement.teeth, arbor.get_max_radius(), arbor.escapement.get_wheel_inner_r(), centre=centre), fill="rgb(220,180,60)")
+            elif arbor.wheel is not None:
+                draw_gear(drawing, arbor.wheel, centre)
+            if arbor.pinion is not None:
+                draw_gear(drawing, arbor.pinion, centre, fill="rgb(190,150,40)")
+
+        hands_pos = plates.hands_position
+        if self.dial is not None:
+            draw_dial(drawing, self.dial, hands_pos)
+        second_pos = None
+        if self.centred_second_hand:
+            second_pos = hands_pos
+        elif plates.has_seconds_hand():
+            second_pos = plates.get_seconds_hand_position()[:2]
+        draw_hands(drawing, self.hands, hands_pos, second_centre=second_pos, time_seconds=30)
+
+        return drawing
+
 
 
 
     def get_svg_text(self):
         if not self.clock_generated:
             self.gen_clock()
-        return exportSVG(self.model.get_clock(), None, opts={"width": 720, "height": 720, "strokeWidth": 0.2, "showHidden": False})
+        if self.fidelity == FIDELITY_DRAFT:
+            return self.get_draft().get_svg(width=720, height=720)
+        clock_shape = self.get_clock_shape()
+        return exportSVG(clock_shape, None, opts={"width": 720, "height": 720, "strokeWidth": 0.2, "showHidden": False}, progress_callback=self.report_progress_cannot_degrade)
 
     def output_svg(self, path):
         if not self.clock_generated:
             self.gen_clock()
-        basename =  os.path.join(path, self.name)
+        if self.fidelity == FIDELITY_DRAFT:
+            out = os.path.join(path, self.get_output_name()) + ".svg"
+            print("Exporting {}".format(out))
+            self.report_progress("export", can_degrade=False)
+            return self.get_draft().export(out, width=720, height=720)
+        clock_shape = self.get_clock_shape()
+        #name might have changed if we ran out of time
+        basename =  os.path.join(path, self.get_output_name())
         out = basename + ".svg"
 
         print("Exporting {}".format(out))
-        svg = exportSVG(self.model.get_clock(), out, opts={"width":720, "height":720, "strokeWidth": 0.2, "showHidden": False})
+        #already committed to this clock shape, so don't try and degrade any further
+        svg = exportSVG(clock_shape, out, opts={"width":720, "height":720, "strokeWidth": 0.2, "showHidden": False}, progress_callback=self.report_progress_cannot_degrade)
+        self.report_progress("export_png", can_degrade=False)
         svg2png(url=out, write_to=basename+".png", background_color="rgb(255,255,255)", output_width=1440)
         svg2png(url=out, write_to=basename + "_small.png", background_color="rgb(255,255,255)", output_width=720)
         return svg
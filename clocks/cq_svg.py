@@ -33,6 +33,9 @@ from OCP.BRepLib import BRepLib
 from OCP.HLRBRep import HLRBRep_Algo, HLRBRep_HLRToShape
 from OCP.HLRAlgo import HLRAlgo_Projector
 from OCP.GCPnts import GCPnts_QuasiUniformDeflection
+from OCP.BRepTools import BRepTools_WireExplorer
+from OCP.BRepAdaptor import BRepAdaptor_Curve
+from OCP.TopAbs import TopAbs_REVERSED
 
 DISCRETIZATION_TOLERANCE = 1e-3
 
@@ -149,7 +152,7 @@ def getPaths(visibleShapes, hiddenShapes):
     return (hiddenPaths, visiblePaths)
 
 
-def getSVG(shape, opts=None):
+def getSVG(shape, opts=None, progress_callback=None):
     """
     Export a shape to SVG text.
 
@@ -168,6 +171,7 @@ def getSVG(shape, opts=None):
         strokeColor: Color of the line that visible edges are drawn with.
         hiddenColor: Color of the line that hidden edges are drawn with.
         showHidden: Whether or not to show hidden lines.
+    :param progress_callback: optional function(stage, fraction) called before and after the hidden line removal, may raise to abort.
     """
 
     # Available options and their defaults
@@ -204,6 +208,10 @@ def getSVG(shape, opts=None):
     hiddenColor = tuple(d["hiddenColor"])
     showHidden = bool(d["showHidden"])
 
+    if progress_callback is not None:
+        #last chance to abort before the (slow and uninterruptible) hidden line removal
+        progress_callback("export_hlr", 0)
+
     hlr = HLRBRep_Algo()
     hlr.Add(shape.wrapped)
 
@@ -254,6 +262,9 @@ def getSVG(shape, opts=None):
     for el in hidden:
         BRepLib.BuildCurves3d_s(el, TOLERANCE)
 
+    if progress_callback is not None:
+        progress_callback("export_paths", 0)
+
     # convert to native CQ objects
     visible = list(map(Shape, visible))
     hidden = list(map(Shape, hidden))
@@ -325,7 +336,7 @@ def getSVG(shape, opts=None):
     return svg
 
 
-def exportSVG(shape, fileName: str = None, opts=None):
+def exportSVG(shape, fileName: str = None, opts=None, progress_callback=None):
     """
     Accept a cadquery shape, and export it to the provided file
     TODO: should use file-like objects, not a fileName, and/or be able to return a string instead
@@ -338,10 +349,73 @@ def exportSVG(shape, fileName: str = None, opts=None):
     if isinstance(shape, Workplane):
         shape = toCompound(shape)
 
-    svg = getSVG(shape, opts)
+    svg = getSVG(shape, opts, progress_callback=progress_callback)
     if fileName is not None:
         with open(fileName, "w") as f:
             f.write(svg)
             f.close()
 
     return svg
+
+
+def getWirePoints(wire, face, tolerance=DISCRETIZATION_TOLERANCE):
+    """
+    Points (x,y) in order around a wire of a face, following the edges in the wire's own order and direction so they can be filled as a polygon
+    """
+    points = []
+    explorer = BRepTools_WireExplorer(wire.wrapped, face.wrapped)
+    while explorer.More():
+        curve = BRepAdaptor_Curve(explorer.Current())
+        discretised = GCPnts_QuasiUniformDeflection(curve, tolerance, curve.FirstParameter(), curve.LastParameter())
+        if discretised.IsDone():
+            edge_points = [discretised.Value(i + 1) for i in range(discretised.NbPoints())]
+            if explorer.Orientation() == TopAbs_REVERSED:
+                edge_points.reverse()
+            points.extend([(p.X(), p.Y()) for p in edge_points])
+        explorer.Next()
+    return points
+
+
+def getFlatFacePaths(shape, tolerance=0.05):
+    """
+    luke: for flat designs (dials, hands) viewed from above there's no need for hidden line removal, just draw every face which points straight up.
+
+    returns [(z, svg path data, (min x, min y, max x, max y))] for every upwards facing planar face, each face a single path (use fill-rule evenodd for the holes)
+    """
+    if isinstance(shape, Workplane):
+        shape = toCompound(shape)
+    paths = []
+    for face in shape.Faces():
+        if face.geomType() != "PLANE" or face.normalAt().z < 0.99:
+            continue
+        path = ""
+        all_points = []
+        for wire in [face.outerWire()] + face.innerWires():
+            points = getWirePoints(wire, face, tolerance)
+            if len(points) < 3:
+                continue
+            path += "M" + " L".join(["{:.3f},{:.3f}".format(x, y) for x, y in points]) + " Z "
+            all_points.extend(points)
+        if len(all_points) == 0:
+            continue
+        bounds = (min([p[0] for p in all_points]), min([p[1] for p in all_points]), max([p[0] for p in all_points]), max([p[1] for p in all_points]))
+        paths.append((face.Center().z, path, bounds))
+    return paths
+
+
+def drawFlatShapes(drawing, layers, tolerance=0.05, stroke="rgb(0,0,0)", stroke_width=0.2):
+    """
+    luke: fast 2D alternative to getSVG for flat designs. Adds the upwards facing faces of each shape to a DraftSVG, filled in the colour of its layer,
+    lowest first so higher faces are painted over the top of them.
+
+    layers: [(fill colour, shape)], the order is kept for faces at the same height
+    """
+    all_paths = []
+    for index, (fill, shape) in enumerate(layers):
+        if shape is None:
+            continue
+        for z, path, bounds in getFlatFacePaths(shape, tolerance):
+            all_paths.append((z, index, path, bounds, fill))
+
+    for z, index, path, bounds, fill in sorted(all_paths, key=lambda p: (p[0], p[1])):
+        drawing.add_path(path, bounds, fill=fill, stroke=stroke, stroke_width=stroke_width)
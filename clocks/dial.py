@@ -11,6 +11,10 @@ import numpy as np
 import os
 from .cosmetics import tony_the_clock
 from .gearing import *
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import time
+import threading
 
 class MoonPhaseComplication2D:
     def __init__(self, motion_works):
@@ -214,6 +218,21 @@ class MoonPhaseComplication3D:
         self.cannon_pinion_max_r = 10
         self.plate_to_top_of_hour_holder_wheel = 15
 
+        #(what, args..., settings) -> shape or positions, the arbors and moon are needed for the preview, the BOM and the STLs
+        self.shape_cache = {}
+
+    def get_cache_state(self):
+        '''
+        set_motion_works_sizes changes the sizes after creation, so key the cache on all the simple settings
+        '''
+        return get_simple_settings(self)
+
+    def get_cached(self, key, make):
+        key = key + (self.get_cache_state(),)
+        if key not in self.shape_cache:
+            self.shape_cache[key] = make()
+        return self.shape_cache[key]
+
     def set_motion_works_sizes(self, motion_works):
 
         self.cannon_pinion_max_r = motion_works.get_cannon_pinion_max_r()
@@ -230,6 +249,13 @@ class MoonPhaseComplication3D:
         return self.pairs[0].pinion.get_max_radius()
 
     def get_arbor_shape(self, index, for_printing=True):
+        '''
+        cached, see make_arbor_shape
+        '''
+        #fresh workplane, as add() would otherwise change the cached one
+        return cq.Workplane("XY").add(self.get_cached(("arbor", index, for_printing), lambda: self.make_arbor_shape(index, for_printing=for_printing)))
+
+    def make_arbor_shape(self, index, for_printing=True):
         '''
         not adapting the Arbour class to do all this as there's just not the need - there's only going to be one sensible solution for the moon complication once it's finished
 
@@ -287,6 +313,9 @@ class MoonPhaseComplication3D:
         '''
         returns [(x,y,z),] starting with the first arbor (not position of motion works)
         '''
+        return list(self.get_cached(("positions",), self.make_arbor_positions_relative_to_motion_works))
+
+    def make_arbor_positions_relative_to_motion_works(self):
 
         positions = []
 
@@ -330,6 +359,9 @@ class MoonPhaseComplication3D:
             (x*bevel0_pos[0], bevel0_pos[1], WASHER_THICK_M3 + self.pinion_thick/2 +self.gear_thick/2)]
 
     def get_moon_half(self):
+        return cq.Workplane("XY").add(self.get_cached(("moon_half",), self.make_moon_half))
+
+    def make_moon_half(self):
         moon = cq.Workplane("XY").add(cq.Solid.makeSphere(self.moon_radius))
 
         #hole for rod - we're clamping the moon in place like the motion works, so it can be rotated with friction from the split washer
@@ -399,6 +431,10 @@ class MoonPhaseComplication3D:
         '''
         for rendering a preview with colours
         '''
+        parts = self.get_cached(("parts_in_situ",), self.make_parts_in_situ)
+        return {name: cq.Workplane("XY").add(parts[name]) for name in parts}
+
+    def make_parts_in_situ(self):
         parts = {}
         positions = self.get_arbor_positions_relative_to_motion_works()
         for i in range(3):
@@ -443,6 +479,56 @@ class MoonPhaseComplication3D:
         #worth bumping up the quality for this!
         exporters.export(self.get_moon_half(), out, tolerance=0.01, angularTolerance=0.01)
 
+#the hand-drawn numerals are slow to build and the same characters are drawn again for every hour and every dial, so cache them here
+#(class name, what, character or number, size info...) -> shape. The getters hand out fresh workplanes, as add() would otherwise change the cached one
+NUMERAL_GLYPH_CACHE = {}
+#the autoclock server generates in several threads, so only fill the glyph cache while holding this (re-entrant as some glyphs are built from others)
+NUMERAL_GLYPH_CACHE_LOCK = threading.RLock()
+
+#the structural part of the dial (ring, supports, fixings, seconds ring) is the same whatever the dial style, so share it between dials
+#Dial.get_dial_base_cache_key() -> shape
+DIAL_BASE_CACHE = {}
+DIAL_BASE_CACHE_LOCK = threading.Lock()
+
+#(layers, includers) being exported by export_dial_tiles, inherited by the forked worker processes so the shapes never need pickling
+_dial_tiles_for_workers = None
+
+def export_dial_tile(layer, tile, out):
+    '''
+    cut one tile out of one layer of the dial and export it, returns how long it took
+    '''
+    start = time.time()
+    layers, includers = _dial_tiles_for_workers
+    print("Outputting ", out)
+    exporters.export(layers[layer].intersect(includers[tile]), out)
+    return time.time() - start
+
+def export_dial_tiles(layers, includers, outs, processes=None):
+    '''
+    Cut every layer of a dial into tiles and export them. All the tiles are independent so if processes is set they are cut and exported in worker processes.
+
+    layers: {name: shape}
+    includers: from get_sector_includers
+    outs: {(layer name, tile index): file name}
+
+    Needs the "fork" start method for the workers to inherit the shapes, otherwise (eg on windows) the tiles are exported one after another here.
+    '''
+    global _dial_tiles_for_workers
+    start = time.time()
+    _dial_tiles_for_workers = (layers, includers)
+    try:
+        if processes is None or "fork" not in multiprocessing.get_all_start_methods():
+            for (layer, tile), out in outs.items():
+                export_dial_tile(layer, tile, out)
+        else:
+            with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("fork")) as executor:
+                futures = {out: executor.submit(export_dial_tile, layer, tile, out) for (layer, tile), out in outs.items()}
+                for out, future in futures.items():
+                    print("Exported {} in {:.1f}s".format(out, future.result()))
+    finally:
+        _dial_tiles_for_workers = None
+    print("Exported {} dial tiles in {:.1f}s".format(len(outs), time.time() - start))
+
 class RomanNumerals:
     '''
     The old roman_numerals function in cuckoo_bits works, but I'd like something more flexible and that can follow the curve of a dial
@@ -571,7 +657,17 @@ class RomanNumerals:
 
         return x
 
+    def get_cache_key(self):
+        return ("RomanNumerals", self.style, self.height, self.thick, self.centre_radius)
+
     def get_character(self, char):
+        key = self.get_cache_key() + ("char", char)
+        with NUMERAL_GLYPH_CACHE_LOCK:
+            if key not in NUMERAL_GLYPH_CACHE:
+                NUMERAL_GLYPH_CACHE[key] = self.make_character(char)
+            return cq.Workplane("XY").add(NUMERAL_GLYPH_CACHE[key])
+
+    def make_character(self, char):
         if char == "I":
             return self.get_I()
         elif char == "V":
@@ -583,6 +679,13 @@ class RomanNumerals:
         '''
         Assumes number is a string made up of only I,X,V
         '''
+        key = self.get_cache_key() + ("number", number_string, invert)
+        with NUMERAL_GLYPH_CACHE_LOCK:
+            if key not in NUMERAL_GLYPH_CACHE:
+                NUMERAL_GLYPH_CACHE[key] = self.make_number(number_string, invert)
+            return cq.Workplane("XY").add(NUMERAL_GLYPH_CACHE[key])
+
+    def make_number(self, number_string, invert=False):
 
         if self.style == RomanNumeralStyle.CUCKOO:
             return roman_numerals(number_string, self.height, thick=self.thick, invert=invert)
@@ -624,6 +727,8 @@ class FancyFrenchArabicNumbers(CustomFontDrawing):
         self.thick_line_width = self.height*0.125
         self.thin_line_width = self.height*0.035#self.height*0.01
         self.diamond_width = self.thick_line_width*1.75
+        #spirals are drawn with a point each time the line turns this much (about 15 points per turn, but bunched up where the spiral is tightest)
+        self.spiral_max_turn_angle = math.pi*2/15
 
     def get_square_diamond(self):
         return cq.Workplane("XY").moveTo(-self.diamond_width/2,0).lineTo(0, self.diamond_width/2).lineTo(self.diamond_width/2, 0).lineTo(0, -self.diamond_width/2).close().extrude(self.thick)
@@ -691,7 +796,7 @@ class FancyFrenchArabicNumbers(CustomFontDrawing):
 
         end_angle = start_angle + dir * math.pi * 2
 
-        tadpole = spiral.draw(start_angle, end_angle, self.thin_line_width, self.thick)
+        tadpole = spiral.draw(start_angle, end_angle, self.thin_line_width, self.thick, max_turn_angle=self.spiral_max_turn_angle)
 
         tadpole_end_fraction = 0.6
 
@@ -933,14 +1038,18 @@ class FancyFrenchArabicNumbers(CustomFontDrawing):
         # twirly = twirly.union(get_stroke_line(spiral_points, self.thin_line_width, self.thick))
         # twirly = twirly.union(get_stroke_arc(sp))
         # skip = floor(points_per_spiral*(small_diamond_span_angle/2)/(math.pi*2))
-        for i in range(len(spiral_points) - 1 ):
-            #assume all points are a quarter circle NOT TRUE
-            angle = spiral_offset_angle + (i+1) * math.pi * 2 / points_per_spiral
-
-            from_pos = spiral_points[i]
-            from_dir = spiral_directions[i ]
-            to_pos = spiral_points[i + 1]
-            to_dir = spiral_directions[(i+1)]
+        #the evenly spaced points above are only needed for the tadpole, the line itself only needs enough points to follow the curve
+        line_angles = spiral.get_draw_angles(spiral_offset_angle, spiral_offset_angle + spirals * math.pi * 2, max_turn_angle=self.spiral_max_turn_angle,
+                                              min_length=self.thin_line_width)
+        line_points = [np_to_set(pos) for pos in spiral.get_positions(line_angles).tolist()]
+        line_directions = [np_to_set(dir) for dir in spiral.get_tangents(line_angles).tolist()]
+        for i in range(len(line_angles) - 1):
+            angle = line_angles[i + 1]
+
+            from_pos = line_points[i]
+            from_dir = line_directions[i]
+            to_pos = line_points[i + 1]
+            to_dir = line_directions[i + 1]
 
             if angle > big_diamond_top_angle:
                 #just link to big diamond (otherwise the spiral can sometimes clip outside the edge of the diamond)
@@ -999,8 +1108,15 @@ class FancyFrenchArabicNumbers(CustomFontDrawing):
     
     def get_digit(self, digit):
         '''
-        0-9 single digits
+        0-9 single digits, cached
         '''
+        key = ("FancyFrenchArabicNumbers", self.height, self.thick, "digit", int(digit))
+        with NUMERAL_GLYPH_CACHE_LOCK:
+            if key not in NUMERAL_GLYPH_CACHE:
+                NUMERAL_GLYPH_CACHE[key] = self.make_digit(digit)
+            return cq.Workplane("XY").add(NUMERAL_GLYPH_CACHE[key])
+
+    def make_digit(self, digit):
 
         digit = int(digit)
 
@@ -1364,6 +1480,13 @@ class FancyFrenchArabicNumbers(CustomFontDrawing):
         '''
         Assumes number is a string
         '''
+        key = ("FancyFrenchArabicNumbers", self.height, self.thick, "number", str(number))
+        with NUMERAL_GLYPH_CACHE_LOCK:
+            if key not in NUMERAL_GLYPH_CACHE:
+                NUMERAL_GLYPH_CACHE[key] = self.make_number(number)
+            return cq.Workplane("XY").add(NUMERAL_GLYPH_CACHE[key])
+
+    def make_number(self, number):
 
         widths = []
 
@@ -1453,6 +1576,10 @@ class Dial:
         #for a style which isn't just a ring, how big a hole for the hands to fit through?
         self.hand_hole_d = hand_hole_d
         self.detail_thick = detail_thick
+        #arguments to get_numbers_detail -> detail, the numbers are the slowest bit of the dial to build
+        self.numbers_detail_cache = {}
+        #("main" or "seconds", settings) -> detail, get_dial and get_all_detail both need the detail
+        self.detail_cache = {}
         self.nib_thick = detail_thick
         self.nib_hole_deep = detail_thick + LAYER_THICK*2
         #bit of a bodge, for tony the detail is in yellow so I need it thicker (my yellow is really translucent)
@@ -1688,7 +1815,9 @@ class Dial:
         if only_fives:
             big_dot_r -= self.dial_detail_from_edges*2
 
-        detail = cq.Workplane("XY")
+        #only two distinct dots, build them once and place copies
+        dot_shapes = {}
+        instances = []
 
         for d in range(dots):
             # if d % 5 != 0 and only_fives:
@@ -1699,9 +1828,12 @@ class Dial:
 
             pos = polar(dA*d, centre_radius)
 
-            detail = detail.add(cq.Workplane("XY").moveTo(pos[0], pos[1]).circle(r).extrude(self.detail_thick))
+            if r not in dot_shapes:
+                dot_shapes[r] = cq.Workplane("XY").circle(r).extrude(self.detail_thick)
 
-        return detail
+            instances.append((dot_shapes[r], 0, (pos[0], pos[1], 0)))
+
+        return get_instanced_shapes(instances)
 
     def get_concentric_circles_detail(self, outer_r, dial_width, from_edge, thick_fives=False):
         '''
@@ -1714,19 +1846,25 @@ class Dial:
         lines = 60
         dA = math.pi * 2 / lines
 
-        detail = cq.Workplane("XY").tag("base")
-        detail = detail.union(cq.Workplane("XY").circle(outer_circle_r + line_width / 2).circle(outer_circle_r - line_width / 2).extrude(self.detail_thick))
-        detail = detail.union(cq.Workplane("XY").circle(inner_circle_r + line_width / 2).circle(inner_circle_r - line_width / 2).extrude(self.detail_thick))
-
+        detail = BooleanBuilder(cq.Workplane("XY").circle(outer_circle_r + line_width / 2).circle(outer_circle_r - line_width / 2).extrude(self.detail_thick))
+        detail.add(cq.Workplane("XY").circle(inner_circle_r + line_width / 2).circle(inner_circle_r - line_width / 2).extrude(self.detail_thick))
 
+        #line at 12 o'clock for each width, placed as rotated copies
+        line_shapes = {}
+        instances = []
         for i in range(lines):
             big = i % 5 == 0 and thick_fives
             this_line_width = line_width*2 if big else line_width
             angle = math.pi / 2 - i * dA
 
-            detail = detail.union(cq.Workplane("XY").rect(this_line_width,outer_circle_r - inner_circle_r).extrude(self.detail_thick).translate((0, (outer_circle_r + inner_circle_r) / 2)).rotate((0, 0, 0), (0, 0, 1), rad_to_deg(angle)))
+            if this_line_width not in line_shapes:
+                line_shapes[this_line_width] = cq.Workplane("XY").rect(this_line_width,outer_circle_r - inner_circle_r).extrude(self.detail_thick).translate((0, (outer_circle_r + inner_circle_r) / 2))
 
-        return detail
+            instances.append((line_shapes[this_line_width], rad_to_deg(angle - math.pi/2), (0, 0, 0)))
+
+        detail.add(get_instanced_shapes(instances))
+
+        return detail.get_shape()
 
     def get_roman_numerals_detail(self, outer_r, dial_width, from_edge, with_lines=True):
 
@@ -1801,7 +1939,9 @@ class Dial:
             short_line_length_fraction=0.5
         short_line_length = max_line_length*short_line_length_fraction
 
-        detail = cq.Workplane("XY").tag("base")
+        #(diamond, centre_r, line_length, line_thick) -> line along the x axis, there are only a few distinct lines so they're built once and placed as rotated copies
+        line_shapes = {}
+        instances = []
 
         #every fifth line usually, but if we're an hours dial (48 marks for each quarter hour) highlight the half hours
         indicators_on = 4 if total_lines == 48 else 5
@@ -1834,14 +1974,19 @@ class Dial:
                 #else leave in centre
 
             angle = math.pi / 2 - i * dA
-            if diamond:
-                line = cq.Workplane("XY").moveTo(centre_r - line_length/2, 0).lineTo(centre_r, line_thick/2).lineTo(centre_r + line_length/2, 0).lineTo(centre_r, -line_thick/2).close().extrude(self.detail_thick)
-            else:
-                line = cq.Workplane("XY").moveTo(centre_r, 0).rect(line_length,line_thick).extrude(self.detail_thick)
+            key = (diamond, centre_r, line_length, line_thick)
+            if key not in line_shapes:
+                if diamond:
+                    line_shapes[key] = cq.Workplane("XY").moveTo(centre_r - line_length/2, 0).lineTo(centre_r, line_thick/2).lineTo(centre_r + line_length/2, 0).lineTo(centre_r, -line_thick/2).close().extrude(self.detail_thick)
+                else:
+                    line_shapes[key] = cq.Workplane("XY").moveTo(centre_r, 0).rect(line_length,line_thick).extrude(self.detail_thick)
 
-            detail = detail.add(line.rotate((0,0,0), (0,0,1), rad_to_deg(angle)))
+            instances.append((line_shapes[key], rad_to_deg(angle), (0, 0, 0)))
 
-        return detail
+        if len(instances) == 0:
+            return cq.Workplane("XY")
+
+        return get_instanced_shapes(instances)
 
     def get_arcs_detail(self, outer_r, dial_width, from_edge, thick_fives=True):
         '''
@@ -1869,20 +2014,25 @@ class Dial:
         big_angle = math.asin((big_line_thick / 2) / r) * 2
         small_angle = math.asin((small_line_thick / 2) / r) * 2
 
-        detail = cq.Workplane("XY").tag("base")
+        #arc at 12 o'clock for each width, placed as rotated copies
+        arc_shapes = {}
+        instances = []
 
         for i in range(lines):
             big = i % 5 == 0 and thick_fives
             line_angle = big_angle if big else small_angle
             angle = math.pi / 2 - i * dA
 
-            bottom_left = polar(angle - line_angle / 2, line_inner_r)
-            bottom_right = polar(angle + line_angle / 2, line_inner_r)
-            top_right = polar(angle + line_angle / 2, line_outer_r)
-            top_left = polar(angle - line_angle / 2, line_outer_r)
-            detail = detail.workplaneFromTagged("base").moveTo(bottom_left[0], bottom_left[1]).radiusArc(bottom_right, line_inner_r).lineTo(top_right[0], top_right[1]).radiusArc(top_left, line_outer_r).close().extrude(self.detail_thick)
+            if line_angle not in arc_shapes:
+                bottom_left = polar(math.pi / 2 - line_angle / 2, line_inner_r)
+                bottom_right = polar(math.pi / 2 + line_angle / 2, line_inner_r)
+                top_right = polar(math.pi / 2 + line_angle / 2, line_outer_r)
+                top_left = polar(math.pi / 2 - line_angle / 2, line_outer_r)
+                arc_shapes[line_angle] = cq.Workplane("XY").moveTo(bottom_left[0], bottom_left[1]).radiusArc(bottom_right, line_inner_r).lineTo(top_right[0], top_right[1]).radiusArc(top_left, line_outer_r).close().extrude(self.detail_thick)
 
-        return detail
+            instances.append((arc_shapes[line_angle], rad_to_deg(angle - math.pi / 2), (0, 0, 0)))
+
+        return get_instanced_shapes(instances)
 
     def get_quad_marks(self, outer_r, mark_length, mark_width, from_edge):
         '''
@@ -1966,7 +2116,22 @@ class Dial:
         else:
             raise ValueError("Unsupported dial type")
 
+    def get_cache_state(self):
+        '''
+        The dial is reconfigured by the plates after it's created (configure_dimensions, override_fixing_positions...) so key cached detail on all the simple settings
+        '''
+        return get_simple_settings(self) + (None if self.font is None else self.font.get_cache_key(),)
+
     def get_main_dial_detail(self):
+        '''
+        detailing for the big dial, cached
+        '''
+        key = ("main", self.get_cache_state())
+        if key not in self.detail_cache:
+            self.detail_cache[key] = self.make_main_dial_detail()
+        return cq.Workplane("XY").add(self.detail_cache[key])
+
+    def make_main_dial_detail(self):
         '''
         detailing for the big dial
         '''
@@ -2008,6 +2173,14 @@ class Dial:
         return dial
 
     def get_numbers_detail(self, outer_r, dial_width, dial_detail_from_edges, minutes=False, seconds=False, only = None):
+        font = self.font if self.font is not None else DEFAULT_FONT
+        key = (outer_r, dial_width, dial_detail_from_edges, minutes, seconds, None if only is None else tuple(only), self.detail_thick, self.font_scale, font.get_cache_key())
+        if key not in self.numbers_detail_cache:
+            self.numbers_detail_cache[key] = self.make_numbers_detail(outer_r, dial_width, dial_detail_from_edges, minutes=minutes, seconds=seconds, only=only)
+        #fresh workplane, as add() would otherwise change the cached one (get_fancy_watch_numbers_detail adds to it)
+        return cq.Workplane("XY").add(self.numbers_detail_cache[key])
+
+    def make_numbers_detail(self, outer_r, dial_width, dial_detail_from_edges, minutes=False, seconds=False, only = None):
 
         font = self.font
         if self.font is None:
@@ -2048,6 +2221,14 @@ class Dial:
         return dial
 
     def get_seconds_dial_detail(self):
+        key = ("seconds", self.get_cache_state())
+        if key not in self.detail_cache:
+            self.detail_cache[key] = self.make_seconds_dial_detail()
+        if self.detail_cache[key] is None:
+            return None
+        return cq.Workplane("XY").add(self.detail_cache[key])
+
+    def make_seconds_dial_detail(self):
         dial = None
         outer_r = self.second_hand_mini_dial_d / 2
         from_edge = self.seconds_dial_detail_from_edges
@@ -2115,24 +2296,39 @@ class Dial:
 
         return support_positions
 
-    def get_dial(self, for_printing=False):
-        '''
-        dial is generated face-down (even if raised_detail)
-        '''
+    def get_dial_base_radius(self):
         r = self.outside_d / 2
 
         if self.style == DialStyle.TONY_THE_CLOCK:
             #the dial slots into the outer ring, with some wiggle room, to be glued in place
             r-= self.outer_ring_overlap + 0.5
+        return r
 
-        dial = cq.Workplane("XY").circle(r).circle(self.inner_r).extrude(self.thick)
-
-
-
+    def get_dial_base_cache_key(self):
+        '''
+        everything the dial base depends on - notably not the style
+        '''
+        return (self.get_dial_base_radius(), self.inner_r, self.outside_d, self.dial_width, self.thick, self.support_length, self.support_d, self.support_slot_r,
+                self.nib_thick, self.nib_hole_deep, self.raised_detail, self.screwed_from_front, self.pillar_style,
+                tuple([tuple([tuple(pos) for pos in fixing_pos_set]) for fixing_pos_set in self.get_fixing_positions()]), get_simple_settings(self.fixing_screws),
+                self.second_hand_mini_dial_d, self.seconds_dial_width, None if self.second_hand_relative_pos is None else tuple(self.second_hand_relative_pos))
 
-        self.inner_r = self.outside_d / 2 - self.dial_width
+    def get_dial_base(self):
+        '''
+        The structural part of the dial: the ring (or disc), supports (or slots for them), fixing holes and the ring for the seconds sub dial.
+        Only the detail depends on the style, so this is cached across all dials and changing the style only rebuilds the detail.
+        '''
+        key = self.get_dial_base_cache_key()
+        with DIAL_BASE_CACHE_LOCK:
+            if key not in DIAL_BASE_CACHE:
+                DIAL_BASE_CACHE[key] = self.make_dial_base()
+            #fresh workplane, as add() would otherwise change the cached one
+            return cq.Workplane("XY").add(DIAL_BASE_CACHE[key])
 
+    def make_dial_base(self):
+        r = self.get_dial_base_radius()
 
+        dial = cq.Workplane("XY").circle(r).circle(self.inner_r).extrude(self.thick)
 
         if self.support_length > 0:
 
@@ -2179,11 +2375,21 @@ class Dial:
 
         if self.second_hand_mini_dial_d > 0:
             dial = dial.union(cq.Workplane("XY").circle(self.second_hand_mini_dial_d/2).circle(self.second_hand_mini_dial_d/2-self.seconds_dial_width).extrude(self.thick).translate(self.second_hand_relative_pos))
-            if not self.raised_detail:
-                seconds_detail = self.get_seconds_dial_detail()
-                if seconds_detail is not None:
-                    dial = dial.cut(seconds_detail)
 
+        return dial
+
+    def get_dial(self, for_printing=False):
+        '''
+        dial is generated face-down (even if raised_detail)
+        '''
+        dial = self.get_dial_base()
+
+        self.inner_r = self.outside_d / 2 - self.dial_width
+
+        if self.second_hand_mini_dial_d > 0 and not self.raised_detail:
+            seconds_detail = self.get_seconds_dial_detail()
+            if seconds_detail is not None:
+                dial = dial.cut(seconds_detail)
 
         if not self.raised_detail:
             #cut main detail after potential seconds dial in case of some overlap
@@ -2244,23 +2450,32 @@ class Dial:
 
         return dial
 
-    def get_assembled(self):
+    def get_assembled_layers(self):
         '''
-        for fancy dials with extras, get with them all together for the model
-        opposite way around to the rest of the dial - facing UPWARDS (in the +ve z direction)
+        as get_assembled, but [(name, shape)] so each colour can be kept separate (names as in get_colour_layers)
         '''
-
-        dial = self.get_dial().add(self.get_all_detail())
+        layers = [("dial", self.get_dial()), ("dial_detail", self.get_all_detail())]
         if self.raised_detail:
-            dial = dial.add(self.get_supports())
-        dial = dial.rotate((0, 0, 0), (0, 1, 0), 180)
+            layers.append(("dial_supports", self.get_supports()))
+        layers = [(name, shape.rotate((0, 0, 0), (0, 1, 0), 180)) for name, shape in layers]
 
         if self.style == DialStyle.TONY_THE_CLOCK:
             extras = self.get_extras()
-            dial = dial.add(extras["outer_ring"].rotate((0,0,0),(0,1,0),180).translate((0,0,self.thick)))
-            eye = extras["eye_white"].add(extras["eye_black"])
+            layers.append(("dial_outer_ring", extras["outer_ring"].rotate((0,0,0),(0,1,0),180).translate((0,0,self.thick))))
             for x in [-1,1]:
-                dial = dial.add(eye.translate((x*self.get_tony_dimension("eye_spacing")/2, self.outside_d/2 - self.get_tony_dimension("eyes_from_top"), -self.thick - self.eye_pivot_z)))
+                for name in ["eye_white", "eye_black"]:
+                    layers.append(("dial_" + name, extras[name].translate((x*self.get_tony_dimension("eye_spacing")/2, self.outside_d/2 - self.get_tony_dimension("eyes_from_top"), -self.thick - self.eye_pivot_z))))
+
+        return layers
+
+    def get_assembled(self):
+        '''
+        for fancy dials with extras, get with them all together for the model
+        opposite way around to the rest of the dial - facing UPWARDS (in the +ve z direction)
+        '''
+        dial = cq.Workplane("XY")
+        for name, shape in self.get_assembled_layers():
+            dial = dial.add(shape)
 
         return dial
 
@@ -2434,42 +2649,50 @@ class Dial:
             extras["eye_wire_to_arbor_fixer"] = self.get_wire_to_arbor_fixer()
         return extras
 
-    def get_halfs(self, shape):
-        top_includer = cq.Workplane("XY").rect(self.outside_d, self.outside_d/2).extrude(self.thick + self.support_d).translate((0,self.outside_d/4))
-        # actually rotate by two and a half minutes so we don't slice through anything too complicated
-        top_includer = top_includer.rotate((0, 0, 0), (0, 0, 1), -2.5 * 360 / 60).union(top_includer.rotate((0, 0, 0), (0, 0, 1), 2.5 * 360 / 60))
-
-        halves = [shape.intersect(top_includer), shape.cut(top_includer)]
-
-        return halves
+    def get_colour_layers(self, for_printing=False):
+        '''
+        Everything printed for the dial in one go, each built once: {"dial": chapter ring, "dial_detail": detail in a different colour, "dial_<extra>": extras}
+        '''
+        layers = {
+            "dial": self.get_dial(for_printing=for_printing),
+            "dial_detail": self.get_all_detail(for_printing=for_printing)
+        }
+        extras = self.get_extras()
+        for extra in extras:
+            layers["dial_{}".format(extra)] = extras[extra]
+        return layers
 
+    def output_STLs(self, name="clock", path="../out", max_wide=PRINT_BED_SIZE[0], max_long=PRINT_BED_SIZE[1], processes=None):
+        '''
+        dials too big for the print bed are split into tiles (halves where that's enough), see get_print_bed_tile_angles
+        processes: if set, cut and export the tiles in this many worker processes
+        '''
+        layers = self.get_colour_layers()
 
-    def output_STLs(self, name="clock", path="../out", max_wide=250, max_long=210):
+        tile_angles = get_print_bed_tile_angles(self.outside_d/2, max_wide, max_long)
 
-        if self.outside_d < min(max_wide, max_long):
+        if len(tile_angles) == 0:
             out = os.path.join(path, "{}_dial.stl".format(name))
             print("Outputting ", out)
-            exporters.export(self.get_dial(), out)
+            exporters.export(layers["dial"], out)
 
             out = os.path.join(path, "{}_dial_detail.stl".format(name))
             print("Outputting ", out)
-            exporters.export(self.get_all_detail(), out)
+            exporters.export(layers["dial_detail"], out)
         else:
-            dials = self.get_halfs(self.get_dial())
-            details = self.get_halfs(self.get_all_detail())
-            for i in range(len(dials)):
-                out = os.path.join(path, "{}_dial_half{}.stl".format(name, i))
-                print("Outputting ", out)
-                exporters.export(dials[i], out)
-
-                out = os.path.join(path, "{}_dial_detail_half{}.stl".format(name, i))
-                print("Outputting ", out)
-                exporters.export(details[i], out)
-        extras = self.get_extras()
-        for extra in self.get_extras():
-            out = os.path.join(path, "{}_dial_{}.stl".format(name, extra))
+            includers = get_sector_includers(tile_angles, self.outside_d/2)
+            tile_string = "half" if len(includers) == 2 else "tile"
+            outs = {}
+            for layer in ["dial", "dial_detail"]:
+                for i in range(len(includers)):
+                    outs[(layer, i)] = os.path.join(path, "{}_{}_{}{}.stl".format(name, layer, tile_string, i))
+            export_dial_tiles(layers, includers, outs, processes=processes)
+        for layer in layers:
+            if layer in ["dial", "dial_detail"]:
+                continue
+            out = os.path.join(path, "{}_{}.stl".format(name, layer))
             print("Outputting ", out)
-            exporters.export(extras[extra], out)
+            exporters.export(layers[layer], out)
 
         if self.raised_detail:
             export_STL(self.get_supports(),"dial_supports", name, path)
@@ -0,0 +1,356 @@
+'''
+Copyright Luke Wallin 2023
+
+This source describes Open Hardware and is licensed under the CERN-OHL-S v2.
+
+You may redistribute and modify this source and make products using it under
+the terms of the CERN-OHL-S v2 or any later version (https://ohwr.org/cern_ohl_s_v2.txt).
+
+This source is distributed WITHOUT ANY EXPRESS OR IMPLIED WARRANTY,
+INCLUDING OF MERCHANTABILITY, SATISFACTORY QUALITY AND FITNESS FOR A
+PARTICULAR PURPOSE. Please see the CERN-OHL-S v2 for applicable conditions.
+
+Source location: https://github.com/MrBunsy/3DPrintedClocks
+
+As per CERN-OHL-S v2 section 4, should you produce hardware based on this
+source, You must where practicable maintain the Source Location visible
+on the external case of the clock or other products you make using this
+source.
+'''
+import math
+from .utility import polar
+from .types import DialStyle, HandStyle
+
+'''
+Quick and rough 2D previews, written straight to SVG without building any 3D geometry.
+
+Intended for the web GUI where a draft preview in well under a second is more useful than an accurate one: no gear styles, fillets, text or holes
+and the teeth are simple polygons.
+'''
+
+class DraftSVG:
+    '''
+    Collects simple filled shapes (in mm, y up like the rest of the clock) and writes them out as an SVG scaled to fit width x height
+    '''
+    def __init__(self):
+        #list of (svg element string, (min x, min y, max x, max y))
+        self.elements = []
+
+    def add_polygon(self, points, fill="rgb(200,200,200)", stroke="rgb(0,0,0)", stroke_width=0.5):
+        points_string = " ".join(["{:.2f},{:.2f}".format(point[0], point[1]) for point in points])
+        bounds = (min([p[0] for p in points]), min([p[1] for p in points]), max([p[0] for p in points]), max([p[1] for p in points]))
+        self.elements.append(('<polygon points="{}" fill="{}" stroke="{}" stroke-width="{}"/>'.format(points_string, fill, stroke, stroke_width), bounds))
+
+    def add_circle(self, centre, r, fill="rgb(200,200,200)", stroke="rgb(0,0,0)", stroke_width=0.5):
+        bounds = (centre[0] - r, centre[1] - r, centre[0] + r, centre[1] + r)
+        self.elements.append(('<circle cx="{:.2f}" cy="{:.2f}" r="{:.2f}" fill="{}" stroke="{}" stroke-width="{}"/>'.format(centre[0], centre[1], r, fill, stroke, stroke_width), bounds))
+
+    def add_line(self, start, end, width, colour="rgb(200,200,200)"):
+        '''
+        line with round ends, width in mm. Overlapping lines of the same colour merge together, which is handy for plate outlines
+        '''
+        bounds = (min(start[0], end[0]) - width/2, min(start[1], end[1]) - width/2, max(start[0], end[0]) + width/2, max(start[1], end[1]) + width/2)
+        self.elements.append(('<line x1="{:.2f}" y1="{:.2f}" x2="{:.2f}" y2="{:.2f}" stroke="{}" stroke-width="{:.2f}" stroke-linecap="round"/>'.format(start[0], start[1], end[0], end[1], colour, width), bounds))
+
+    def add_path(self, path, bounds, fill="rgb(200,200,200)", stroke="rgb(0,0,0)", stroke_width=0.5):
+        '''
+        SVG path data, bounds is (min x, min y, max x, max y). Even-odd filled so subpaths inside the first are holes
+        '''
+        self.elements.append(('<path d="{}" fill="{}" fill-rule="evenodd" stroke="{}" stroke-width="{}"/>'.format(path, fill, stroke, stroke_width), bounds))
+
+    def add_text(self, text, centre, height, colour="rgb(0,0,0)"):
+        '''
+        centred text, height in mm. Flipped back the right way up as the whole drawing is flipped so y is up
+        '''
+        width = height * 0.6 * len(text)
+        bounds = (centre[0] - width/2, centre[1] - height/2, centre[0] + width/2, centre[1] + height/2)
+        self.elements.append(('<text transform="translate({:.2f},{:.2f}) scale(1,-1)" font-size="{:.2f}" font-family="serif" text-anchor="middle" dominant-baseline="central" fill="{}">{}</text>'.format(
+            centre[0], centre[1], height, colour, text), bounds))
+
+    def get_bounds(self):
+        if len(self.elements) == 0:
+            return (0, 0, 1, 1)
+        return (min([e[1][0] for e in self.elements]), min([e[1][1] for e in self.elements]), max([e[1][2] for e in self.elements]), max([e[1][3] for e in self.elements]))
+
+    def get_svg(self, width=400, height=400, margin=10):
+        '''
+        width and height are maximum bounds, the image is cropped to fit the shapes (like cq_svg)
+        '''
+        min_x, min_y, max_x, max_y = self.get_bounds()
+        x_len = max(max_x - min_x, 1)
+        y_len = max(max_y - min_y, 1)
+        scale = min((width - margin*2) / x_len, (height - margin*2) / y_len)
+        out_width = x_len * scale + margin*2
+        out_height = y_len * scale + margin*2
+
+        #flip y so it's up, like the 3D models
+        transform = "translate({:.2f},{:.2f}) scale({:.4f},{:.4f}) translate({:.2f},{:.2f})".format(margin, margin, scale, -scale, -min_x, -max_y)
+
+        return """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<svg xmlns="http://www.w3.org/2000/svg" width="{width:.1f}" height="{height:.1f}">
+    <g transform="{transform}">
+{elements}
+    </g>
+</svg>
+""".format(width=out_width, height=out_height, transform=transform, elements="\n".join(["        " + e[0] for e in self.elements]))
+
+    def export(self, file_name=None, width=400, height=400):
+        svg = self.get_svg(width=width, height=height)
+        if file_name is not None:
+            with open(file_name, "w") as f:
+                f.write(svg)
+        return svg
+
+def get_svg_colour(colour, default="rgb(0,0,0)"):
+    '''
+    colours as used in the rest of the clock (names or (r,g,b), see Colour) to SVG
+    '''
+    if colour is None:
+        return default
+    if isinstance(colour, tuple):
+        return "rgb({},{},{})".format(*colour[:3])
+    return colour
+
+#fills for Dial.get_assembled_layers()
+DIAL_LAYER_COLOURS = {
+    "dial": "rgb(255,255,255)",
+    "dial_detail": "rgb(0,0,0)",
+    "dial_supports": "rgb(200,200,200)",
+    "dial_outer_ring": "rgb(0,0,0)",
+    "dial_eye_white": "rgb(255,255,255)",
+    "dial_eye_black": "rgb(0,0,0)",
+}
+
+def get_dial_layer_colour(name):
+    return DIAL_LAYER_COLOURS.get(name, "rgb(200,200,200)")
+
+def get_hand_layer_colour(colour):
+    '''
+    for Hands.get_assembled_layers(), the outline is (usually) white around a black hand
+    '''
+    if colour == "outline":
+        return "rgb(255,255,255)"
+    return get_svg_colour(colour)
+
+def get_gear_polygon(teeth, outer_r, inner_r, centre=(0,0), angle=0, tooth_fraction=0.5):
+    '''
+    polygonal approximation of a gear: each tooth is a trapezium from inner_r to outer_r
+    '''
+    points = []
+    tooth_angle = math.pi * 2 / teeth
+    for tooth in range(teeth):
+        start = angle + tooth * tooth_angle
+        tooth_width = tooth_angle * tooth_fraction
+        #flanks slope in a little
+        for a, r in [(start, inner_r), (start + tooth_width*0.2, outer_r), (start + tooth_width*0.8, outer_r), (start + tooth_width, inner_r)]:
+            point = polar(a, r)
+            points.append((centre[0] + point[0], centre[1] + point[1]))
+    return points
+
+def get_escape_wheel_polygon(teeth, outer_r, inner_r, centre=(0,0), angle=0):
+    '''
+    saw tooth approximation of an escape wheel
+    '''
+    points = []
+    tooth_angle = math.pi * 2 / teeth
+    for tooth in range(teeth):
+        start = angle + tooth * tooth_angle
+        for a, r in [(start, inner_r), (start + tooth_angle*0.8, outer_r)]:
+            point = polar(a, r)
+            points.append((centre[0] + point[0], centre[1] + point[1]))
+    return points
+
+def draw_gear(drawing, gear, centre, fill="rgb(220,180,60)"):
+    '''
+    gear is a Gear from gearing.py
+    '''
+    outer_r = gear.get_max_radius()
+    inner_r = gear.inner_r
+    if gear.teeth < 3 or inner_r <= 0:
+        drawing.add_circle(centre, outer_r, fill=fill)
+        return
+    drawing.add_polygon(get_gear_polygon(gear.teeth, outer_r, inner_r, centre=centre), fill=fill)
+
+ROMAN_NUMERALS = ["I", "II", "III", "IIII", "V", "VI", "VII", "VIII", "IX", "X", "XI", "XII"]
+
+def get_circle_points(centre, r, points=24):
+    return [(centre[0] + r * math.cos(i * math.pi * 2 / points), centre[1] + r * math.sin(i * math.pi * 2 / points)) for i in range(points)]
+
+def transform_points(points, centre, angle):
+    '''
+    rotate points drawn pointing up (+y) so they point along angle, then move them to centre
+    '''
+    rotate = angle - math.pi/2
+    return [(centre[0] + p[0] * math.cos(rotate) - p[1] * math.sin(rotate), centre[1] + p[0] * math.sin(rotate) + p[1] * math.cos(rotate)) for p in points]
+
+def draw_marks(drawing, centre, outer_r, width, from_edge, colour, total=60, only_fives=False, long_fives=False, thick_fives=True, diamond_fives=False):
+    '''
+    straight marks around a ring, roughly like Dial.get_lines_detail
+    '''
+    length = width - from_edge*2
+    for i in range(total):
+        five = i % 5 == 0
+        if only_fives and not five:
+            continue
+        angle = math.pi/2 - i * math.pi*2/total
+        mark_length = length if (five and long_fives) or only_fives else length*0.5
+        mark_width = width*(0.15 if five and thick_fives else 0.06)
+        outer = outer_r - from_edge
+        if five and diamond_fives:
+            points = [(0, outer - length), (mark_width*1.5, outer - length/2), (0, outer), (-mark_width*1.5, outer - length/2)]
+            drawing.add_polygon(transform_points(points, centre, angle), fill=colour, stroke="none")
+            continue
+        start = polar(angle, outer - mark_length)
+        end = polar(angle, outer)
+        drawing.add_line((centre[0] + start[0], centre[1] + start[1]), (centre[0] + end[0], centre[1] + end[1]), mark_width, colour=colour)
+
+def draw_numbers(drawing, centre, outer_r, width, from_edge, colour, numbers, only=None):
+    height = (width - from_edge*2) * 0.7
+    for i, number in enumerate(numbers):
+        if only is not None and i not in only:
+            continue
+        position = polar(math.pi/2 - (i + 1) * math.pi*2/12, outer_r - width/2)
+        drawing.add_text(number, (centre[0] + position[0], centre[1] + position[1]), height, colour=colour)
+
+def draw_dial_style(drawing, style, centre, outer_r, width, from_edge, colour="rgb(0,0,0)"):
+    '''
+    2D approximation of Dial.get_style_for_dial: the right kind of marks in the right places, without the exact shapes
+    '''
+    if style is None or style == DialStyle.EMPTY or width <= 0:
+        return
+    if style in [DialStyle.LINES_ARC, DialStyle.LINES_RECT]:
+        draw_marks(drawing, centre, outer_r, width, from_edge, colour)
+    elif style == DialStyle.LINES_RECT_LONG_INDICATORS:
+        draw_marks(drawing, centre, outer_r, width, from_edge, colour, long_fives=True, thick_fives=False)
+    elif style == DialStyle.LINES_RECT_DIAMONDS_INDICATORS:
+        draw_marks(drawing, centre, outer_r, width, from_edge, colour, long_fives=True, diamond_fives=True)
+    elif style == DialStyle.LINES_INDUSTRIAL:
+        draw_marks(drawing, centre, outer_r, width, 0, colour, long_fives=True)
+        drawing.add_circle(centre, outer_r - width*0.05, fill="none", stroke=colour, stroke_width=width*0.1)
+    elif style == DialStyle.LINES_MAJOR_ONLY:
+        draw_marks(drawing, centre, outer_r, width, from_edge, colour, only_fives=True)
+    elif style in [DialStyle.DOTS, DialStyle.DOTS_MAJOR_ONLY]:
+        for i in range(60):
+            five = i % 5 == 0
+            if style == DialStyle.DOTS_MAJOR_ONLY and not five:
+                continue
+            position = polar(math.pi/2 - i * math.pi*2/60, outer_r - width/2)
+            drawing.add_circle((centre[0] + position[0], centre[1] + position[1]), width*(0.25 if five else 0.1), fill=colour, stroke="none")
+    elif style == DialStyle.CONCENTRIC_CIRCLES:
+        ring_thick = width*0.05
+        drawing.add_circle(centre, outer_r - from_edge - ring_thick/2, fill="none", stroke=colour, stroke_width=ring_thick)
+        drawing.add_circle(centre, outer_r - width + from_edge + ring_thick/2, fill="none", stroke=colour, stroke_width=ring_thick)
+        draw_marks(drawing, centre, outer_r, width, from_edge, colour, long_fives=True, thick_fives=True)
+    elif style == DialStyle.RING:
+        drawing.add_circle(centre, outer_r - width/2, fill="none", stroke=colour, stroke_width=width - from_edge*2)
+    elif style == DialStyle.ROMAN:
+        draw_numbers(drawing, centre, outer_r - width*0.2, width*0.8, from_edge, colour, ROMAN_NUMERALS)
+        drawing.add_circle(centre, outer_r - width*0.1, fill="none", stroke=colour, stroke_width=width*0.02)
+    elif style == DialStyle.ROMAN_NUMERALS:
+        draw_numbers(drawing, centre, outer_r, width, from_edge, colour, ROMAN_NUMERALS)
+    elif style == DialStyle.ARABIC_NUMBERS:
+        draw_numbers(drawing, centre, outer_r, width, from_edge, colour, [str(i) for i in range(1, 13)])
+    elif style == DialStyle.FANCY_WATCH_NUMBERS:
+        draw_numbers(drawing, centre, outer_r, width, from_edge, colour, [str(i) for i in range(1, 13)], only=[2, 5, 8])
+        top = [(0, outer_r - width + from_edge), (width*0.25, outer_r - from_edge), (-width*0.25, outer_r - from_edge)]
+        drawing.add_polygon(transform_points(top, centre, math.pi/2), fill=colour, stroke="none")
+        for i in [1, 2, 4, 5, 7, 8, 10, 11]:
+            angle = math.pi/2 - i * math.pi*2/12
+            start = polar(angle, outer_r - width + from_edge)
+            end = polar(angle, outer_r - from_edge)
+            drawing.add_line((centre[0] + start[0], centre[1] + start[1]), (centre[0] + end[0], centre[1] + end[1]), width*0.2, colour=colour)
+    elif style == DialStyle.TONY_THE_CLOCK:
+        for i in range(4):
+            angle = math.pi/2 - i * math.pi/2
+            start = polar(angle, outer_r - width)
+            end = polar(angle, outer_r - from_edge)
+            drawing.add_line((centre[0] + start[0], centre[1] + start[1]), (centre[0] + end[0], centre[1] + end[1]), width*0.3, colour=colour)
+    else:
+        #unknown style, at least show where the marks would be
+        draw_marks(drawing, centre, outer_r, width, from_edge, colour)
+
+def draw_dial(drawing, dial, centre, fill="rgb(255,255,255)", mark_colour="rgb(0,0,0)"):
+    '''
+    dial with simplified versions of its style, edge styles and (if present) the seconds sub dial, laid out like Dial.make_main_dial_detail
+    '''
+    outer_r = dial.outside_d/2
+    drawing.add_circle(centre, outer_r, fill=fill)
+
+    outer_width = dial.get_edge_style_width(dial.outer_edge_style, outer=True)
+    inner_width = dial.get_edge_style_width(dial.inner_edge_style, outer=False)
+    main_outer_r = outer_r - outer_width
+    main_width = dial.dial_width - outer_width - inner_width
+
+    draw_dial_style(drawing, dial.style, centre, main_outer_r, main_width, dial.dial_detail_from_edges, colour=mark_colour)
+    draw_dial_style(drawing, dial.outer_edge_style, centre, outer_r, outer_width, 0, colour=mark_colour)
+    draw_dial_style(drawing, dial.inner_edge_style, centre, main_outer_r - main_width, inner_width, 0, colour=mark_colour)
+
+    if dial.second_hand_relative_pos is not None and dial.second_hand_mini_dial_d > 0:
+        seconds_centre = (centre[0] + dial.second_hand_relative_pos[0], centre[1] + dial.second_hand_relative_pos[1])
+        seconds_r = dial.second_hand_mini_dial_d/2
+        drawing.add_circle(seconds_centre, seconds_r, fill=fill)
+        draw_dial_style(drawing, dial.seconds_style, seconds_centre, seconds_r, dial.seconds_dial_width, dial.seconds_dial_detail_from_edges, colour=mark_colour)
+
+def get_hand_polygons(style, length, width, base_r):
+    '''
+    rough outline of a hand pointing up, as a list of polygons. Styles are grouped by their overall silhouette, the details are left to the full version
+    '''
+    base = get_circle_points((0, 0), base_r)
+    if style in [HandStyle.SQUARE, HandStyle.SIMPLE, HandStyle.INDUSTRIAL, HandStyle.INDUSTRIAL_THICK]:
+        if style == HandStyle.INDUSTRIAL_THICK:
+            width *= 1.5
+        return [base, [(-width/2, 0), (width/2, 0), (width/2, length), (-width/2, length)]]
+    if style == HandStyle.SIMPLE_ROUND:
+        tip = [(width/2 * math.cos(a * math.pi / 12), length - width/2 + width/2 * math.sin(a * math.pi / 12)) for a in range(13)]
+        return [base, [(-width/2, 0), (width/2, 0)] + tip]
+    if style in [HandStyle.DIAMOND, HandStyle.THIN_DIAMOND]:
+        if style == HandStyle.THIN_DIAMOND:
+            width *= 0.6
+        return [base, [(0, 0), (width, length*0.3), (0, length), (-width, length*0.3)]]
+    if style in [HandStyle.SIMPLE_POINTED, HandStyle.SWORD, HandStyle.SYRINGE, HandStyle.ARROWS, HandStyle.FANCY_WATCH]:
+        return [base, [(-width/2, 0), (width/2, 0), (width/2, length - width*1.5), (0, length), (-width/2, length - width*1.5)]]
+    if style in [HandStyle.BREGUET, HandStyle.MOON, HandStyle.CIRCLES]:
+        #thin hand with a ring (drawn as a filled circle with a hole in it) near the tip
+        ring_r = width*0.8
+        ring_centre = (0, length*0.7)
+        stem = width*0.35
+        return [base, [(-stem/2, 0), (stem/2, 0), (stem/2, length), (0, length + stem), (-stem/2, length)],
+                get_circle_points(ring_centre, ring_r), get_circle_points(ring_centre, ring_r*0.6)]
+    #the ornate styles (spade, cuckoo, baroque, xmas tree...) get a thin hand with a spade shaped widening towards the tip
+    stem = width*0.4
+    return [base, [(-stem/2, 0), (stem/2, 0), (stem/2, length*0.6), (width, length*0.75), (0, length), (-width, length*0.75), (-stem/2, length*0.6)]]
+
+def draw_hand(drawing, polygons, centre, angle, colour, outline=0, outline_colour="rgb(255,255,255)"):
+    '''
+    the outline is a wider copy drawn underneath, like the outline printed around the real hands
+    '''
+    transformed = [transform_points(points, centre, angle) for points in polygons]
+    if outline > 0:
+        for points in transformed:
+            drawing.add_polygon(points, fill=outline_colour, stroke=outline_colour, stroke_width=outline*2)
+    #the ring on breguet style hands is the last two polygons, the inner one is the hole
+    for i, points in enumerate(transformed):
+        fill = colour
+        if len(polygons) == 4 and i == 3:
+            fill = outline_colour if outline > 0 else "rgb(255,255,255)"
+        drawing.add_polygon(points, fill=fill, stroke="none")
+
+def draw_hands(drawing, hands, centre, time_minute=10, time_hour=10, second_centre=None, time_seconds=0, colour="rgb(0,0,0)"):
+    '''
+    hands as simplified outlines of their style, roughly the right length and width (see Hands.get_basic_hand_shape)
+    '''
+    minute_angle = math.pi/2 - time_minute * math.pi*2/60
+    hour_angle = math.pi/2 - (time_hour % 12 + time_minute/60) * math.pi*2/12
+    outline_colour = get_svg_colour(hands.outline_colour, default="rgb(255,255,255)")
+    width = hands.length*0.1
+    base_r = hands.length*0.12
+    hour_style = hands.hour_style_override if hands.hour_style_override is not None else hands.style
+    draw_hand(drawing, get_hand_polygons(hour_style, hands.length*0.8, width, base_r), centre, hour_angle, colour, outline=hands.outline, outline_colour=outline_colour)
+    draw_hand(drawing, get_hand_polygons(hands.style, hands.length, width, base_r), centre, minute_angle, colour, outline=hands.outline, outline_colour=outline_colour)
+    if second_centre is not None:
+        second_angle = math.pi/2 - time_seconds * math.pi*2/60
+        second_style = hands.second_style_override if hands.second_style_override is not None else hands.style
+        second_length = hands.length if hands.second_hand_centred else hands.second_length
+        second_base_r = hands.second_fixing_d*2 if hands.second_hand_centred else hands.second_length*0.15
+        draw_hand(drawing, get_hand_polygons(second_style, second_length, hands.length*0.05, second_base_r), second_centre, second_angle, colour,
+                  outline=hands.outline_on_seconds, outline_colour=outline_colour)
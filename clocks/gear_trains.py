@@ -6,6 +6,7 @@ from .gearing import *
 from .escapements import *
 from .dial import *
 import math
+import time
 import numpy as np
 
 '''
@@ -503,7 +504,8 @@ class GoingTrain(GearTrainBase):
     '''
 
     def calculate_ratios(self, module_reduction=0.85, min_pinion_teeth=10, max_wheel_teeth=100, pinion_max_teeth=20, wheel_min_teeth=50,
-                         max_error=0.1, loud=False, penultimate_wheel_min_ratio=0, favour_smallest=True, allow_integer_ratio=False, constraint=None):
+                         max_error=0.1, loud=False, penultimate_wheel_min_ratio=0, favour_smallest=True, allow_integer_ratio=False, constraint=None,
+                         progress_callback=None):
         '''
         Returns and stores a list of possible gear ratios, sorted in order of "best" to worst
         module reduction used to calculate smallest possible wheels - assumes each wheel has a smaller module than the last
@@ -512,8 +514,18 @@ class GoingTrain(GearTrainBase):
 
         now favours a low standard deviation of number of teeth on the wheels - this should stop situations where we get a giant first wheel and tiny final wheels (and tiny escape wheel)
         This is slow, but seems to work well
+
+        progress_callback: optional function(stage, fraction) called as the search progresses, stage is "train_options" while building the list of
+        trains and "train_evaluation" while evaluating them. fraction is 0-1. Called as often as the loud output is printed
         '''
 
+        def report_progress(stage, fraction, message):
+            #message is formatted with the percentage here, and only if it's going to be printed
+            if loud:
+                print(message.format(100 * fraction), end='')
+            if progress_callback is not None:
+                progress_callback(stage, fraction)
+
         pinion_min = min_pinion_teeth
         pinion_max = pinion_max_teeth
         wheel_min = wheel_min_teeth
@@ -567,8 +579,8 @@ class GoingTrain(GearTrainBase):
                 # using a different set of combinations that will force the penultimate wheel to rotate at 1 rpm
                 valid_combos = all_seconds_wheel_combos
             for pair in range(len(valid_combos)):
-                if loud and pair % 10 == 0 and pair_index == 0:
-                    print("\r{:.1f}% of calculating train options".format(100 * pair / allcombo_count), end='')
+                if pair % 10 == 0 and pair_index == 0:
+                    report_progress("train_options", pair / allcombo_count, "\r{:.1f}% of calculating train options")
 
                 all_pairs = previous_pairs + [valid_combos[pair]]
                 if final_pair:
@@ -584,8 +596,8 @@ class GoingTrain(GearTrainBase):
         all_times = []
         total_trains = len(all_trains)
         for c in range(total_trains):
-            if loud and c % 100 == 0:
-                print("\r{:.1f}% of trains evaluated".format(100 * c / total_trains), end='')
+            if c % 100 == 0:
+                report_progress("train_evaluation", c / total_trains, "\r{:.1f}% of trains evaluated")
             total_ratio = 1
             int_ratio = False
             total_teeth = 0
@@ -1886,9 +1898,17 @@ class GearLayout2D:
             GearTrainLayout.VERTICAL_COMPACT : GearLayout2D.get_compact_vertical_layout,
             GearTrainLayout.COMPACT: GearLayout2D.get_compact_layout,
             GearTrainLayout.COMPACT_CENTRE_SECONDS: GearLayout2DCentreSeconds,
+            GearTrainLayout.OPTIMISED: GearLayout2D.get_optimised_layout,
         }
         return layouts[layout](going_train, **kwargs)
 
+    @staticmethod
+    def get_optimised_layout(going_train, **kwargs):
+        '''
+        Search for the most compact layout, see GearLayout2DOptimised
+        '''
+        return GearLayout2DOptimised(going_train, **kwargs)
+
     @staticmethod
     def get_vertical_layout(going_train, **kwargs):
         '''
@@ -2013,7 +2033,6 @@ class GearLayout2D:
         but we can configure which gears are actually on the vertical line
         '''
         total_arbors = self.going_train.total_arbors
-        positions_relative = [(0, 0) for i in range(total_arbors)]
         arbors = self.going_train.get_all_arbors()
         # anchor_index = -1
         # escape_wheel_index = -2
@@ -2026,6 +2045,19 @@ class GearLayout2D:
         last_offset_side = on_side
         last_centred_arbor = 0
 
+        def get_pinion_bound_r(index):
+            #largest radius check_valid_position could consider for this arbor's pinion
+            if index == 0:
+                #index 0 doesn't have a pinion, leave it out of the index
+                return None
+            if index in self.can_ignore_pinions or (arbors[index].pinion is None and arbors[index].lantern_pinion is None):
+                return arbors[index].get_arbor_extension_r()
+            return max(arbors[index].get_pinion_max_radius(), arbors[index].get_arbor_extension_r())
+
+        #pinions of every arbor, built once and only the entries that move are updated as positions_relative is assigned
+        pinion_index = CircleCollisionIndex()
+        positions_relative = CollisionIndexedPositions([(0, 0) for i in range(total_arbors)], pinion_index, get_pinion_bound_r)
+
         def check_valid_position(check_index, check_until=-1):
             '''
             returns {valid: bool, clash_index: int, clash_distance: float}
@@ -2044,21 +2076,18 @@ class GearLayout2D:
                 'clash_distance': -1.0,
                 'clash_min_distance': -1.0
             }
-            for i in range(1, check_until):
-                if i == check_index - 1 or i == check_index + 1 or i == check_index:
-                    #meshes with this one or is this one
-                    continue
-                # index 0 doesn't have a pinion, just skip it
-                #ignore the pinion if either arbor has a pinion extension, basically assuming we won't clash
-                ignore_pinion = i in self.can_ignore_pinions or check_index in self.can_ignore_pinions
-                distance = get_distance_between_two_points(positions_relative[i], positions_relative[check_index])
-                min_distance = arbors[check_index].get_max_radius() + get_pinion_r(i, ignore_pinion) + self.gear_gap
-                if distance < min_distance:
-                    result['valid'] = False
-                    result['clash_distance'] = distance
-                    result['clash_min_distance'] = min_distance
-                    result['clash_index'] = i
-                    break
+            # index 0 doesn't have a pinion, just skip it. Arbors from check_until onwards haven't been placed yet
+            ignore = set([0, check_index - 1, check_index, check_index + 1] + list(range(check_until, total_arbors)))
+            #ignore the pinion if either arbor has a pinion extension, basically assuming we won't clash
+            ignore_pinion = check_index in self.can_ignore_pinions
+            clashes = pinion_index.get_clashes(positions_relative[check_index], arbors[check_index].get_max_radius(), gap=self.gear_gap, ignore=ignore,
+                                               get_radius=lambda i: get_pinion_r(i, ignore_pinion))
+            if len(clashes) > 0:
+                #lowest index first, as before
+                result['valid'] = False
+                result['clash_distance'] = clashes[0]['distance']
+                result['clash_min_distance'] = clashes[0]['min_distance']
+                result['clash_index'] = clashes[0]['key']
             return result
 
 
@@ -2234,7 +2263,7 @@ class GearLayout2D:
                 last_centred_arbor = next_centred_index
 
 
-        return positions_relative
+        return list(positions_relative)
 
     def get_demo(self):
         demo = cq.Workplane("XY")
@@ -2243,6 +2272,207 @@ class GearLayout2D:
         return demo
 
 
+class GearLayout2DOptimised(GearLayout2D):
+    '''
+    Searches the angles between arbors for the layout with the smallest plate (height or bounding area), rather than taking the first arrangement
+    that works. Meshing arbors are always exactly their mesh distance apart, centred_arbors always have x=0, and every pair of arbors that don't mesh
+    must be gear_gap clear of each other (using the same wheel vs pinion rules as GearLayout2D).
+
+    The search is a simple seeded evolutionary search over a population of candidate layouts evaluated together with numpy, so it's deterministic
+    for a given seed and only takes a second or so for 6-8 arbors. If the standard GearLayout2D layout is valid and better, that is used instead.
+    '''
+    def __init__(self, going_train, minimise="height", seed=0, population=256, generations=150, **kwargs):
+        '''
+        minimise: "height" or "area" of the bounding box around all the wheels
+        seed: for the random number generator, so the same train always gets the same layout
+        other arguments as GearLayout2D
+        '''
+        super().__init__(going_train, **kwargs)
+        if minimise not in ["height", "area"]:
+            raise ValueError("Can't minimise {}".format(minimise))
+        self.minimise = minimise
+        self.seed = seed
+        self.population = population
+        self.generations = generations
+        self.positions_cache = None
+
+        n = self.total_arbors
+        self.distances = np.array([arbor.distance_to_next_arbor for arbor in self.arbors[:-1]], dtype=float)
+        self.max_radii = np.array([self.arbors[i].get_arbor_extension_r() if i in self.can_ignore_wheels else self.arbors[i].get_max_radius() for i in range(n)], dtype=float)
+
+        #minimum distance between every pair of arbors that don't mesh, wheel of one against the pinion of the other (whichever is worse)
+        self.min_distances = np.zeros((n, n))
+        for i in range(n):
+            for j in range(n):
+                if abs(i - j) <= 1:
+                    continue
+                if i == 0 or j == 0:
+                    # index 0 doesn't have a pinion, but there's still the arbor
+                    other = j if i == 0 else i
+                    self.min_distances[i][j] = self.max_radii[other] + self.arbors[0].get_arbor_extension_r() + self.gear_gap
+                    continue
+                ignore_pinion = i in self.can_ignore_pinions or j in self.can_ignore_pinions
+                pinion_r = [self.arbors[k].get_arbor_extension_r() if ignore_pinion else self.arbors[k].get_pinion_max_radius() for k in [i, j]]
+                self.min_distances[i][j] = max(self.max_radii[i] + pinion_r[1], self.max_radii[j] + pinion_r[0]) + self.gear_gap
+
+        #break the train into segments between consecutive centred arbors. Arbors between them are placed by angle, apart from the last one which
+        #has to mesh with both its neighbours
+        centred = sorted(set(self.centred_arbors + [0]))
+        self.segments = []
+        self.param_count = 0
+        for a, b in zip(centred[:-1], centred[1:]):
+            params = 0 if b - a == 1 else (b - a - 2) + 2
+            self.segments.append((a, b, self.param_count, params))
+            self.param_count += params
+        #anything after the last centred arbor is free
+        self.trailing_start = centred[-1]
+        self.trailing_param_offset = self.param_count
+        self.param_count += n - 1 - centred[-1]
+
+    def get_random_params(self, rng, count):
+        params = np.zeros((count, self.param_count))
+        for a, b, offset, param_count in self.segments:
+            if param_count == 0:
+                continue
+            angles = param_count - 2
+            params[:, offset:offset + angles] = rng.uniform(0, math.pi, (count, angles))
+            params[:, offset + angles] = rng.uniform(0, 1, count)
+            params[:, offset + angles + 1] = rng.uniform(-1, 1, count)
+        params[:, self.trailing_param_offset:] = rng.uniform(0, math.pi, (count, self.param_count - self.trailing_param_offset))
+        return params
+
+    def get_positions_from_params(self, params):
+        '''
+        params is (candidates, param_count). returns (positions (candidates, arbors, 2), infeasibility (candidates))
+        '''
+        count = params.shape[0]
+        positions = np.zeros((count, self.total_arbors, 2))
+        infeasible = np.zeros(count)
+        d = self.distances
+        for a, b, offset, param_count in self.segments:
+            if param_count == 0:
+                positions[:, b, 0] = 0
+                positions[:, b, 1] = positions[:, a, 1] + d[a]
+                continue
+            angles = param_count - 2
+            for k in range(angles):
+                angle = params[:, offset + k]
+                positions[:, a + 1 + k] = positions[:, a + k] + d[a + k] * np.stack([np.cos(angle), np.sin(angle)], axis=1)
+            #the next centred arbor somewhere above, no higher than the whole chain stretched out
+            height = np.clip(params[:, offset + angles], 0, 1) * np.sum(d[a:b])
+            positions[:, b, 0] = 0
+            positions[:, b, 1] = positions[:, a, 1] + height
+            #last arbor before the centred arbor must mesh with both its neighbours: intersection of two circles
+            last = b - 1
+            p0 = positions[:, last - 1]
+            r0 = d[last - 1]
+            r1 = d[last]
+            between = positions[:, b] - p0
+            between_distance = np.maximum(np.linalg.norm(between, axis=1), 1e-9)
+            along = (r0**2 - r1**2 + between_distance**2) / (2 * between_distance)
+            h_squared = r0**2 - along**2
+            infeasible += np.sqrt(np.maximum(-h_squared, 0))
+            h = np.sqrt(np.maximum(h_squared, 0))
+            unit = between / between_distance[:, None]
+            perpendicular = np.stack([-unit[:, 1], unit[:, 0]], axis=1)
+            side = np.where(params[:, offset + angles + 1] >= 0, 1, -1)
+            positions[:, last] = p0 + unit * along[:, None] + perpendicular * (side * h)[:, None]
+
+        for k, i in enumerate(range(self.trailing_start, self.total_arbors - 1)):
+            angle = params[:, self.trailing_param_offset + k]
+            positions[:, i + 1] = positions[:, i] + d[i] * np.stack([np.cos(angle), np.sin(angle)], axis=1)
+
+        return positions, infeasible
+
+    def get_scores(self, positions, infeasible=None):
+        '''
+        returns (score, penalty) for each candidate in positions (candidates, arbors, 2). Lower is better, penalty of zero is a valid layout
+        '''
+        if infeasible is None:
+            infeasible = np.zeros(positions.shape[0])
+        differences = positions[:, :, None, :] - positions[:, None, :, :]
+        distances = np.linalg.norm(differences, axis=3)
+        clashes = np.sum(np.maximum(self.min_distances[None, :, :] - distances, 0), axis=(1, 2)) / 2
+
+        #nothing below the powered wheel (where the weight or spring is) and the anchor on top so the pendulum can hang down
+        below = np.sum(np.maximum(positions[:, 0, 1][:, None] - positions[:, 1:, 1], 0), axis=1)
+        above_anchor = np.maximum(np.max(positions[:, :-1, 1], axis=1) - positions[:, -1, 1], 0)
+
+        penalty = clashes + below + above_anchor + infeasible
+
+        min_x = np.min(positions[:, :, 0] - self.max_radii[None, :], axis=1)
+        max_x = np.max(positions[:, :, 0] + self.max_radii[None, :], axis=1)
+        min_y = np.min(positions[:, :, 1] - self.max_radii[None, :], axis=1)
+        max_y = np.max(positions[:, :, 1] + self.max_radii[None, :], axis=1)
+        width = max_x - min_x
+        height = max_y - min_y
+        if self.minimise == "height":
+            #prefer narrower layouts of the same height
+            objective = height + width * 0.01
+        else:
+            objective = width * height
+
+        return objective + penalty * 1000, penalty
+
+    def search(self):
+        '''
+        the evolutionary search on its own, without falling back to the standard layout.
+        returns (positions, score, penalty) of the best layout found
+        '''
+        rng = np.random.default_rng(self.seed)
+        elite_count = max(self.population // 8, 1)
+
+        params = self.get_random_params(rng, self.population)
+        best_params = None
+        best_score = None
+        for generation in range(self.generations):
+            positions, infeasible = self.get_positions_from_params(params)
+            scores, penalties = self.get_scores(positions, infeasible)
+            order = np.argsort(scores, kind="stable")
+            elites = params[order[:elite_count]]
+            if best_score is None or scores[order[0]] < best_score:
+                best_score = scores[order[0]]
+                best_params = params[order[0]].copy()
+
+            #mutate the elites, with smaller steps as we go
+            spread = 0.5 * (1 - generation / self.generations) + 0.005
+            parents = elites[rng.integers(0, elite_count, self.population - elite_count)]
+            children = parents + rng.normal(0, spread, parents.shape)
+            #some fresh blood to avoid getting stuck
+            fresh_count = self.population // 16
+            children[:fresh_count] = self.get_random_params(rng, fresh_count)
+            params = np.concatenate([elites, children])
+
+        positions, infeasible = self.get_positions_from_params(best_params[None, :])
+        score, penalty = self.get_scores(positions, infeasible)
+
+        return [(float(x), float(y)) for x, y in positions[0]], score[0], penalty[0]
+
+    def get_positions(self):
+        if self.positions_cache is not None:
+            return self.positions_cache
+
+        start = time.time()
+        best_positions, score, penalty = self.search()
+        try:
+            standard_positions = super().get_positions()
+            standard_score, standard_penalty = self.get_scores(np.array([[position[:2] for position in standard_positions]], dtype=float))
+            if standard_penalty[0] < 1e-6 and (penalty >= 1e-6 or standard_score[0] <= score):
+                print("Standard layout is better than the optimised layout")
+                best_positions = standard_positions
+                penalty = standard_penalty[0]
+        except (NotImplementedError, ValueError, AttributeError, IndexError) as e:
+            #unsupported arrangement of centred arbors, circles which don't intersect, or an arbor missing the wheel/pinion the standard layout expects
+            print("Standard layout failed: {}".format(e))
+
+        if penalty >= 1e-6:
+            print("Warning: unable to find a valid optimised gear layout, arbors may clash (penalty {:.3f})".format(penalty))
+        print("Optimised gear layout in {:.2f}s".format(time.time() - start))
+
+        self.positions_cache = best_positions
+        return best_positions
+
+
 class GearLayout2DCentreSeconds(GearLayout2D):
     def get_positions(self):
         '''
@@ -125,6 +125,28 @@ def get_stroke_arc(from_pos, to_pos, radius, wide, thick, style=StrokeStyle.ROUN
         # for pos in [from_pos, to_pos]:
         #     arc = arc.union(cq.Workplane("XY").moveTo(pos[0], pos[1]).circle(wide/2).extrude(thick))
 
+def get_turning_point_indices(turns, max_turn_angle):
+    '''
+    turns: how much a line turns at each of its points (radians)
+    returns the indices of the points to keep so the line turns by about max_turn_angle between each kept point (always keeping the ends),
+    so straight bits get few points and tight curves get lots
+    '''
+    cumulative = np.cumsum(np.abs(turns))
+    indices = np.searchsorted(cumulative, np.arange(max_turn_angle, cumulative[-1], max_turn_angle))
+    return np.unique(np.concatenate(([0], indices, [len(turns) - 1]))).astype(int)
+
+def simplify_points_by_curvature(points, max_turn_angle):
+    '''
+    drop points from a line of points where it's nearly straight, see get_turning_point_indices
+    '''
+    if len(points) < 3:
+        return list(points)
+    array = np.asarray(points, dtype=float)[:, :2]
+    directions = np.diff(array, axis=0)
+    headings = np.unwrap(np.arctan2(directions[:, 1], directions[:, 0]))
+    turns = np.concatenate(([0], np.diff(headings), [0]))
+    return [points[i] for i in get_turning_point_indices(turns, max_turn_angle)]
+
 class ArithmeticSpiral:
     def __init__(self, r, start_pos=None, x_scale=1, y_scale=1, start_angle=0, power=1, clockwise=False):
         '''
@@ -139,63 +161,85 @@ class ArithmeticSpiral:
         self.start_angle = start_angle
         self.power = power
         self.clockwise = clockwise
-    def get_pos(self, angle):
 
-        dir = 1
-        if self.clockwise:
-            dir = -1
+    def get_positions(self, angles):
+        '''
+        get_pos for lots of angles at once, returns an array of (x,y)
+        '''
+        angles = np.asarray(angles, dtype=float)
+        dir = -1 if self.clockwise else 1
 
-        r = self.r * (dir*angle + self.start_angle)/(math.pi*2)
+        r = self.r * (dir*angles + self.start_angle)/(math.pi*2)
         r = r ** self.power
-        pos = polar(angle, r)
 
-        return (pos[0]*self.x_scale + self.start_pos[0], pos[1] * self.y_scale + self.start_pos[1])
+        return np.column_stack((r * np.cos(angles) * self.x_scale + self.start_pos[0], r * np.sin(angles) * self.y_scale + self.start_pos[1]))
 
-    def get_tangent(self, angle):
-        if self.clockwise:
-            pre_pos = self.get_pos(angle + 0.01)
-            post_pos = self.get_pos(angle - 0.01)
-        else:
-            pre_pos = self.get_pos(angle - 0.01)
-            post_pos = self.get_pos(angle + 0.01)
-        line = Line(pre_pos, another_point=post_pos)
-        return line.dir
+    def get_pos(self, angle):
+        return np_to_set(self.get_positions([angle])[0].tolist())
 
-    def get_draw_info(self, from_angle, to_angle, points_per_spiral=15):
-        spiral_points = []
-        spiral_directions = []
+    def get_tangents(self, angles):
+        '''
+        get_tangent for lots of angles at once, returns an array of unit (x,y)
+        '''
+        angles = np.asarray(angles, dtype=float)
+        step = -0.01 if self.clockwise else 0.01
+        tangents = self.get_positions(angles + step) - self.get_positions(angles - step)
+        return tangents / np.linalg.norm(tangents, axis=1)[:, np.newaxis]
 
-        spirals = abs(from_angle - to_angle)/(math.pi*2)
+    def get_tangent(self, angle):
+        return np_to_set(self.get_tangents([angle])[0].tolist())
 
+    def get_draw_angles(self, from_angle, to_angle, points_per_spiral=15, max_turn_angle=None, min_length=0):
+        '''
+        evenly spaced points_per_spiral, or if max_turn_angle is provided space them by how tightly the spiral is curving.
+        The spiral turns fastest near its centre, so min_length stops the points there being closer together than that (eg the width of the line)
+        '''
         clockwise = 1 if from_angle < to_angle else -1
+        spirals = abs(from_angle - to_angle)/(math.pi*2)
 
-        for i in range(math.ceil(points_per_spiral*spirals) + 1):
-            angle =from_angle + clockwise*i*math.pi*2/points_per_spiral
-            pos = self.get_pos(angle)
-            dir = self.get_tangent(angle)
-            spiral_points.append(pos)
-            spiral_directions.append(dir)
+        if max_turn_angle is None:
+            return from_angle + clockwise * np.arange(math.ceil(points_per_spiral*spirals) + 1) * math.pi*2/points_per_spiral
+
+        #sample finely then only keep enough points to follow the curve
+        angles = np.linspace(from_angle, to_angle, max(math.ceil(spirals * 360), 2) + 1)
+        tangents = self.get_tangents(angles)
+        headings = np.unwrap(np.arctan2(tangents[:, 1], tangents[:, 0]))
+        turns = np.concatenate(([0], np.diff(headings)))
+        angles = angles[get_turning_point_indices(turns, max_turn_angle)]
+        if min_length > 0:
+            positions = self.get_positions(angles)
+            keep = [0]
+            for i in range(1, len(angles) - 1):
+                if np.linalg.norm(positions[i] - positions[keep[-1]]) >= min_length and np.linalg.norm(positions[-1] - positions[i]) >= min_length:
+                    keep.append(i)
+            keep.append(len(angles) - 1)
+            angles = angles[keep]
+        return angles
+
+    def get_draw_info(self, from_angle, to_angle, points_per_spiral=15, max_turn_angle=None, min_length=0):
+        angles = self.get_draw_angles(from_angle, to_angle, points_per_spiral, max_turn_angle, min_length)
 
         return {
-            "points": spiral_points,
-            "tangents": spiral_directions
+            "points": [np_to_set(pos) for pos in self.get_positions(angles).tolist()],
+            "tangents": [np_to_set(dir) for dir in self.get_tangents(angles).tolist()]
         }
 
-    def draw(self, from_angle, to_angle, wide, thick, points_per_spiral=15):
-        info = self.get_draw_info(from_angle, to_angle, points_per_spiral)
+    def draw(self, from_angle, to_angle, wide, thick, points_per_spiral=15, max_turn_angle=None):
+        #get_stroke_curve struggles with curves shorter than they are wide
+        info = self.get_draw_info(from_angle, to_angle, points_per_spiral, max_turn_angle, min_length=wide)
         spiral_points = info["points"]
         spiral_directions = info["tangents"]
 
-        twirly = cq.Workplane("XY")
+        twirly = BooleanBuilder()
 
         for i in range(len(spiral_points)-1):
             from_pos = spiral_points[i]
             from_dir = spiral_directions[i ]
             to_pos = spiral_points[i + 1]
             to_dir = spiral_directions[(i+1)]
-            twirly = twirly.union(get_stroke_curve(from_pos, to_pos, from_dir, to_dir, wide, thick))
+            twirly.add(get_stroke_curve(from_pos, to_pos, from_dir, to_dir, wide, thick))
 
-        return twirly
+        return twirly.get_shape()
 
 
 def get_stroke_curve(start, end, start_dir, end_dir, wide, thick, style=StrokeStyle.SQUARE):
@@ -203,60 +247,172 @@ def get_stroke_curve(start, end, start_dir, end_dir, wide, thick, style=StrokeSt
     this doesn't actually work in many cases :(
     '''
 
-    start_line = Line(start, direction=start_dir)
-    
-    start_clockwise_dir = start_line.get_perpendicular_direction(clockwise=True)
-    start_anticlockwise_dir = start_line.get_perpendicular_direction(clockwise=False)
-    
-    start_clockwise_pos = np_to_set(np.add(start, np.multiply(start_clockwise_dir, wide/2)))
-    start_anticlockwise_pos = np_to_set(np.add(start, np.multiply(start_anticlockwise_dir, wide / 2)))
-
-    end_line = Line(end, direction=end_dir)
+    centres = np.array([start[:2], end[:2]], dtype=float)
+    dirs = np.array([start_dir[:2], end_dir[:2]], dtype=float)
+    dirs = dirs / np.linalg.norm(dirs, axis=1)[:, np.newaxis]
+    #clockwise perpendicular to the direction at each end
+    offsets = np.column_stack((dirs[:, 1], -dirs[:, 0])) * wide/2
 
-    end_clockwise_dir = end_line.get_perpendicular_direction(clockwise=True)
-    end_anticlockwise_dir = end_line.get_perpendicular_direction(clockwise=False)
-
-    end_clockwise_pos = np_to_set(np.add(end, np.multiply(end_clockwise_dir, wide / 2)))
-    end_anticlockwise_pos = np_to_set(np.add(end, np.multiply(end_anticlockwise_dir, wide / 2)))
+    (start_clockwise_pos, end_clockwise_pos) = [np_to_set(pos) for pos in (centres + offsets).tolist()]
+    (start_anticlockwise_pos, end_anticlockwise_pos) = [np_to_set(pos) for pos in (centres - offsets).tolist()]
 
     curve = cq.Workplane("XY").spline([start_clockwise_pos, end_clockwise_pos], tangents=[start_dir, end_dir]).lineTo(end_anticlockwise_pos[0], end_anticlockwise_pos[1]).spline([end_anticlockwise_pos, start_anticlockwise_pos], tangents=[backwards_vector(end_dir), backwards_vector(start_dir)]).close().extrude(thick)
 
     if style == StrokeStyle.ROUND:
+        curve = BooleanBuilder(curve)
         for pos in [start, end]:
-            curve = curve.union(cq.Workplane("XY").circle(wide/2).extrude(thick).translate(pos))
+            curve.add(cq.Workplane("XY").circle(wide/2).extrude(thick).translate(pos))
+        curve = curve.get_shape()
 
     return curve
     
 
-def get_stroke_line(original_points, wide, thick, style=StrokeStyle.ROUND, loop=False):
+def get_stroke_line(original_points, wide, thick, style=StrokeStyle.ROUND, loop=False, max_turn_angle=None):
+    '''
+    max_turn_angle: if provided, leave out points where the line is nearly straight (see simplify_points_by_curvature), useful for finely sampled curves
+    '''
+
+    points = list(original_points)
 
-    points = original_points.copy()
+    if max_turn_angle is not None:
+        points = simplify_points_by_curvature(points, max_turn_angle)
 
     if loop:
-        points.append(original_points[0])
+        points.append(points[0])
 
-    line = cq.Workplane("XY")
+    line = BooleanBuilder()
 
-    for i, point in enumerate(points):
-        if i > len(points) - 2:
-            break
-        next_point = points[i+1]
+    #all the segments at once
+    array = np.asarray([point[:2] for point in points], dtype=float)
+    deltas = np.diff(array, axis=0)
+    lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+    angles = np.degrees(np.arctan2(deltas[:, 1], deltas[:, 0]) + math.pi/2)
+    centres = (array[:-1] + array[1:]) / 2
 
-        angle = math.atan2(next_point[1] - point[1], next_point[0] - point[0]) + math.pi/2
-        centre = ((point[0] + next_point[0])/2, (point[1] + next_point[1])/2)
-        length = np.linalg.norm(np.subtract(next_point, point))
-        line = line.union(cq.Workplane("XY").rect(wide,length).extrude(thick).rotate((0,0,0), (0,0,1), rad_to_deg(angle)).translate(centre))
-        if style == StrokeStyle.ROUND:
+    for length, angle, centre in zip(lengths.tolist(), angles.tolist(), centres.tolist()):
+        if length == 0:
+            continue
+        line.add(cq.Workplane("XY").rect(wide,length).extrude(thick).rotate((0,0,0), (0,0,1), angle).translate(tuple(centre)))
+
+    if style == StrokeStyle.ROUND:
+        #the same circle at every point (capping off both ends)
+        cap = cq.Workplane("XY").circle(wide/2).extrude(thick).val()
+        for point in points[:-1] if loop else points:
+            line.add(cap.moved(cq.Location(cq.Vector(*point))))
+
+    return line.get_shape()
+
+def get_instanced_shapes(instances):
+    '''
+    Place copies of shapes without copying their geometry: each copy shares the underlying shape and just has its own location (a TopLoc_Location),
+    so lots of identical marks (eg the 60 lines on a dial) only need building once and are quick to mesh and export.
+
+    instances: list of (shape, angle_deg, (x,y,z)) where shape is a Workplane or Shape. Each copy is rotated about the z axis through the origin and then translated
+    returns a Workplane with a single compound
+    '''
+    shapes = []
+    for shape, angle_deg, pos in instances:
+        if isinstance(shape, cq.Workplane):
+            shape = shape.val()
+        shapes.append(shape.moved(cq.Location(cq.Vector(pos), cq.Vector(0, 0, 1), angle_deg)))
+    return cq.Workplane("XY").add(cq.Compound.makeCompound(shapes))
+
+class BooleanBuilder:
+    '''
+    Collects solids to add to and cut from a shape, then applies them all with a single multi-argument fuse followed by a single
+    multi-argument cut (OCCT's general fuse), rather than one boolean per feature. Each sequential union or cut re-processes the
+    whole growing solid, which gets very slow for plates with lots of arms, bearings and screw holes.
+
+    Cuts are always applied after all the additions, so a hole is never filled back in by a later addition.
+
+    If the batched boolean fails (OCCT can be fussy) it falls back to the old one-at-a-time approach, skipping any tool that fails.
+    '''
+    def __init__(self, base=None):
+        '''
+        base: optional cq.Workplane or cq.Shape to start from
+        '''
+        self.base = base
+        self.additions = []
+        self.cutters = []
+
+    def add(self, shape):
+        if shape is not None:
+            self.additions.append(shape)
+        return self
+
+    def cut(self, shape):
+        if shape is not None:
+            self.cutters.append(shape)
+        return self
+
+    @staticmethod
+    def get_solids(thing):
+        '''
+        all the solids (or compounds) in a workplane or shape, ignoring any construction geometry on the stack
+        '''
+        if thing is None:
+            return []
+        if isinstance(thing, cq.Workplane):
+            return [val for val in thing.vals() if isinstance(val, (cq.Solid, cq.Compound))]
+        return [thing]
+
+    def get_shape(self):
+        '''
+        returns a cq.Workplane with the result
+        '''
+        base_shapes = self.get_solids(self.base)
+        shapes = base_shapes.copy()
+        for addition in self.additions:
+            shapes += self.get_solids(addition)
+        tools = []
+        for cutter in self.cutters:
+            tools += self.get_solids(cutter)
+
+        if len(shapes) == 0:
+            return cq.Workplane("XY")
+
+        shape = shapes[0]
+        if len(shapes) == len(base_shapes) and len(shapes) > 1:
+            #nothing to add, leave separate solids separate (eg text)
+            shape = cq.Compound.makeCompound(shapes)
+        elif len(shapes) > 1:
             try:
-                line = line.union(cq.Workplane("XY").circle(wide/2).extrude(thick).translate(point))
+                shape = shapes[0].fuse(*shapes[1:]).clean()
             except:
-                print(f"Failed to add circle on stroke line at {point}")
+                print("Batched fuse failed, falling back to one at a time")
+                shape = self.fuse_one_at_a_time(shapes)
 
-    if style == StrokeStyle.ROUND:
-        #cap off the end
-        line = line.union(cq.Workplane("XY").circle(wide / 2).extrude(thick).translate(points[-1]))
+        if len(tools) > 0:
+            try:
+                shape = shape.cut(*tools)
+            except:
+                print("Batched cut failed, falling back to one at a time")
+                shape = self.cut_one_at_a_time(shape, tools)
+
+        return cq.Workplane("XY").add(shape)
 
-    return line
+    @staticmethod
+    def fuse_one_at_a_time(shapes):
+        result = cq.Workplane("XY").add(shapes[0])
+        for shape in shapes[1:]:
+            try:
+                result = result.union(shape)
+            except:
+                try:
+                    result = result.union(shape, clean=False)
+                except:
+                    print("Failed to add shape")
+        return result.val()
+
+    @staticmethod
+    def cut_one_at_a_time(shape, tools):
+        result = cq.Workplane("XY").add(shape)
+        for tool in tools:
+            try:
+                result = result.cut(tool)
+            except:
+                print("Failed to cut shape")
+        return result.val()
 
 def get_angle_of_chord(radius, chord_length):
     '''
@@ -377,4 +533,359 @@ def get_point_two_circles_intersect(pos0, distance0, pos1, distance1, anticlockw
 def get_incircle_for_regular_polygon(outer_radius, sides):
     polygon_side_length = 2 * outer_radius * math.sin(math.pi / sides)
     incircle_radius = polygon_side_length / (2 * math.tan(math.pi/sides))
-    return incircle_radius
\ No newline at end of file
+    return incircle_radius
+
+def get_polygon_mass_properties(points):
+    '''
+    Mass properties of a simple 2D polygon (list of (x,y), either winding), treating it as a uniform sheet of unit thickness.
+    Uses the shoelace formula over all the edges at once, so a finely sampled outline costs next to nothing.
+
+    returns {
+    "area": area,
+    "centroid": (x,y),
+    "first_moment": (integral of x dA, integral of y dA), - so the moment of a hand pointing along +y about its axle is first_moment[1]
+    "second_moment": (integral of x^2 dA, integral of y^2 dA, integral of xy dA) about the origin
+    }
+    '''
+    points = np.asarray(points, dtype=float)[:, :2]
+    x = points[:, 0]
+    y = points[:, 1]
+    x_next = np.roll(x, -1)
+    y_next = np.roll(y, -1)
+    cross = x * y_next - x_next * y
+
+    area = np.sum(cross) / 2
+    first_moment_x = np.sum((x + x_next) * cross) / 6
+    first_moment_y = np.sum((y + y_next) * cross) / 6
+    second_moment_xx = np.sum((x * x + x * x_next + x_next * x_next) * cross) / 12
+    second_moment_yy = np.sum((y * y + y * y_next + y_next * y_next) * cross) / 12
+    second_moment_xy = np.sum((x * y_next + 2 * x * y + 2 * x_next * y_next + x_next * y) * cross) / 24
+
+    if area < 0:
+        #clockwise
+        area, first_moment_x, first_moment_y, second_moment_xx, second_moment_yy, second_moment_xy = (
+            -area, -first_moment_x, -first_moment_y, -second_moment_xx, -second_moment_yy, -second_moment_xy)
+
+    return get_mass_properties_from_moments(area, (first_moment_x, first_moment_y), (second_moment_xx, second_moment_yy, second_moment_xy))
+
+def get_mass_properties_from_moments(area, first_moment, second_moment):
+    centroid = (0, 0)
+    if area != 0:
+        centroid = (first_moment[0] / area, first_moment[1] / area)
+    return {
+        "area": float(area),
+        "centroid": (float(centroid[0]), float(centroid[1])),
+        "first_moment": (float(first_moment[0]), float(first_moment[1])),
+        "second_moment": (float(second_moment[0]), float(second_moment[1]), float(second_moment[2]))
+    }
+
+def get_circle_mass_properties(centre, r):
+    '''
+    exact version of get_polygon_mass_properties for a circle
+    '''
+    area = math.pi * r ** 2
+    #parallel axis theorem, about the centre integral of x^2 dA is pi r^4/4
+    own = math.pi * r ** 4 / 4
+    return get_mass_properties_from_moments(area, (area * centre[0], area * centre[1]),
+                                            (own + area * centre[0] ** 2, own + area * centre[1] ** 2, area * centre[0] * centre[1]))
+
+def combine_mass_properties(added, subtracted=None):
+    '''
+    combine the mass properties of several shapes, subtracting any holes. Assumes the added shapes don't overlap each other
+    and the holes are entirely within the added shapes
+    '''
+    if subtracted is None:
+        subtracted = []
+    area = 0
+    first_moment = np.zeros(2)
+    second_moment = np.zeros(3)
+    for properties, sign in [(p, 1) for p in added] + [(p, -1) for p in subtracted]:
+        area += sign * properties["area"]
+        first_moment += sign * np.array(properties["first_moment"])
+        second_moment += sign * np.array(properties["second_moment"])
+    return get_mass_properties_from_moments(area, first_moment, second_moment)
+
+def get_arc_points(centre, r, start_angle, end_angle, points=32):
+    '''
+    points along an arc, for building polygons with rounded bits to feed into get_polygon_mass_properties
+    '''
+    angles = np.linspace(start_angle, end_angle, points)
+    return np.column_stack((centre[0] + r * np.cos(angles), centre[1] + r * np.sin(angles)))
+
+def solve_by_bisection(function, low, high, target=0.0, tolerance=0.001, iterations=100):
+    '''
+    Find x between low and high where function(x) == target, function must be increasing over that range.
+    Used to size the counterweights when balancing second hands (see Hands)
+    '''
+    test = low
+    error = function(test) - target
+    last_error = None
+    for i in range(iterations):
+        if error < 0:
+            low = test
+        if error > 0:
+            high = test
+        if error == 0 or (last_error is not None and abs(error - last_error) < tolerance):
+            break
+        last_error = error
+        test = (low + high) / 2
+        error = function(test) - target
+    return test
+
+def get_sector_extents(radius, start_angle, end_angle):
+    '''
+    (width, height) of the bounding box of a sector of a circle (including the centre) when rotated so it's centred on +y
+    '''
+    span = end_angle - start_angle
+    angles = np.linspace(math.pi/2 - span/2, math.pi/2 + span/2, 64)
+    xs = np.append(radius * np.cos(angles), 0)
+    ys = np.append(radius * np.sin(angles), 0)
+    return (float(np.max(xs) - np.min(xs)), float(np.max(ys) - np.min(ys)))
+
+def size_fits_print_bed(size, max_wide, max_long):
+    '''
+    does a (width, height) fit on the bed either way around?
+    '''
+    return (size[0] <= max_wide and size[1] <= max_long) or (size[0] <= max_long and size[1] <= max_wide)
+
+def snap_angle_between_marks(angle, marks=12):
+    '''
+    move an angle to the nearest point half way between two marks (eg hours on a dial)
+    '''
+    mark_angle = math.pi * 2 / marks
+    return math.floor((angle - mark_angle/2) / mark_angle + 0.5) * mark_angle + mark_angle/2
+
+def get_sectors(angles):
+    '''
+    [(start, end)] for each sector between the boundary angles, going anticlockwise so end is always more than start
+    '''
+    sectors = []
+    for i in range(len(angles)):
+        start = angles[i]
+        end = angles[(i + 1) % len(angles)]
+        if end <= start:
+            end += math.pi * 2
+        sectors.append((start, end))
+    return sectors
+
+def get_print_bed_tile_angles(radius, max_wide, max_long, marks=12, max_tiles=12):
+    '''
+    Split something round (a dial) into equal sectors which each fit on the print bed, with the splits between marks so they don't slice through anything fiddly.
+    Works out how many tiles are needed from the 2D extents alone, no geometry is built.
+
+    Equal tiles can only all be split between marks if each tile is a whole number of marks wide, so only numbers of tiles which divide marks are tried.
+    The set of splits is rotated as a whole so the top of the dial is as close to the middle of the top tile as the marks allow.
+
+    returns the angles (radians) of the boundaries between tiles, anticlockwise from the start of the top tile. Empty if it fits in one piece
+    '''
+    if size_fits_print_bed((radius*2, radius*2), max_wide, max_long):
+        return []
+    for tiles in range(2, max_tiles + 1):
+        if marks % tiles != 0:
+            continue
+        tile_angle = math.pi * 2 / tiles
+        #every tile is the same shape
+        if size_fits_print_bed(get_sector_extents(radius, 0, tile_angle), max_wide, max_long):
+            start = snap_angle_between_marks(math.pi/2 - tile_angle/2, marks)
+            return [(start + i * tile_angle) % (math.pi * 2) for i in range(tiles)]
+    raise ValueError("Unable to split radius {} into at most {} tiles which fit on a {}x{} print bed".format(radius, max_tiles, max_wide, max_long))
+
+def get_sector_includers(angles, radius, height=1000):
+    '''
+    solids which, intersected with a shape, split it along the boundary angles from get_print_bed_tile_angles. Centred on z=0 so they include anything flat
+    '''
+    includers = []
+    for start, end in get_sectors(angles):
+        #extend well beyond the shape
+        r = radius * 2
+        includer = (cq.Workplane("XY").moveTo(0, 0).lineTo(*polar(start, r)).threePointArc(polar((start + end)/2, r), polar(end, r)).close()
+                    .extrude(height).translate((0, 0, -height/2)))
+        includers.append(includer)
+    return includers
+
+class CircleCollisionIndex:
+    '''
+    Uniform grid of circles (eg wheels around their bearings) so "does this circle clash with anything?" only has to look at the
+    circles in the nearby grid cells rather than every arbor.
+
+    Each circle is stored in every cell its bounding box touches, so any circle that overlaps a query circle must share at least one cell with it.
+    Circles are identified by a key (usually the arbor index) and can be moved or resized with add() as the layout changes.
+    '''
+    def __init__(self, cell_size=20):
+        self.cell_size = cell_size
+        #key: (x, y, r)
+        self.circles = {}
+        #(cell x, cell y): set of keys
+        self.cells = {}
+
+    def get_cells(self, centre, r):
+        min_x = math.floor((centre[0] - r) / self.cell_size)
+        max_x = math.floor((centre[0] + r) / self.cell_size)
+        min_y = math.floor((centre[1] - r) / self.cell_size)
+        max_y = math.floor((centre[1] + r) / self.cell_size)
+        return [(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)]
+
+    def add(self, key, centre, r):
+        '''
+        add a circle, or move/resize it if key is already present
+        '''
+        if key in self.circles:
+            existing = self.circles[key]
+            if existing == (centre[0], centre[1], r):
+                return
+            self.remove(key)
+        self.circles[key] = (centre[0], centre[1], r)
+        for cell in self.get_cells(centre, r):
+            if cell not in self.cells:
+                self.cells[cell] = set()
+            self.cells[cell].add(key)
+
+    def remove(self, key):
+        if key not in self.circles:
+            return
+        x, y, r = self.circles.pop(key)
+        for cell in self.get_cells((x, y), r):
+            self.cells[cell].discard(key)
+            if len(self.cells[cell]) == 0:
+                del self.cells[cell]
+
+    def get_clashes(self, centre, r, gap=0, ignore=None, get_radius=None):
+        '''
+        returns a list of {key, distance, min_distance} for every circle which is closer than r + its radius + gap, ordered by key
+
+        ignore: optional collection of keys to skip (eg the arbors this one meshes with)
+        get_radius: optional function(key) to use a different radius for this query. Must not be larger than the radius stored in the index.
+        '''
+        candidates = set()
+        for cell in self.get_cells(centre, r + gap):
+            if cell in self.cells:
+                candidates.update(self.cells[cell])
+        clashes = []
+        for key in sorted(candidates):
+            if ignore is not None and key in ignore:
+                continue
+            x, y, circle_r = self.circles[key]
+            if get_radius is not None:
+                circle_r = get_radius(key)
+            distance = math.sqrt((centre[0] - x)**2 + (centre[1] - y)**2)
+            min_distance = r + circle_r + gap
+            if distance < min_distance:
+                clashes.append({'key': key, 'distance': distance, 'min_distance': min_distance})
+        return clashes
+
+    def get_nearest_clash(self, centre, r, gap=0, ignore=None, get_radius=None):
+        '''
+        the clash with the most overlap, or None if there are no clashes
+        '''
+        clashes = self.get_clashes(centre, r, gap=gap, ignore=ignore, get_radius=get_radius)
+        if len(clashes) == 0:
+            return None
+        return max(clashes, key=lambda clash: clash['min_distance'] - clash['distance'])
+
+    def clashes(self, centre, r, gap=0, ignore=None, get_radius=None):
+        return len(self.get_clashes(centre, r, gap=gap, ignore=ignore, get_radius=get_radius)) > 0
+
+class CollisionIndexedPositions(list):
+    '''
+    List of positions which keeps a CircleCollisionIndex in sync as entries are assigned, so layout code can carry on doing positions[i] = (x, y)
+    and only the circle which actually moved is updated in the index.
+
+    get_radius(index) gives the radius to store for each index, or None to leave that index out of the collision index entirely.
+    '''
+    def __init__(self, positions, collision_index, get_radius):
+        super().__init__(positions)
+        self.collision_index = collision_index
+        self.radii = [get_radius(i) for i in range(len(self))]
+        for i in range(len(self)):
+            self.update_index(i)
+
+    def update_index(self, i):
+        if self.radii[i] is not None:
+            self.collision_index.add(i, self[i], self.radii[i])
+
+    def __setitem__(self, i, value):
+        super().__setitem__(i, value)
+        if isinstance(i, slice):
+            for index in range(*i.indices(len(self))):
+                self.update_index(index)
+        else:
+            self.update_index(i % len(self))
+
+class PlateOutline:
+    '''
+    2D outline of a flat plate (or part of one), built from circles, stroke lines, rectangles and polygons as planar faces and only extruded
+    once at the end. Much cheaper than extruding every arm and circle and unioning them in 3D, when the result is just an extrusion anyway.
+
+    Operations are applied in order, like the sequence of 3D unions and cuts they replace, so something added after a cut will fill it back in.
+    '''
+    def __init__(self):
+        #list of (kind, mode, args) where mode is "a" to add or "s" to subtract, as cq.Sketch
+        self.operations = []
+
+    def add_circle(self, centre, r):
+        self.operations.append(("circle", "a", (tuple(centre[:2]), r)))
+        return self
+
+    def cut_circle(self, centre, r):
+        self.operations.append(("circle", "s", (tuple(centre[:2]), r)))
+        return self
+
+    def add_rect(self, centre, width, height, angle_deg=0):
+        self.operations.append(("rect", "a", (tuple(centre[:2]), width, height, angle_deg)))
+        return self
+
+    def cut_rect(self, centre, width, height, angle_deg=0):
+        self.operations.append(("rect", "s", (tuple(centre[:2]), width, height, angle_deg)))
+        return self
+
+    def add_polygon(self, points):
+        self.operations.append(("polygon", "a", ([tuple(point[:2]) for point in points],)))
+        return self
+
+    def add_stroke_line(self, original_points, wide, style=StrokeStyle.ROUND, loop=False):
+        '''
+        same shape as get_stroke_line, but in 2D
+        '''
+        points = [tuple(point[:2]) for point in original_points]
+        if loop:
+            points.append(points[0])
+        for point, next_point in zip(points[:-1], points[1:]):
+            centre = ((point[0] + next_point[0]) / 2, (point[1] + next_point[1]) / 2)
+            length = get_distance_between_two_points(point, next_point)
+            angle_deg = rad_to_deg(math.atan2(next_point[1] - point[1], next_point[0] - point[0]))
+            if style == StrokeStyle.ROUND:
+                if length < 0.0001:
+                    self.add_circle(point, wide / 2)
+                else:
+                    #a slot is a rectangle with semicircular ends centred on the two points
+                    self.operations.append(("slot", "a", (centre, length, wide, angle_deg)))
+            elif length > 0:
+                self.add_rect(centre, length, wide, angle_deg)
+        if style == StrokeStyle.ROUND and len(points) == 1:
+            self.add_circle(points[0], wide / 2)
+        return self
+
+    def get_sketch(self):
+        sketch = cq.Sketch()
+        for kind, mode, args in self.operations:
+            if kind == "circle":
+                centre, r = args
+                sketch = sketch.push([centre]).circle(r, mode=mode).reset()
+            elif kind == "rect":
+                centre, width, height, angle_deg = args
+                sketch = sketch.push([centre]).rect(width, height, angle=angle_deg, mode=mode).reset()
+            elif kind == "slot":
+                centre, length, wide, angle_deg = args
+                sketch = sketch.push([centre]).slot(length, wide, angle=angle_deg, mode=mode).reset()
+            elif kind == "polygon":
+                points = args[0]
+                sketch = sketch.polygon(points + [points[0]], mode=mode)
+        return sketch.clean()
+
+    def extrude(self, thick):
+        '''
+        returns a cq.Workplane of the outline extruded from z=0 to z=thick
+        '''
+        if len(self.operations) == 0:
+            return cq.Workplane("XY")
+        return cq.Workplane("XY").placeSketch(self.get_sketch()).extrude(thick)
@@ -19,7 +19,7 @@ source.
 '''
 import math
 
-from .geometry import get_stroke_line
+from .geometry import get_stroke_line, get_polygon_mass_properties, get_circle_mass_properties, combine_mass_properties, get_arc_points, solve_by_bisection
 from .utility import *
 import cadquery as cq
 import os
@@ -28,6 +28,12 @@ from enum import Enum
 from .gearing import GearStyle,Gear
 from .cosmetics import tony_the_clock
 from .types import HandType, HandStyle
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import time
+
+#the hands being built by build_hand_set, inherited by the forked worker processes so the hands themselves never need pickling
+_hands_for_workers = None
 
 def spade_hand(base_r, hand_width, length, thick):
 
@@ -433,10 +439,7 @@ class BaroqueHands(HandGenerator):
         self.total_length =total_length
         self.line_width = line_width
         self.hour_total_length = 0.7*self.total_length
-
-        self.hour_hand_cache = None
-        self.minute_hand_cache = None
-        self.second_hand_cache = None
+        #no caches here, Hands.get_hand caches the finished hands keyed on these settings too
 
     def get_bar(self):
         bar_width = self.total_length * 0.1
@@ -450,9 +453,6 @@ class BaroqueHands(HandGenerator):
         doing this outside the main hands class as it could get complicated and for the baroque hands there's little in common between the hour and minute hands
         '''
 
-        if self.hour_hand_cache is not None:
-            return self.hour_hand_cache
-
         total_length = self.hour_total_length
         #plan is to make the bulk of the hand always start just after the base circle
         length = total_length-self.base_r
@@ -534,12 +534,9 @@ class BaroqueHands(HandGenerator):
 
         #tip:
         hand = hand.union(cq.Workplane("XY").circle(self.line_width/2).extrude(self.thick).translate((0,total_length)))
-        self.hour_hand_cache = hand
         return hand
 
     def minute_hand(self, colour=None, thick_override=-1):
-        if self.minute_hand_cache is not None:
-            return self.minute_hand_cache
         hand =  cq.Workplane("XY").tag("base").circle(self.base_r).extrude(self.thick)
 
         length = self.total_length - self.base_r
@@ -592,13 +589,10 @@ class BaroqueHands(HandGenerator):
             .radiusArc((self.line_width/2, arrow_long/2), arrow_long*1.5).line(-self.line_width,0).radiusArc((-arrow_wide/2, -arrow_long/2), arrow_long*1.5).close().extrude(self.thick).translate((0,arrow_y + arrow_y_offset))
 
         hand = hand.union(arrow)
-        self.minute_hand_cache = hand
         return hand
 
     def second_hand(self, total_length=30, base_r=6, thick=3, colour=None, balanced=False, fixing_thick=1.6):
         #TODO use fixing_thick
-        if self.second_hand_cache is not None:
-            return self.second_hand_cache
         line_width=1.2
         # line_width=1.6
         hand = cq.Workplane("XY").tag("base").circle(base_r).extrude(thick)
@@ -666,7 +660,6 @@ class BaroqueHands(HandGenerator):
         # swirl = cq.Workplane("YZ").moveTo(0, thick/2).rect(line_width,thick).loft(base_swirl_line)
         # return swirl
         # hand = hand.union(swirl)
-        self.second_hand_cache = hand
         return hand
 
 class FancyClockHands(HandGenerator):
@@ -998,6 +991,107 @@ class ComplexHands:
         return a single 3D object of the hands for rendering a model
         '''
 
+def get_hand_layer_file_name(name, hand_type, layer):
+    colour_string = "_" + layer if layer is not None else ""
+    return "{}_hand_{}{}.stl".format(name, hand_type.value, colour_string)
+
+def build_hand_layers(hands, hand_type, name=None, path=None):
+    '''
+    build every colour layer (and outline) of one hand, exporting them as STLs too if path is provided
+    returns ({layer: shape}, [stl files], seconds taken)
+    '''
+    start = time.time()
+    layers = hands.get_colour_layers(hand_type)
+    stls = []
+    if path is not None:
+        for layer in layers:
+            out = os.path.join(path, get_hand_layer_file_name(name, hand_type, layer))
+            print("Outputting ", out)
+            exporters.export(layers[layer], out)
+            stls.append(out)
+    return layers, stls, time.time() - start
+
+def build_hand_layers_in_worker(hand_type, name, path):
+    '''
+    runs in a worker process: build one hand from the inherited hands and return its layers as BREP
+    '''
+    layers, stls, duration = build_hand_layers(_hands_for_workers, hand_type, name=name, path=path)
+    return {layer: shape_to_brep(layers[layer]) for layer in layers}, stls, duration
+
+def get_shapes_balance(shapes):
+    '''
+    How well balanced some shapes (cq.Workplanes) are together about the origin.
+    returns {"volume": mm^3, "centre_of_mass": (x,y), "moment": (x,y)} where moment is volume * centre of mass, so (0,0) is perfectly balanced
+    '''
+    volume = 0
+    moment = np.zeros(2)
+    for shape in shapes:
+        for solid in shape.solids().vals():
+            solid_volume = cq.Shape.computeMass(solid)
+            centre = cq.Shape.centerOfMass(solid)
+            volume += solid_volume
+            moment += solid_volume * np.array([centre.x, centre.y])
+    centre_of_mass = (0, 0)
+    if volume > 0:
+        centre_of_mass = (moment[0] / volume, moment[1] / volume)
+    return {"volume": volume, "centre_of_mass": centre_of_mass, "moment": (moment[0], moment[1])}
+
+def build_hand_set(hands, hand_types=None, processes=None, name="clock", path=None):
+    '''
+    Build the hour, minute and second hands (with all their colour layers and outlines) at the same time in worker processes.
+    The fancier styles (baroque, fancy watch, xmas tree) can take a while for each hand and the hands are independent.
+
+    if path is provided the STLs are exported by the workers as well.
+
+    returns {
+    "layers": {hand_type: {layer: cq.Workplane}}, (layer is the colour, None for the main colour, or "outline")
+    "stls": {hand_type: [stl files]},
+    "timings": {hand_type: seconds},
+    "failed": {hand_type: exception},
+    "total_time": seconds
+    }
+
+    Needs the "fork" start method so the workers can inherit the hands, otherwise (eg on windows) or if processes == 1 the hands are built one after another here.
+    '''
+    global _hands_for_workers
+    start = time.time()
+    if hand_types is None:
+        hand_types = [HandType.HOUR, HandType.MINUTE]
+        if hands.include_seconds_hand:
+            hand_types.append(HandType.SECOND)
+    result = {"layers": {}, "stls": {}, "timings": {}, "failed": {}}
+
+    if processes == 1 or "fork" not in multiprocessing.get_all_start_methods():
+        for hand_type in hand_types:
+            try:
+                result["layers"][hand_type], result["stls"][hand_type], result["timings"][hand_type] = build_hand_layers(hands, hand_type, name=name, path=path)
+            except Exception as e:
+                result["failed"][hand_type] = e
+    else:
+        _hands_for_workers = hands
+        try:
+            with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("fork")) as executor:
+                futures = {hand_type: executor.submit(build_hand_layers_in_worker, hand_type, name, path) for hand_type in hand_types}
+                for hand_type, future in futures.items():
+                    try:
+                        breps, stls, duration = future.result()
+                    except Exception as e:
+                        result["failed"][hand_type] = e
+                        continue
+                    result["layers"][hand_type] = {layer: brep_to_shape(breps[layer]) for layer in breps}
+                    result["stls"][hand_type] = stls
+                    result["timings"][hand_type] = duration
+        finally:
+            _hands_for_workers = None
+
+    result["total_time"] = time.time() - start
+    for hand_type in result["timings"]:
+        print("Built {} hand in {:.1f}s".format(hand_type.value, result["timings"][hand_type]))
+    for hand_type in result["failed"]:
+        print("Failed to build {} hand: {}".format(hand_type.value, result["failed"][hand_type]))
+    print("Built {} hands in {:.1f}s".format(len(result["timings"]), result["total_time"]))
+    return result
+
 class Hands:
     '''
     this class generates most of the hands entirely internally - but can now use a "hand generator" class like BaroqueHands.
@@ -1059,14 +1153,17 @@ class Hands:
     def __init__(self, style=HandStyle.SIMPLE, minute_fixing="rectangle", hourFixing="circle", second_fixing="rod", minute_fixing_d1=1.5, minute_fixing_d2=2.5,
                  hourfixing_d=3, second_fixing_d=3, length=25, second_length=30, thick=1.6, fixing_offset_deg=0, outline=0, outline_same_as_body=True,
                  chunky = False, second_hand_centred=False, outline_on_seconds=-1, seconds_hand_thick=-1, second_style_override=None, hour_style_override=None, outline_colour=None,
-                 second_fixing_thick=-1, outline_thick=LAYER_THICK * 2, include_seconds_hand = False):
+                 second_fixing_thick=-1, outline_thick=LAYER_THICK * 2, include_seconds_hand = False, auto_counterweight=False):
         '''
         chunky applies to some styles that can be made more or less chunky - idea is that some defaults might look good with a dial, but look a bit odd without a dial
 
         This is a bit of a mess, but the hand shapes are mostly generated in getBasicHandShape, with a few styles having their own classes to do the heavy work - I could probably consider combining these back
         now I've done some tidy up.
 
-        There is a caching system for hand shapes, but it only helps with generating outlines and doesn't help with multicolour hands yet
+        Finished hands (each colour and the outline) are cached by get_hand, see get_cache_state
+
+        auto_counterweight: give the second hand a round counterweight opposite whatever imbalance it has, works for any style. See add_counterweight.
+        Without this only the styles which know how to balance themselves are balanced (and only if the second hand is centred)
 
         '''
         self.thick=thick
@@ -1074,6 +1171,7 @@ class Hands:
         #recommend using thicker seconds hands if using an outline
         self.second_thick= seconds_hand_thick
         self.include_seconds_hand = include_seconds_hand
+        self.auto_counterweight = auto_counterweight
         if self.second_thick < 0:
             self.second_thick = self.thick
         #usually I print multicolour stuff with two layers, but given it's entirely perimeter I think it will look okay with just one
@@ -1143,6 +1241,8 @@ class Hands:
         self.hour_fixing_d = hourfixing_d
 
         self.configure_length(length)
+        #(hand type, generate outline, colour, get_cache_state()) -> hand, see get_hand
+        self.hand_cache = {}
         # was attempting to use a cache, but so many edge cases that I've given up
         self.hand_shapes = {}
         self.outline_shapes = {}
@@ -1152,6 +1252,8 @@ class Hands:
 
     def configure_motion_works(self, motion_works):
         #configure fixings and thicknesses from the motion works
+        #everything cached so far is for the old configuration
+        self.hand_cache = {}
         self.minute_fixing = motion_works.get_minute_hand_fixing_shape()
         self.minute_fixing_d1 = motion_works.get_minute_hand_square_size()
         self.hour_fixing_d = motion_works.get_hour_hand_hole_d()
@@ -1163,6 +1265,8 @@ class Hands:
             self.minute_fixing= "rectangle"
 
     def configure_length(self, length, second_length=-1):
+        #everything cached so far is for the old configuration
+        self.hand_cache = {}
         self.length = length
         if second_length > 0:
             self.second_length = second_length
@@ -1410,60 +1514,23 @@ class Hands:
 
             hand = hand.workplaneFromTagged("base").moveTo(width / 2, 0).line(0, body_length).lineTo(0, length).lineTo(-width/2, body_length).line(0, -body_length).close().extrude(thick)
 
-            def moment_of_trapezium(length, centre_width, tip_width, chunks=10):
-                moment = 0
-                chunk_length = length/chunks
-                width_per_length = (tip_width - centre_width) / length
-                for i in range(chunks):
-                    distance = chunk_length * i + chunk_length/2
-                    start_width = centre_width + width_per_length * i * chunk_length
-                    end_width = centre_width + width_per_length * (i + 1) * chunk_length
-                    area = chunk_length * (start_width + end_width)/2
-                    moment += distance * area
-                return moment
-
             if second and self.second_hand_balanced:
-                # approx
                 need_base_r = False
-                moment = moment_of_trapezium(length, centre_width, tip_width)
-                # TODO we have end width as a function of length, by keeping this triangularish, we know what moment we need to get
-                # so we should be able to just calculate the length of the thicker side easily enough
+                #moment of the pointer about the axle
+                moment = get_polygon_mass_properties([(centre_width/2, 0), (tip_width/2, length), (-tip_width/2, length), (-centre_width/2, 0)])["first_moment"][1]
+                #keep the counterweight tapering at the same rate as the pointer, then find how long it needs to be
                 width_per_length = (centre_width - tip_width) / length
 
                 def counterweight_moment(back_length):
                     back_width = centre_width + back_length * width_per_length
-                    moment = moment_of_trapezium(back_length, centre_width, tip_width=back_width)
+                    points = [(-centre_width/2, 0), (-back_width/2, -back_length)]
                     if rounded_second_hand:
-                        r = back_width/2
-                        moment += (back_length + r/2) * math.pi * (r**2) / 2
-                    return moment
-
-                min_length = 0.1
-                max_length = length
-                test_length = min_length
-                counterweight_moment_test = counterweight_moment(test_length)
-                error = counterweight_moment_test - moment
-                last_error = 1000
-                # TODO write a generic binary search solver, this is just copied from BREGUET
-                for i in range(100):
-                    # print("counterweight difference: {}, test_r:{}".format(error, test_r))
-
-                    if error < 0:
-                        # r too small
-                        min_length = test_length
-                    if error > 0:
-                        # too big
-                        max_length = test_length
-                    if error == 0 or abs(error - last_error) < 0.001:
-                        print("best counterweight difference: {}, test_r:{} i {}".format(error, test_length, i))
-                        back_length = test_length
-                        break
-
-                    last_error = error
-                    test_length = (min_length + max_length) / 2
-                    counterweight_moment_test = counterweight_moment(test_length)
-                    error = counterweight_moment_test - moment
+                        points += [tuple(point) for point in get_arc_points((0, -back_length), back_width/2, math.pi, math.pi*2)]
+                    points += [(back_width/2, -back_length), (centre_width/2, 0)]
+                    return -get_polygon_mass_properties(points)["first_moment"][1]
 
+                back_length = solve_by_bisection(counterweight_moment, 0.1, length, target=moment)
+                print("second hand counterweight length: {}, moment difference: {}".format(back_length, counterweight_moment(back_length) - moment))
 
                 # back_length_a = (-0.5 * centre_width + math.sqrt(0.25 * centre_width ** 2 + width_per_length * moment)) / (width_per_length / 2)
                 # back_length_b = (-0.5 * centre_width - math.sqrt(0.25 * centre_width ** 2 + width_per_length * moment)) / (width_per_length / 2)
@@ -1763,36 +1830,16 @@ class Hands:
                     # this is currently adjusting size of circle based on my chosen length, but would it look better if I instead calculated length to keep size of circle same as one of the other hands?
                     # but both circles on hour and minute hand are difference sizes, so I'll leave it like this
 
-                    moment = (bend_point_y ** 2) * hand_width / 2 + ((length - bend_point_y) * (tip_width + hand_width) / 2) * (length - (length - bend_point_y) / 2)
+                    moment = get_polygon_mass_properties([(hand_width/2, 0), (hand_width/2, bend_point_y), (tip_width/2, length), (-tip_width/2, length),
+                                                          (-hand_width/2, bend_point_y), (-hand_width/2, 0)])["first_moment"][1]
 
                     def counterweight_moment(circle_r, distance):
-                        return distance * (math.pi * circle_r ** 2 - math.pi * (circle_r - hand_width) ** 2) + (hand_width * (distance - circle_r) ** 2) / 2
-
-                    min_r = hand_width * 2.1
-                    max_r = abs(circle_y)
-                    test_r = min_r
-                    counterweight_moment_test = counterweight_moment(test_r, abs(circle_y))
-                    error = counterweight_moment_test - moment
-                    last_error = 1000
-                    # TODO write a generic binary search solver, this is just a variant over the one used a few times in escapements
-                    for i in range(100):
-                        # print("counterweight difference: {}, test_r:{}".format(error, test_r))
-
-                        if error < 0:
-                            # r too small
-                            min_r = test_r
-                        if error > 0:
-                            # too big
-                            max_r = test_r
-                        if error == 0 or abs(error - last_error) < 0.001:
-                            print("best counterweight difference: {}, test_r:{} i {}".format(error, test_r, i))
-                            circle_r = test_r
-                            break
-
-                        last_error = error
-                        test_r = (min_r + max_r) / 2
-                        counterweight_moment_test = counterweight_moment(test_r, abs(circle_y))
-                        error = counterweight_moment_test - moment
+                        ring = combine_mass_properties([get_circle_mass_properties((0, -distance), circle_r)], [get_circle_mass_properties((0, -distance), circle_r - hand_width)])
+                        arm = get_polygon_mass_properties([(-hand_width/2, 0), (-hand_width/2, circle_r - distance), (hand_width/2, circle_r - distance), (hand_width/2, 0)])
+                        return -combine_mass_properties([ring, arm])["first_moment"][1]
+
+                    circle_r = solve_by_bisection(lambda r: counterweight_moment(r, abs(circle_y)), hand_width * 2.1, abs(circle_y), target=moment)
+                    print("second hand counterweight r: {}, moment difference: {}".format(circle_r, counterweight_moment(circle_r, abs(circle_y)) - moment))
                     # possible_circle_rs = [r for r in range(handWidth*2.5,abs(circleY),0.1)]
                     #
                     # for
@@ -1951,13 +1998,88 @@ class Hands:
         return hand
 
 
+    def get_cache_state(self):
+        '''
+        The hands get reconfigured after they're created (configure_motion_works, configure_length, plates setting attributes directly...) which is what
+        defeated the old cache. So key the cache on all the simple settings (and lists of them), plus the settings of the generator for the styles
+        which have one, then any change to them just misses the cache.
+        '''
+        generator_state = None
+        if self.generator is not None:
+            generator_state = (type(self.generator).__name__, get_simple_settings(self.generator))
+        return (get_simple_settings(self), generator_state)
+
     def get_hand(self, hand_type=HandType.MINUTE, generate_outline=False, colour=None):
         '''
         #either hour, minute or second hand (for now?)
         if provide a colour, return the layer for just that colour (for novelty hands with lots of colours)
 
         if generate_outline is true this is just the shape of the hand used to generate an outline - this skips cutting a hole for the fixing
+
+        Cached, so the outline (which every colour layer cuts out of itself) is only generated once per hand
+        '''
+        key = (hand_type, generate_outline, colour, self.get_cache_state())
+        if key not in self.hand_cache:
+            self.hand_cache[key] = self.make_hand(hand_type=hand_type, generate_outline=generate_outline, colour=colour)
+        return self.hand_cache[key]
+
+    def get_colour_layers(self, hand_type=HandType.MINUTE):
+        '''
+        every layer needed to print this hand in one go: {colour: shape} for each of get_extra_colours() (None being the default colour)
+        plus {"outline": shape} if there is an outline. Layers which don't exist for this hand are left out
+        '''
+        layers = {}
+        if self.outline > 0:
+            #generate first, all the colours cut this out of themselves
+            outline = self.get_hand(hand_type=hand_type, generate_outline=True)
+            if outline is not None:
+                layers["outline"] = outline
+        for colour in self.get_extra_colours():
+            hand = self.get_hand(hand_type=hand_type, colour=colour)
+            if hand is not None:
+                layers[colour] = hand
+        return layers
+
+    def get_balance(self, hand_type=HandType.SECOND):
+        '''
+        How well balanced the finished hand (all colour layers together) is about its axle, for any style.
+        returns {"volume": mm^3, "centre_of_mass": (x,y), "moment": (x,y)} where moment is volume * centre of mass, so (0,0) is perfectly balanced
+        '''
+        balance = get_shapes_balance(self.get_colour_layers(hand_type).values())
+        print("{} hand centre of mass: ({:.2f}, {:.2f})".format(hand_type.value, balance["centre_of_mass"][0], balance["centre_of_mass"][1]))
+        return balance
+
+    def add_counterweight(self, hand, thick):
         '''
+        Add a round counterweight on an arm, opposite whatever imbalance the (basic shape of the) second hand has, including its other colours.
+        Works from the 3D shapes so it doesn't need to know how the style drew the hand. Used if auto_counterweight is set
+        '''
+        shapes = [hand] + [self.get_basic_hand_shape(second=True, colour=colour) for colour in self.get_extra_colours() if colour is not None]
+        balance = get_shapes_balance([shape for shape in shapes if shape is not None])
+        moment = np.array(balance["moment"])
+        moment_size = np.linalg.norm(moment)
+        if moment_size < balance["volume"] * 0.01:
+            #already balanced (to within 0.01mm)
+            return hand
+        direction = -moment / moment_size
+        arm_width = self.second_length * 0.05
+        distance = self.second_length * 0.3
+        counterweight_pos = (direction[0] * distance, direction[1] * distance)
+        hand = hand.union(get_stroke_line([(0, 0), counterweight_pos], wide=arm_width, thick=thick))
+        other_shapes = shapes[1:]
+
+        def get_counterweighted(r):
+            return hand.union(cq.Workplane("XY").circle(r).extrude(thick).translate(counterweight_pos))
+
+        def counterweight_moment(r):
+            #moment towards the counterweight, measured from the real shapes so overlaps with the hand are accounted for. Balanced at zero
+            return np.dot(get_shapes_balance([get_counterweighted(r)] + other_shapes)["moment"], direction)
+
+        counterweight_r = solve_by_bisection(counterweight_moment, arm_width / 2, distance, tolerance=moment_size * 0.001)
+        print("second hand counterweight r: {}, moment difference: {}".format(counterweight_r, counterweight_moment(counterweight_r)))
+        return get_counterweighted(counterweight_r)
+
+    def make_hand(self, hand_type=HandType.MINUTE, generate_outline=False, colour=None):
 
         thick = self.thick
 
@@ -1972,6 +2094,10 @@ class Hands:
             #should only happen if multicolour hands don't have all colours on all hands
             return None
 
+        if hand_type == HandType.SECOND and colour is None and self.auto_counterweight:
+            #the second hand's basic shape is always second_thick
+            hand = self.add_counterweight(hand, self.second_thick)
+
 
         #doen't work, I think this can get a bit recursive. Need to re-think.
         # if self.outline_colour is not None and self.outline_colour == colour:
@@ -2168,47 +2294,49 @@ class Hands:
 
         return hands
 
+    def get_assembled_layers(self, time_minute=10, time_hour=10, time_seconds=0, gap_size=0, include_seconds=True, flatten=False):
+        '''
+        as get_assembled, but [(colour, shape)] with each colour layer kept separate (colour is None for the main colour or "outline")
+        '''
+        angles = {
+            HandType.MINUTE: - 360 * (time_minute / 60),
+            HandType.HOUR: - 360 * (time_hour + time_minute / 60) / 12,
+            HandType.SECOND: -360 * (time_seconds / 60)
+        }
+        z = {
+            HandType.MINUTE: self.thick*2 + gap_size,
+            HandType.HOUR: self.thick,
+            HandType.SECOND: self.second_thick
+        }
+
+        hand_types = [HandType.MINUTE, HandType.HOUR]
+        if include_seconds:
+            hand_types.append(HandType.SECOND)
+
+        layers = []
+        for hand_type in hand_types:
+            hand_layers = self.get_colour_layers(hand_type)
+            for colour in hand_layers:
+                hand = hand_layers[colour].mirror().translate((0, 0, 0 if flatten else z[hand_type])).rotate((0, 0, 0), (0, 0, 1), angles[hand_type])
+                if hand_type == HandType.SECOND:
+                    if self.second_hand_centred:
+                        hand = hand.translate((0, 0, self.thick * 3))
+                    else:
+                        hand = hand.translate((0, self.length * 0.5, 0))
+                layers.append((colour, hand))
+
+        return layers
+
     def get_assembled(self, time_minute=10, time_hour=10, time_seconds=0, gap_size=0, include_seconds=True, flatten=False):
         '''
         get minute and hour hands assembled centred around 0,0
         gap_size is how much gap between top of hour hand and bottom of minute hand
         '''
-
-        minuteAngle = - 360 * (time_minute / 60)
-        hourAngle = - 360 * (time_hour + time_minute / 60) / 12
-        secondAngle = -360 * (time_seconds / 60)
-
-        minuteHand = cq.Workplane("XY")
-        hourHand = cq.Workplane("XY")
-        secondHand = cq.Workplane("XY")
-
-        for colour in self.get_extra_colours():
-            minuteHand = minuteHand.add(self.get_hand(hand_type=HandType.MINUTE, colour=colour))
-            hourHand = hourHand.add(self.get_hand(hand_type=HandType.HOUR, colour=colour))
-            secondHand = secondHand.add(self.get_hand(hand_type=HandType.SECOND, colour = colour))
-
-        if self.outline > 0:
-            minuteHand = minuteHand.add(self.get_hand(hand_type=HandType.MINUTE, generate_outline=True))
-            hourHand = hourHand.add(self.get_hand(hand_type=HandType.HOUR, generate_outline=True))
-            try:
-                secondHand = secondHand.add(self.get_hand(hand_type=HandType.SECOND, generate_outline=True))
-            except:
-                pass
-
-        minuteHand = minuteHand.mirror().translate((0, 0, 0 if flatten else self.thick*2 + gap_size)).rotate((0, 0, 0), (0, 0, 1), minuteAngle)
-        hourHand = hourHand.mirror().translate((0, 0, 0 if flatten else self.thick)).rotate((0, 0, 0), (0, 0, 1), hourAngle)
-        secondHand = secondHand.mirror().translate((0, 0, 0 if flatten else self.second_thick)).rotate((0, 0, 0), (0, 0, 1), secondAngle)
-
-        if self.second_hand_centred:
-            secondHand = secondHand.translate((0,0,self.thick*3))
-        else:
-            secondHand = secondHand.translate((0, self.length * 0.5, 0))
-
         #add, not union, so we keep the detail visible
-        all = minuteHand.add(hourHand)
-
-        if include_seconds:
-            all = all.add(secondHand)
+        all = cq.Workplane("XY")
+        for colour, hand in self.get_assembled_layers(time_minute=time_minute, time_hour=time_hour, time_seconds=time_seconds, gap_size=gap_size,
+                                                      include_seconds=include_seconds, flatten=flatten):
+            all = all.add(hand)
 
         return all
 
@@ -2223,56 +2351,41 @@ class Hands:
 
     def get_printed_parts(self):
         parts = []
-        colours = self.get_extra_colours()
+        hand_types = [HandType.HOUR, HandType.MINUTE]
+        if self.include_seconds_hand:
+            hand_types.append(HandType.SECOND)
 
-        for colour in colours:
-            colour_string = "_" + colour if colour is not None else ""
+        all_layers = {hand_type: self.get_colour_layers(hand_type) for hand_type in hand_types}
 
-            parts.append(BillOfMaterials.PrintedPart(f"hand_hour{colour_string}", self.get_hand(hand_type=HandType.HOUR, colour=colour)))
-            parts.append(BillOfMaterials.PrintedPart(f"hand_minute{colour_string}", self.get_hand(hand_type=HandType.MINUTE, colour=colour)))
-            if self.include_seconds_hand:
-                parts.append(BillOfMaterials.PrintedPart(f"hand_second{colour_string}", self.get_hand(hand_type=HandType.SECOND, colour=colour)))
+        for colour in self.get_extra_colours():
+            colour_string = "_" + colour if colour is not None else ""
+            for hand_type in hand_types:
+                parts.append(BillOfMaterials.PrintedPart(f"hand_{hand_type.value}{colour_string}", all_layers[hand_type].get(colour)))
 
-        if self.outline > 0:
-            parts.append(BillOfMaterials.PrintedPart("hand_hour_outline", self.get_hand(hand_type=HandType.HOUR, generate_outline=True)))
-            parts.append(BillOfMaterials.PrintedPart("hand_minute_outline", self.get_hand(hand_type=HandType.MINUTE, generate_outline=True)))
-            if self.include_seconds_hand:
-                secondoutline = self.get_hand(hand_type=HandType.SECOND, generate_outline=True)
-                if secondoutline is not None:
-                    parts.append(BillOfMaterials.PrintedPart("hand_second_outline", secondoutline))
+        for hand_type in hand_types:
+            if "outline" in all_layers[hand_type]:
+                parts.append(BillOfMaterials.PrintedPart(f"hand_{hand_type.value}_outline", all_layers[hand_type]["outline"]))
         return parts
 
-    def output_STLs(self, name="clock", path="../out"):
-
-        colours = self.get_extra_colours()
-
-        for colour in colours:
-            colour_string = "_"+colour if colour is not None else ""
-            out = os.path.join(path, "{}_hand_hour{}.stl".format(name, colour_string))
-            print("Outputting ", out)
-            exporters.export(self.get_hand(hand_type=HandType.HOUR, colour=colour), out)
-
-            out = os.path.join(path, "{}_hand_minute{}.stl".format(name, colour_string))
-            print("Outputting ", out)
-            exporters.export(self.get_hand(hand_type=HandType.MINUTE, colour=colour), out)
-
-            out = os.path.join(path, "{}_hand_second{}.stl".format(name, colour_string))
-            print("Outputting ", out)
-            exporters.export(self.get_hand(hand_type=HandType.SECOND, colour=colour), out)
-
-        if self.outline > 0:
-            out = os.path.join(path, "{}_hand_hour_outline.stl".format(name))
-            print("Outputting ", out)
-            exporters.export(self.get_hand(hand_type=HandType.HOUR, generate_outline=True), out)
+    def output_STLs(self, name="clock", path="../out", processes=None):
+        '''
+        processes: if set, build and export the hands in this many worker processes (see build_hand_set)
 
-            out = os.path.join(path, "{}_hand_minute_outline.stl".format(name))
-            print("Outputting ", out)
-            exporters.export(self.get_hand(hand_type=HandType.MINUTE, generate_outline=True), out)
-            try:
-                secondoutline = self.get_hand(hand_type=HandType.SECOND, generate_outline=True)
-                if secondoutline is not None:
-                    out = os.path.join(path, "{}_hand_second_outline.stl".format(name))
-                    print("Outputting ", out)
-                    exporters.export(secondoutline, out)
-            except:
-                print("Unable to export second hand outline")
\ No newline at end of file
+        the second hand is only exported if include_seconds_hand, same as get_printed_parts
+        '''
+        hand_types = [HandType.HOUR, HandType.MINUTE]
+        if self.include_seconds_hand:
+            hand_types.append(HandType.SECOND)
+
+        if processes is not None:
+            built = build_hand_set(self, hand_types=hand_types, processes=processes, name=name, path=path)
+            for hand_type in built["failed"]:
+                raise built["failed"][hand_type]
+            return
+
+        for hand_type in hand_types:
+            layers = self.get_colour_layers(hand_type)
+            for colour in layers:
+                out = os.path.join(path, get_hand_layer_file_name(name, hand_type, colour))
+                print("Outputting ", out)
+                exporters.export(layers[colour], out)
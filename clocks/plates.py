@@ -40,6 +40,11 @@ import os
 import datetime
 from .cuckoo_bits import roman_numerals
 from .cq_svg import exportSVG
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import io
+import time
+import threading
 
 # if 'show_object' not in globals():
 #     #don't output STL when we're in cadquery editor
@@ -87,6 +92,48 @@ Plan: spin out GoingTrain to gearing and a new file for the plates. keep this ju
 
 
 
+#the plates being built by build_plate_parts, inherited by the forked worker processes so the plates themselves never need pickling
+_plates_for_workers = None
+
+def build_plate_part(method_name, kwargs):
+    '''
+    runs in a worker process: build one part from the inherited plates and return it as BREP, along with how long it took
+    '''
+    start = time.time()
+    shape = getattr(_plates_for_workers, method_name)(**kwargs)
+    return shape_to_brep(shape), time.time() - start
+
+def build_plate_parts(plates, parts, processes=None):
+    '''
+    Build independent parts of a set of plates (eg back plate, front plate, wall standoffs) at the same time in worker processes.
+    The layout (bearing positions, pillars etc) is all worked out when the plates are created, so each worker only has to build its own part.
+
+    parts: {name: (method name, {kwargs})}
+    returns {name: cq.Workplane}
+
+    Needs the "fork" start method so the workers can inherit the plates, otherwise (eg on windows) the parts are built one after another here.
+    '''
+    global _plates_for_workers
+    start = time.time()
+    results = {}
+    if processes == 1 or "fork" not in multiprocessing.get_all_start_methods():
+        for name, (method_name, kwargs) in parts.items():
+            results[name] = getattr(plates, method_name)(**kwargs)
+        return results
+
+    _plates_for_workers = plates
+    try:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("fork")) as executor:
+            futures = {name: executor.submit(build_plate_part, method_name, kwargs) for name, (method_name, kwargs) in parts.items()}
+            for name, future in futures.items():
+                brep, duration = future.result()
+                print("Built {} in {:.1f}s".format(name, duration))
+                results[name] = brep_to_shape(brep)
+    finally:
+        _plates_for_workers = None
+    print("Built {} plate parts in {:.1f}s".format(len(parts), time.time() - start))
+    return results
+
 class MoonHolder:
     '''
     This might be worth splitting into different classes for each class of supported clock plate?
@@ -325,6 +372,83 @@ The moon on its threaded rod slots through a steel tube.
 
         return [holder, lid]
 
+class PlateOutlineModel:
+    '''
+    The 2D layout that the parts derived from the plates (drill template, wall standoffs, back cock) are built from, worked out once per layout
+    (see SimpleClockPlates.get_plate_outline_model_key). Tweaking how a standoff is generated only needs this, not the plates themselves.
+
+    The fixing screws cutter is also cut out of most of these parts (and the plates and pillars), so it is generated (once) on demand.
+    '''
+    def __init__(self, plates):
+        self.plates = plates
+        #[(x,y, supported),]
+        self.screwhole_positions = plates.get_screwhole_positions()
+        self.top_pillar_positions = plates.top_pillar_positions
+        self.bottom_pillar_positions = plates.bottom_pillar_positions
+        self.bearing_positions = plates.bearing_positions
+        self.hands_position = plates.hands_position
+        #back: [(centre, r),] that the plate is (nearly) entirely within, see SimpleClockPlates.get_plate_outline_circles
+        self.outline_circles = {back: plates.get_plate_outline_circles(back=back) for back in [True, False]}
+        #back: PlateOutline, built on demand
+        self.outlines = {}
+        self.fixing_screws_cutter = None
+
+    def get_outline_circles(self, back=True):
+        return self.outline_circles[back]
+
+    def get_outline_extents(self, back=True):
+        '''
+        (min x, min y, max x, max y) of the plate
+        '''
+        circles = self.outline_circles[back]
+        return (min([c[0][0] - c[1] for c in circles]), min([c[0][1] - c[1] for c in circles]),
+                max([c[0][0] + c[1] for c in circles]), max([c[0][1] + c[1] for c in circles]))
+
+    def get_outline(self, back=True):
+        '''
+        rough 2D footprint of the plate: the outline circles joined by a plate_width line through the bearings
+        '''
+        if back not in self.outlines:
+            outline = PlateOutline()
+            if len(self.bearing_positions) > 1:
+                outline.add_stroke_line([pos[:2] for pos in self.bearing_positions], wide=self.plates.plate_width)
+            for centre, r in self.outline_circles[back]:
+                outline.add_circle(centre, r)
+            self.outlines[back] = outline
+        return self.outlines[back]
+
+    def get_screwhole_extents(self):
+        '''
+        (min x, min y, max x, max y) of the wall fixing screwholes
+        '''
+        xs = [hole[0] for hole in self.screwhole_positions]
+        ys = [hole[1] for hole in self.screwhole_positions]
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def get_fixing_screws_cutter(self):
+        if self.fixing_screws_cutter is None:
+            self.fixing_screws_cutter = self.plates.get_fixing_screws_cutter()
+        return self.fixing_screws_cutter
+
+#(bearing fields, plate thick, bearing on top, with support, layer thick) -> punch, see BasePlates.get_bearing_punch
+BEARING_PUNCH_LIBRARY = {}
+#the autoclock server generates in several threads, so only fill the library while holding this
+BEARING_PUNCH_LIBRARY_LOCK = threading.Lock()
+
+def get_layout_key(value):
+    '''
+    hashable copy of (nested lists/tuples/arrays of) positions, for cache keys
+    '''
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple([get_layout_key(item) for item in value])
+    return value
+
+def get_bearing_punch_key(bearing):
+    '''
+    get_bearing_info() creates new BearingInfo objects for some sizes, so key on what the bearing is rather than which object it is
+    '''
+    return (type(bearing).__name__,) + tuple(sorted(vars(bearing).items()))
+
 class BasePlates:
     '''
     Basic bits shared by all types of plates
@@ -374,16 +498,33 @@ class BasePlates:
     def get_bearing_punch(self, plate_thick, bearing, bearing_on_top=True , with_support=False):
         '''
         General purpose bearing punch, aligned for cutting into the plate
+
+        There are only a handful of different bearings, so the punches are cached in BEARING_PUNCH_LIBRARY and shared between all plates.
+        The result is a fresh workplane, so it's safe to add() to
         '''
         if not bearing.plain_bushing and bearing.height >= plate_thick:
             raise ValueError("plate not thick enough to hold bearing: {}".format(bearing))
 
-        punch = bearing.get_cutter(layer_thick=self.layer_thick, with_bridging=with_support)
+        key = (get_bearing_punch_key(bearing), plate_thick, bearing_on_top, with_support, self.layer_thick)
+        with BEARING_PUNCH_LIBRARY_LOCK:
+            if key not in BEARING_PUNCH_LIBRARY:
+                punch = bearing.get_cutter(layer_thick=self.layer_thick, with_bridging=with_support)
 
-        if bearing_on_top:
-            punch = punch.rotate((0,0,0),(1,0,0),180).translate((0,0,plate_thick))
+                if bearing_on_top:
+                    punch = punch.rotate((0,0,0),(1,0,0),180).translate((0,0,plate_thick))
 
-        return punch
+                BEARING_PUNCH_LIBRARY[key] = punch
+            return cq.Workplane("XY").add(BEARING_PUNCH_LIBRARY[key])
+
+    def get_plain_hole_punch(self, plate_thick, hole_d):
+        '''
+        Plain hole right through the plate, for arbors which pass through without a bearing. Cached like get_bearing_punch
+        '''
+        key = ("plain_hole", hole_d, plate_thick)
+        with BEARING_PUNCH_LIBRARY_LOCK:
+            if key not in BEARING_PUNCH_LIBRARY:
+                BEARING_PUNCH_LIBRARY[key] = cq.Workplane("XY").circle(hole_d/2).extrude(plate_thick)
+            return cq.Workplane("XY").add(BEARING_PUNCH_LIBRARY[key])
 
     # def get_plate_thick(self, back=False):
     #     raise NotImplementedError("TODO get_plate_thick in sub classes")
@@ -1062,6 +1203,9 @@ class SimpleClockPlates(BasePlates):
         '''
         TODO tidy up the mess of some plates using the nuts at back/front and screws and others using rods
         returns ([rod lengths, in same order as all_pillar_positions] , [base of rod z])
+
+        These plates are held together with fixing screws rather than cut rod, so there are no rods (see get_fixing_screw_length_info).
+        Plates using rods override this, and get_layout_info reports which is in use as "fixing"
         '''
         return ([], [])
     def get_plate_shape(self):
@@ -1079,6 +1223,14 @@ class SimpleClockPlates(BasePlates):
     def generate_arbors_for_plate(self):
 
         self.arbors_for_plate = []
+        #rebuilt from arbors_for_plate when first needed
+        self.wheel_collision_index = None
+        self.wheel_collision_index_key = None
+        #(top_standoff, for_printing) -> text shape, the text is cut from several parts and rendering it is slow
+        self.text_cache = {}
+        #see get_plate_outline_model
+        self.plate_outline_model = None
+        self.plate_outline_model_key = None
 
         print("Plate distance", self.plate_distance)
 
@@ -1118,18 +1270,167 @@ class SimpleClockPlates(BasePlates):
                                            pendulum_length=self.going_train.pendulum_length_m*1000, **arbor.arbor_class_for_plate_args)
             self.arbors_for_plate.append(arborForPlate)
 
+    def get_wheel_collision_index(self):
+        '''
+        every arbor's max radius around its bearing, built once and reused for all the pillar placement checks
+        '''
+        #rebuilt if the bearings have moved (or arbors been added) since it was last built
+        key = (tuple(tuple(pos[:2]) for pos in self.bearing_positions), len(self.arbors_for_plate))
+        if self.wheel_collision_index is None or self.wheel_collision_index_key != key:
+            self.wheel_collision_index = CircleCollisionIndex()
+            for i, arbor in enumerate(self.arbors_for_plate):
+                self.wheel_collision_index.add(i, self.bearing_positions[i][:2], arbor.get_max_radius())
+            self.wheel_collision_index_key = key
+        return self.wheel_collision_index
+
     def clashes_with_wheel(self, pillar_pos, pillar_r, min_gap=-1):
         if min_gap < 0:
             min_gap = self.small_gear_gap
-        for i, bearing_pos in enumerate(self.bearing_positions):
-            arbor = self.arbors_for_plate[i]
-            distance = get_distance_between_two_points(pillar_pos, bearing_pos[:2])
-            space = arbor.get_max_radius() + pillar_r + min_gap
-            if distance < space:
-                # print(f"clashes by", distance - space )
-                return True
+        return self.get_wheel_collision_index().clashes(pillar_pos, pillar_r, gap=min_gap)
+
+    def get_plate_outline_circles(self, back=True):
+        '''
+        Rough outline of the plate from the layout alone (no geometry), as a list of (centre, radius) that the plate is (nearly) entirely within.
+        Used for quick size checks, see get_layout_info
+        '''
+        circles = []
+        for i, pos in enumerate(self.bearing_positions):
+            r = self.plate_width / 2
+            bearing = self.arbors_for_plate[i].get_bearing(front=not back)
+            if bearing is not None:
+                r = max(r, bearing.outer_d / 2 + self.bearing_wall_thick)
+            circles.append((pos[:2], r))
+        for pos in self.bottom_pillar_positions:
+            circles.append((pos[:2], self.bottom_pillar_r))
+        for pos in self.top_pillar_positions:
+            circles.append((pos[:2], self.top_pillar_r))
+        if back and self.back_plate_from_wall == 0:
+            for pos in self.get_screwhole_positions():
+                circles.append((pos[:2], self.plate_width / 2))
+        if not back and self.dial is not None and self.dial_top_above_front_plate and not self.top_pillar_holds_dial:
+            circles.append(((self.hands_position[0], self.hands_position[1] + self.dial.outside_d / 2 - self.dial.dial_width / 2), self.plate_width / 2))
+        return circles
+
+    def get_plate_extents(self, back=True):
+        '''
+        (min x, min y, max x, max y) of the plate, from the layout alone
+        '''
+        return self.get_plate_outline_model().get_outline_extents(back=back)
 
-        return False
+    def get_layout_info(self):
+        '''
+        Dimensions worked out from the layout without building any geometry, so a design can be checked (eg that it fits the print bed) in milliseconds
+        '''
+        bottom_total_length, top_total_length, bottom_screw_length, top_screw_length = self.get_fixing_screw_length_info()
+        bottom_required_length, top_required_length = self.get_fixing_screw_required_lengths()
+        rod_lengths, rod_zs = self.get_rod_lengths()
+        info = {
+            "plate_distance": self.plate_distance,
+            "back_plate_thick": self.get_plate_thick(back=True),
+            "front_plate_thick": self.get_plate_thick(back=False),
+            "bearing_positions": [tuple(pos) for pos in self.bearing_positions],
+            "bottom_pillar_positions": [tuple(pos[:2]) for pos in self.bottom_pillar_positions],
+            "top_pillar_positions": [tuple(pos[:2]) for pos in self.top_pillar_positions],
+            #"rods" if held together with cut threaded rod (rod_lengths), otherwise "screws" (screw_lengths)
+            "fixing": "rods" if len(rod_lengths) > 0 else "screws",
+            "rod_lengths": rod_lengths,
+            "rod_zs": rod_zs,
+            "screw_lengths": {"bottom_total": bottom_total_length, "top_total": top_total_length, "bottom_screw": bottom_screw_length, "top_screw": top_screw_length,
+                              "bottom_required": bottom_required_length, "top_required": top_required_length},
+        }
+        for back in [True, False]:
+            extents = self.get_plate_extents(back=back)
+            info["back_plate" if back else "front_plate"] = {"extents": extents, "width": extents[2] - extents[0], "height": extents[3] - extents[1]}
+        return info
+
+    def get_print_bed_problems(self, info=None, bed_size=PRINT_BED_SIZE, margin=5):
+        '''
+        list of descriptions of the plates which don't fit on the print bed (either way round), judged from the layout alone
+        '''
+        if info is None:
+            info = self.get_layout_info()
+        problems = []
+        for plate in ["back_plate", "front_plate"]:
+            width = info[plate]["width"] + margin * 2
+            height = info[plate]["height"] + margin * 2
+            if not size_fits_print_bed((width, height), bed_size[0], bed_size[1]):
+                problems.append("{} is {:.1f}x{:.1f}mm, too big for {}x{}mm print bed".format(plate, width, height, bed_size[0], bed_size[1]))
+        return problems
+
+    def fits_print_bed(self, bed_size=PRINT_BED_SIZE, margin=5):
+        '''
+        True if both plates fit on the print bed (either way round), judged from the layout alone
+        '''
+        problems = self.get_print_bed_problems(bed_size=bed_size, margin=margin)
+        for problem in problems:
+            print(problem)
+        return len(problems) == 0
+
+    def validate(self, bed_size=PRINT_BED_SIZE, margin=5):
+        '''
+        Pre-flight check of the design using only the layout - no solids are built, so this is quick enough to run before every build.
+
+        returns {"valid": bool, "problems": [str], "info": get_layout_info(), "timings": {stage: seconds}}
+        '''
+        problems = []
+        timings = {}
+
+        start = time.time()
+        for i, arbor in enumerate(self.arbors_for_plate):
+            wheel_r = arbor.get_max_radius()
+            for j, other_arbor in enumerate(self.arbors_for_plate):
+                if i == j:
+                    continue
+                distance = get_distance_between_two_points(self.bearing_positions[i][:2], self.bearing_positions[j][:2])
+                if distance < 0.1:
+                    #on the same axis (eg centred second hand)
+                    continue
+                if distance < wheel_r + other_arbor.arbor_d/2:
+                    problems.append("Arbor {} rod passes through arbor {} (distance {:.1f}mm, wheel radius {:.1f}mm)".format(j, i, distance, wheel_r))
+        timings["wheel_clashes"] = time.time() - start
+
+        start = time.time()
+        for pillar_pos in self.top_pillar_positions:
+            if self.clashes_with_wheel(pillar_pos[:2], self.top_pillar_r):
+                problems.append("Top pillar at ({:.1f}, {:.1f}) clashes with a wheel".format(pillar_pos[0], pillar_pos[1]))
+        for pillar_pos in self.bottom_pillar_positions:
+            if self.clashes_with_wheel(pillar_pos[:2], self.bottom_pillar_r):
+                problems.append("Bottom pillar at ({:.1f}, {:.1f}) clashes with a wheel".format(pillar_pos[0], pillar_pos[1]))
+        timings["pillar_clashes"] = time.time() - start
+
+        start = time.time()
+        if self.winding_key is not None and self.key_is_inside_dial():
+            key_distance = get_distance_between_two_points(self.bearing_positions[0][:2], self.hands_position)
+            key_r = self.key_hole_d/2
+            if key_distance + key_r > self.dial.inner_r and key_distance - key_r < self.dial.outside_d/2:
+                problems.append("Winding key ({:.1f}mm from the hands) overlaps the dial ring ({:.1f}-{:.1f}mm)".format(key_distance, self.dial.inner_r, self.dial.outside_d/2))
+        timings["key"] = time.time() - start
+
+        start = time.time()
+        info = self.get_layout_info()
+        timings["layout"] = time.time() - start
+
+        start = time.time()
+        for p, length in enumerate(info["rod_lengths"]):
+            if length <= 0:
+                problems.append("Pillar rod {} has length {:.1f}mm".format(p, length))
+        screw_lengths = info["screw_lengths"]
+        #plates held together with cut threaded rod don't use the fixing screw lengths, and plates using screws have no rods to check
+        for position in (["top", "bottom"] if info["fixing"] == "screws" else []):
+            required_length = screw_lengths[position + "_required"]
+            if screw_lengths[position + "_screw"] < required_length - 0.01:
+                problems.append("{} fixing screws ({}mm) are too short to go all the way through their nuts, need {:.1f}mm".format(position, screw_lengths[position + "_screw"], required_length))
+        timings["rods_and_screws"] = time.time() - start
+
+        start = time.time()
+        problems += self.get_print_bed_problems(info=info, bed_size=bed_size, margin=margin)
+        timings["print_bed"] = time.time() - start
+
+        for problem in problems:
+            print("VALIDATION: {}".format(problem))
+        print("Validated in {:.3f}s ({})".format(sum(timings.values()), ", ".join(["{} {:.3f}s".format(stage, t) for stage, t in timings.items()])))
+
+        return {"valid": len(problems) == 0, "problems": problems, "info": info, "timings": timings}
 
     def get_all_pillar_positions(self):
         return self.bottom_pillar_positions + self.top_pillar_positions
@@ -1481,7 +1782,7 @@ class SimpleClockPlates(BasePlates):
         holder = holder.cut(self.get_bearing_punch(holder_thick, bearing=get_bearing_info(self.arbors_for_plate[-1].arbor.arbor_d)).translate((self.bearing_positions[-1][0], self.bearing_positions[-1][1])))
         #rotate into position to cut fixing holes
         holder = holder.rotate((0, 0, 0), (0, 1, 0), 180).translate((0, 0, pillar_tall + holder_thick))
-        holder= holder.cut(self.get_fixing_screws_cutter().translate((0,0,-self.front_z)))
+        holder= holder.cut(self.get_plate_outline_model().get_fixing_screws_cutter().translate((0,0,-self.front_z)))
 
         if for_printing:
             #rotate back
@@ -1800,19 +2101,33 @@ class SimpleClockPlates(BasePlates):
 
                 return [(weightX, screwHoleY, extraSupport)]
 
+    def get_plate_outline_model_key(self):
+        '''
+        everything the PlateOutlineModel is built from, so it's rebuilt if the layout is changed after the plates are created
+        '''
+        return get_layout_key([self.bearing_positions, self.top_pillar_positions, self.bottom_pillar_positions, self.hands_position, self.plate_width,
+                               self.get_screwhole_positions(), [self.get_plate_outline_circles(back=back) for back in [True, False]],
+                               self.plate_top_fixings, self.plate_bottom_fixings, self.screws_from_back]) + (get_simple_settings(self.fixing_screws),)
+
+    def get_plate_outline_model(self):
+        '''
+        cached PlateOutlineModel, used to generate the parts derived from the plate layout
+        '''
+        key = self.get_plate_outline_model_key()
+        if self.plate_outline_model is None or self.plate_outline_model_key != key:
+            self.plate_outline_model = PlateOutlineModel(self)
+            self.plate_outline_model_key = key
+        return self.plate_outline_model
+
     def get_drill_template(self, drillHoleD=7, layer_thick=LAYER_THICK_EXTRATHICK):
 
-        screwHoles = self.get_screwhole_positions()
+        outline_model = self.get_plate_outline_model()
+        screwHoles = outline_model.screwhole_positions
 
         if len(screwHoles) <= 1:
             raise ValueError("Can't make template without at least two screwholes")
         #assumes aligned vertically
-        ys = [hole[1] for hole in screwHoles]
-        xs = [hole[0] for hole in screwHoles]
-        maxY = max(ys)
-        minY = min(ys)
-        minX = min(xs)
-        maxX = max(xs)
+        minX, minY, maxX, maxY = outline_model.get_screwhole_extents()
 
         minWidth = maxX - minX
         minHeight = maxY - minY
@@ -1835,17 +2150,18 @@ class SimpleClockPlates(BasePlates):
         return template
 
     def cut_anchor_bearing_in_standoff(self, standoff):
+        outline_model = self.get_plate_outline_model()
         bearingInfo = self.arbors_for_plate[-1].get_bearing(front=False)
 
 
         if self.pendulum_fixing.square_arbor_only_inside_plates():
             #no bearing!
-            standoff = standoff.union(self.pendulum_fixing.get_plate_fixing(self.plate_width).translate((self.bearing_positions[-1][0], self.bearing_positions[-1][1], self.get_plate_thick(standoff=True))))
+            standoff = standoff.union(self.pendulum_fixing.get_plate_fixing(self.plate_width).translate((outline_model.bearing_positions[-1][0], outline_model.bearing_positions[-1][1], self.get_plate_thick(standoff=True))))
         else:
             #bearing in back cock
             support = self.standoff_pillars_separate
             standoff = standoff.cut(self.get_bearing_punch(plate_thick=self.get_plate_thick(standoff=True), bearing=bearingInfo, bearing_on_top=True, with_support=support)
-                                    .translate((self.bearing_positions[-1][0], self.bearing_positions[-1][1], 0)))
+                                    .translate((outline_model.bearing_positions[-1][0], outline_model.bearing_positions[-1][1], 0)))
 
         return standoff
 
@@ -1868,7 +2184,8 @@ class SimpleClockPlates(BasePlates):
 
         '''
 
-        pillarPositions = self.top_pillar_positions if top else self.bottom_pillar_positions
+        outline_model = self.get_plate_outline_model()
+        pillarPositions = outline_model.top_pillar_positions if top else outline_model.bottom_pillar_positions
         pillarR = self.top_pillar_r if top else self.bottom_pillar_r
 
         pillarWallThick = 2
@@ -1905,10 +2222,10 @@ class SimpleClockPlates(BasePlates):
             # #TODO consider putting the screwhole INSIDE the pillar?
 
             if top:
-                screwHolePos = self.get_screwhole_positions()[0]
+                screwHolePos = outline_model.screwhole_positions[0]
             else:
                 #bottom pillar, heavy
-                screwHolePos = self.get_screwhole_positions()[1]
+                screwHolePos = outline_model.screwhole_positions[1]
 
             screwHoleSupportR = self.top_pillar_r  # (self.wallFixingScrewHeadD + 6)/2
 
@@ -1929,9 +2246,9 @@ class SimpleClockPlates(BasePlates):
             if not self.pendulum_fixing.arbor_entirely_within_plates():
                 # extend a back plate out to the bearing holder and wall fixing
                 #note assumes one top pillar, might not work with two
-                bearingHolder = cq.Workplane("XY").tag("base").moveTo((screwHolePos[0] + self.bearing_positions[-1][0]) / 2, (self.bearing_positions[-1][1] + self.top_pillar_positions[0][1]) / 2). \
-                    rect(self.top_pillar_r * 2, self.top_pillar_positions[0][1] - self.bearing_positions[-1][1]).extrude(self.get_plate_thick(standoff=True))
-                bearingHolder = bearingHolder.workplaneFromTagged("base").moveTo(self.bearing_positions[-1][0], self.bearing_positions[-1][1]).circle(screwHoleSupportR).extrude(self.get_plate_thick(standoff=True))
+                bearingHolder = cq.Workplane("XY").tag("base").moveTo((screwHolePos[0] + outline_model.bearing_positions[-1][0]) / 2, (outline_model.bearing_positions[-1][1] + outline_model.top_pillar_positions[0][1]) / 2). \
+                    rect(self.top_pillar_r * 2, outline_model.top_pillar_positions[0][1] - outline_model.bearing_positions[-1][1]).extrude(self.get_plate_thick(standoff=True))
+                bearingHolder = bearingHolder.workplaneFromTagged("base").moveTo(outline_model.bearing_positions[-1][0], outline_model.bearing_positions[-1][1]).circle(screwHoleSupportR).extrude(self.get_plate_thick(standoff=True))
                 bearingHolder = self.cut_anchor_bearing_in_standoff(bearingHolder)
 
                 z = 0
@@ -1941,7 +2258,7 @@ class SimpleClockPlates(BasePlates):
                 standoff = standoff.union(bearingHolder.translate((0,0,z)))
 
         #we're currently not in the right z position
-        standoff = standoff.cut(self.get_fixing_screws_cutter().translate((0,0,self.back_plate_from_wall)))
+        standoff = standoff.cut(outline_model.get_fixing_screws_cutter().translate((0,0,self.back_plate_from_wall)))
 
         if for_printing:
             if not top:
@@ -1953,6 +2270,9 @@ class SimpleClockPlates(BasePlates):
         return standoff
 
     def get_text(self, top_standoff=False, for_printing=False):
+        key = (top_standoff, for_printing)
+        if key in self.text_cache:
+            return self.text_cache[key]
 
         all_text = cq.Workplane("XY")
 
@@ -1979,7 +2299,7 @@ class SimpleClockPlates(BasePlates):
             raise ValueError("No text available, something has gone wrong")
 
         if self.text_on_standoffs:
-            all_text = all_text.cut(self.get_fixing_screws_cutter().translate((0,0,self.back_plate_from_wall)))
+            all_text = all_text.cut(self.get_plate_outline_model().get_fixing_screws_cutter().translate((0,0,self.back_plate_from_wall)))
             all_text = all_text.translate((0, 0, -self.back_plate_from_wall))
         else:
             all_text = self.punch_bearing_holes(all_text, back=True, make_plate_bigger=False)
@@ -1988,6 +2308,7 @@ class SimpleClockPlates(BasePlates):
         #     all_text = all_text.translate((0, 0, self.back_plate_from_wall))
         #     all_text = all_text.rotate((0,0,0),(1,0,0),180).translate((0,0, spaces[0].thick + self.get_plate_thick(standoff=True)))
 
+        self.text_cache[key] = all_text
         return all_text
 
     def get_text_spaces(self):
@@ -2138,8 +2459,8 @@ class SimpleClockPlates(BasePlates):
         if thick_override > 0:
             thick = thick_override
 
-        #the bulk material that holds the bearings
-        plate = cq.Workplane("XY").tag("base")
+        #the bulk material that holds the bearings, all worked out in 2D and extruded once
+        outline = PlateOutline()
         # TODO if I want to brign this back. Really this should be a different plate class.
         # if self.gear_train_layout==GearTrainLayout.ROUND:
         #     radius = self.compact_radius + plate_width / 2
@@ -2147,8 +2468,7 @@ class SimpleClockPlates(BasePlates):
         #     plate = plate.moveTo(self.bearing_positions[0][0], self.bearing_positions[0][1] + self.compact_radius).circle(radius).circle(radius - plate_width).extrude(thick)
         # elif self.gear_train_layout in [GearTrainLayout.VERTICAL, GearTrainLayout.COMPACT, GearTrainLayout.VERTICAL_COMPACT]:
             #rectangle that just spans from the top bearing to the bottom pillar (so we can vary the width of the bottom section later)
-        plate = plate.moveTo((self.bearing_positions[0][0] + self.bearing_positions[-1][0]) / 2, (self.bearing_positions[0][1] + self.bearing_positions[-1][1]) / 2).rect(plate_width, abs(self.bearing_positions[-1][1] - self.bearing_positions[0][1])).extrude(self.get_plate_thick(back))
-
+        outline.add_rect(((self.bearing_positions[0][0] + self.bearing_positions[-1][0]) / 2, (self.bearing_positions[0][1] + self.bearing_positions[-1][1]) / 2), plate_width, abs(self.bearing_positions[-1][1] - self.bearing_positions[0][1]))
 
         for bearing_index in range(len(self.bearing_positions)):
             #little arms for any bearings not vertically aligned
@@ -2161,20 +2481,15 @@ class SimpleClockPlates(BasePlates):
                     self.bearing_positions[bearing_index][:2],
                     self.bearing_positions[bearing_index + 1][:2]
                 ]
-                plate = plate.union(cq.Workplane("XY").circle(self.min_plate_width / 2).extrude(thick).translate(self.bearing_positions[bearing_index][:2]))
+                outline.add_circle(self.bearing_positions[bearing_index][:2], self.min_plate_width / 2)
                 # points = [(x, y) for x, y, z in points]
-                plate = plate.union(get_stroke_line(points, self.min_plate_width / 2, thick))
+                outline.add_stroke_line(points, self.min_plate_width / 2)
 
             elif sticky_out_ness > self.min_plate_width/2:
                 #just stick a tiny arm out the side for each bearing
                 bearing_pos = self.bearing_positions[bearing_index]
                 points = [(0, bearing_pos[1]), (bearing_pos[0], bearing_pos[1])]
-                plate = plate.union(get_stroke_line(points, self.min_plate_width, thick))
-
-
-
-
-        plate = plate.tag("top")
+                outline.add_stroke_line(points, self.min_plate_width)
 
         bottom_pillar_joins_plate_pos = self.bearing_positions[0][:2]
 
@@ -2200,13 +2515,13 @@ class SimpleClockPlates(BasePlates):
         if self.narrow_bottom_pillar and self.bottom_pillars == 2:
             #rectangle between the two and round off teh ends
             # plate = plate.union(cq.Workplane("XY").rect(abs(self.bottomPillarPositions[0][0] - self.bottomPillarPositions[1][0])), self.bottom_pillar_height)
-            plate = plate.union(get_stroke_line(self.bottom_pillar_positions, wide=self.bottom_pillar_height, thick = thick, style=StrokeStyle.SQUARE))
+            outline.add_stroke_line(self.bottom_pillar_positions, wide=self.bottom_pillar_height, style=StrokeStyle.SQUARE)
             for bottomPillarPos in self.bottom_pillar_positions:
-                plate = plate.union(get_stroke_line([(bottomPillarPos[0], bottomPillarPos[1] + self.bottom_pillar_height/2-self.bottom_pillar_width/2), (bottomPillarPos[0], bottomPillarPos[1] - self.bottom_pillar_height/2+self.bottom_pillar_width/2)], thick = thick, wide=self.bottom_pillar_width))
+                outline.add_stroke_line([(bottomPillarPos[0], bottomPillarPos[1] + self.bottom_pillar_height/2-self.bottom_pillar_width/2), (bottomPillarPos[0], bottomPillarPos[1] - self.bottom_pillar_height/2+self.bottom_pillar_width/2)], wide=self.bottom_pillar_width)
         else:
             for bottomPillarPos in self.bottom_pillar_positions:
-                plate = plate.union(get_stroke_line([bottomPillarPos, bottom_pillar_joins_plate_pos], wide=bottomBitWide, thick = thick))
-                plate = plate.union(cq.Workplane("XY").moveTo(bottomPillarPos[0], bottomPillarPos[1]).circle(self.bottom_pillar_r - 0.00001).extrude(thick))
+                outline.add_stroke_line([bottomPillarPos, bottom_pillar_joins_plate_pos], wide=bottomBitWide)
+                outline.add_circle(bottomPillarPos, self.bottom_pillar_r)
 
 
 
@@ -2218,10 +2533,12 @@ class SimpleClockPlates(BasePlates):
             #topmost bearing
         topOfPlate = self.bearing_positions[-1]
 
-        # link the top pillar to the rest of the plate
-        plate = plate.workplaneFromTagged("base").moveTo(topOfPlate[0] - top_pillar_r, topOfPlate[1]) \
-            .lineTo(top_pillar_positions[0][0] - top_pillar_r, top_pillar_positions[0][1]).radiusArc((top_pillar_positions[0][0] + top_pillar_r, top_pillar_positions[0][1]), top_pillar_r) \
-            .lineTo(topOfPlate[0] + top_pillar_r, topOfPlate[1]).close().extrude(thick)
+        # link the top pillar to the rest of the plate, rounded off around the pillar
+        outline.add_polygon([(topOfPlate[0] - top_pillar_r, topOfPlate[1]), (top_pillar_positions[0][0] - top_pillar_r, top_pillar_positions[0][1]),
+                             (top_pillar_positions[0][0] + top_pillar_r, top_pillar_positions[0][1]), (topOfPlate[0] + top_pillar_r, topOfPlate[1])])
+        outline.add_circle(top_pillar_positions[0], top_pillar_r)
+
+        plate = outline.extrude(thick)
 
         #not sure this will print well
         # if not back and self.front_plate_has_flat_front():
@@ -2242,13 +2559,15 @@ class SimpleClockPlates(BasePlates):
                 for screwPos in screwHolePositions:
                     plate = self.cut_wall_fixing_hole(plate, (screwPos[0], screwPos[1]), back_thick=screwHolebackThick, screw_head_d=self.wall_fixing_screw_head_d, add_extra_support=screwPos[2])
 
+            plate_builder = BooleanBuilder(plate)
             #the pillars
             if not self.pillars_separate:
                 for bottomPillarPos in self.bottom_pillar_positions:
-                    plate = plate.union(self.get_bottom_pillar().translate(bottomPillarPos).translate((0, 0, thick)))
-                plate = plate.union(self.get_top_pillar().translate(self.top_pillar_positions[0]).translate((0, 0, thick)))
+                    plate_builder.add(self.get_bottom_pillar().translate(bottomPillarPos).translate((0, 0, thick)))
+                plate_builder.add(self.get_top_pillar().translate(self.top_pillar_positions[0]).translate((0, 0, thick)))
 
-            plate = plate.cut(self.get_text())
+            plate_builder.cut(self.get_text())
+            plate = plate_builder.get_shape()
 
 
 
@@ -2265,13 +2584,13 @@ class SimpleClockPlates(BasePlates):
         if just_basic_shape:
             return plate
 
-        plate = self.punch_bearing_holes(plate, back)
-
         #screws to fix the plates together, with embedded nuts in the pillars
         if back:
-            plate = plate.cut(self.get_fixing_screws_cutter())
+            fixing_screws_cutter = self.get_plate_outline_model().get_fixing_screws_cutter()
         else:
-            plate = plate.cut(self.get_fixing_screws_cutter().translate((0, 0, -self.get_plate_thick(back=True) - self.plate_distance)))
+            fixing_screws_cutter = self.get_plate_outline_model().get_fixing_screws_cutter().translate((0, 0, -self.get_plate_thick(back=True) - self.plate_distance))
+
+        plate = self.punch_bearing_holes(plate, back, cutters=[fixing_screws_cutter])
 
         plate = self.apply_style_to_plate(plate, back=back)
 
@@ -2351,6 +2670,33 @@ class SimpleClockPlates(BasePlates):
 
         return (bottom_total_length, top_total_length, bottom_screw_length, top_screw_length)
 
+    def get_fixing_screw_required_lengths(self):
+        '''
+        (bottom, top) shortest fixing screws which go all the way through their nuts, following where get_fixing_screws_cutter puts the screw heads and nuts.
+
+        Heads of screws from the back sit at the top of the nut hole in the back. Nuts in a hole (embedded or in the wall standoff) can be pushed in until
+        they're on the end of the screw, otherwise the nut sticks out and the screw has to reach all the way through it.
+        '''
+        bottom_total_length, top_total_length, bottom_screw_length, top_screw_length = self.get_fixing_screw_length_info()
+        bottom_nut_base_z, top_nut_base_z, bottom_nut_hole_height, top_nut_hole_height = self.get_fixing_screw_nut_info()
+        nut_height = self.fixing_screws.get_nut_height()
+
+        required_lengths = []
+        for pillar, total_length, nut_hole_height in [(1, bottom_total_length, bottom_nut_hole_height), (0, top_total_length, top_nut_hole_height)]:
+            required_length = 0
+            for screw_from_back in self.screws_from_back[pillar]:
+                if screw_from_back:
+                    head_depth = nut_hole_height
+                    nut_depth = 0 if self.embed_nuts_in_plate else -nut_height
+                else:
+                    head_depth = 0
+                    #the nut can't go further in than the front of the back plate
+                    nut_depth = min(nut_hole_height, self.back_plate_from_wall + self.get_plate_thick(back=True)) - nut_height if self.embed_nuts_in_plate or self.back_plate_from_wall > 0 else -nut_height
+                required_length = max(required_length, total_length - head_depth - nut_depth)
+            required_lengths.append(required_length)
+
+        return tuple(required_lengths)
+
     def get_fixing_screw_nut_info(self):
         bottom_total_length, top_total_length, bottom_screw_length, top_screw_length = self.get_fixing_screw_length_info()
 
@@ -2544,7 +2890,7 @@ class SimpleClockPlates(BasePlates):
             bottom_pillar = bottom_pillar.cut(chainHoles.translate((-bottomPillarPos[0], -bottomPillarPos[1], self.endshake / 2)))
 
         #hack - assume screws are in the same place for both pillars for now
-        bottom_pillar = bottom_pillar.cut(self.get_fixing_screws_cutter().translate((-bottomPillarPos[0], -bottomPillarPos[1], -self.get_plate_thick(back=True))))
+        bottom_pillar = bottom_pillar.cut(self.get_plate_outline_model().get_fixing_screws_cutter().translate((-bottomPillarPos[0], -bottomPillarPos[1], -self.get_plate_thick(back=True))))
         return bottom_pillar
 
     def get_standoff_pillar(self, top=True, left=True):
@@ -2561,7 +2907,7 @@ class SimpleClockPlates(BasePlates):
         else:
             pillar_pos = self.bottom_pillar_positions[0 if left else 1]
 
-        pillar = pillar.cut(self.get_fixing_screws_cutter().translate((-pillar_pos[0], -pillar_pos[1], self.back_plate_from_wall - plate_thick)))
+        pillar = pillar.cut(self.get_plate_outline_model().get_fixing_screws_cutter().translate((-pillar_pos[0], -pillar_pos[1], self.back_plate_from_wall - plate_thick)))
 
         return pillar
 
@@ -2630,7 +2976,7 @@ class SimpleClockPlates(BasePlates):
 
             top_pillar = top_pillar.union(dial_holder.translate((0,0,self.plate_distance - thick)))
 
-        top_pillar = top_pillar.cut(self.get_fixing_screws_cutter().translate((-top_pillar_pos[0], -top_pillar_pos[1], -self.get_plate_thick(back=True))))
+        top_pillar = top_pillar.cut(self.get_plate_outline_model().get_fixing_screws_cutter().translate((-top_pillar_pos[0], -top_pillar_pos[1], -self.get_plate_thick(back=True))))
 
         return top_pillar
 
@@ -2739,7 +3085,14 @@ class SimpleClockPlates(BasePlates):
 
 
 
-    def punch_bearing_holes(self, plate, back, make_plate_bigger=True):
+    def punch_bearing_holes(self, plate, back, make_plate_bigger=True, cutters=None):
+        '''
+        cutters: optional list of extra cutters (eg fixing screws) to remove in the same boolean as the bearing holes
+        '''
+        plate_builder = BooleanBuilder(plate)
+        if cutters is not None:
+            for cutter in cutters:
+                plate_builder.cut(cutter)
         for i, pos in enumerate(self.bearing_positions):
             bearing = self.arbors_for_plate[i].get_bearing(front=not back)
             bearing_on_top = back
@@ -2805,17 +3158,17 @@ class SimpleClockPlates(BasePlates):
                         full_extendybob = full_extendybob.translate((0,0,self.get_plate_thick(back=back)))
                     else:
                         full_extendybob = full_extendybob.rotate((0,0,0),(1,0,0),180)
-                    plate = plate.union(full_extendybob.translate((pos[0], pos[1])))
+                    plate_builder.add(full_extendybob.translate((pos[0], pos[1])))
                 else:
                     #only the arbor extension will butt up against the front plate
                     front_plate_arbor_end_z = 0
                 if back:
-                    plate = plate.cut(screw.get_cutter(with_bridging=True, self_tapping=True).translate((pos[0], pos[1], 0)))
+                    plate_builder.cut(screw.get_cutter(with_bridging=True, self_tapping=True).translate((pos[0], pos[1], 0)))
                 else:
                     #little guide cone?
-                    plate = plate.cut(
+                    plate_builder.cut(
                         screw.get_cutter(ignore_head=True).translate((pos[0], pos[1], -self.plate_distance)))
-                    plate = plate.cut(cq.Solid.makeCone(radius2=screw.metric_thread/2, radius1=screw.metric_thread/2+1, height=2).translate((pos[0], pos[1], -front_plate_arbor_end_z)))
+                    plate_builder.cut(cq.Solid.makeCone(radius2=screw.metric_thread/2, radius1=screw.metric_thread/2+1, height=2).translate((pos[0], pos[1], -front_plate_arbor_end_z)))
 
             else:
                 outer_d =  bearing.outer_d
@@ -2824,13 +3177,10 @@ class SimpleClockPlates(BasePlates):
 
                 if outer_d > self.plate_width - self.bearing_wall_thick*2 and make_plate_bigger and not needs_plain_hole:
                     #this is a chunkier bearing, make the plate bigger
-                    try:
-                        plate = plate.union(cq.Workplane("XY").moveTo(pos[0], pos[1]).circle(outer_d / 2 + self.bearing_wall_thick).extrude(self.get_plate_thick(back=back)))
-                    except:
-                        print("wasn't able to make plate bigger for bearing")
+                    plate_builder.add(cq.Workplane("XY").moveTo(pos[0], pos[1]).circle(outer_d / 2 + self.bearing_wall_thick).extrude(self.get_plate_thick(back=back)))
 
                 if needs_plain_hole:
-                    plate = plate.cut(cq.Workplane("XY").circle(outer_d/2).extrude(self.get_plate_thick(back=back)).translate((pos[0], pos[1], 0)))
+                    plate_builder.cut(self.get_plain_hole_punch(self.get_plate_thick(back=back), outer_d).translate((pos[0], pos[1], 0)))
                 else:
                     bridging = False
                     if not back and not self.front_plate_printed_front_face_down():
@@ -2838,9 +3188,9 @@ class SimpleClockPlates(BasePlates):
                     if back and not bearing_on_top:
                         #so far only the bearing on the back plate for an escapement on the back
                         bridging = True
-                    plate = plate.cut(self.get_bearing_punch(plate_thick=self.get_plate_thick(back=back),bearing=bearing, bearing_on_top=bearing_on_top, with_support=bridging)
+                    plate_builder.cut(self.get_bearing_punch(plate_thick=self.get_plate_thick(back=back),bearing=bearing, bearing_on_top=bearing_on_top, with_support=bridging)
                                       .translate((pos[0], pos[1], 0)))
-        return plate
+        return plate_builder.get_shape()
 
     def cut_wall_fixing_hole(self, plate, screwhole_pos, screw_head_d = 9, screw_body_d = 6, slot_length = 7, back_thick = -1, add_extra_support=False, plate_thick=-1):
         '''
@@ -3297,11 +3647,20 @@ class SimpleClockPlates(BasePlates):
     def get_winding_key(self):
         return self.winding_key
 
-    def get_parts_in_situ(self):
+    def get_parts_in_situ(self, progress_callback=None):
+        '''
+        progress_callback: optional function(stage, fraction) called between building each part, may raise to abort
+        '''
+        def report_progress(stage):
+            if progress_callback is not None:
+                progress_callback(stage, 0)
+
         shapes = {}
 
+        report_progress("back_plate")
         bottom_plate = self.get_plate(True, for_printing=False)
         shapes["back_plate"] = bottom_plate
+        report_progress("front_plate")
         top_plate = self.get_plate(False, for_printing=False).translate((0, 0, self.plate_distance + self.get_plate_thick(back=True)))
         shapes["front_plate"] = top_plate
         front_of_clock_z = self.get_plate_thick(True) + self.get_plate_thick(False) + self.plate_distance
@@ -3311,6 +3670,7 @@ class SimpleClockPlates(BasePlates):
 
         standoff_pillars = None
         if self.pillars_separate:
+            report_progress("pillars")
             pillars = cq.Workplane("XY")
             for bottom_pillar_pos in self.bottom_pillar_positions:
                 pillars = pillars.add(self.get_pillar(top=False).translate(bottom_pillar_pos).translate((0, 0, self.get_plate_thick(back=True))))
@@ -3320,6 +3680,7 @@ class SimpleClockPlates(BasePlates):
 
         standoffs = None
         if self.back_plate_from_wall > 0:
+            report_progress("standoffs")
             standoffs = cq.Workplane("XY")
 
             # need wall standoffs
@@ -3347,6 +3708,7 @@ class SimpleClockPlates(BasePlates):
             shapes["front_anchor_holder"] = front_bearing_holder
 
         if self.need_motion_works_holder:
+            report_progress("motion_works_holder")
             motion_works_holder = self.get_motion_works_holder().translate((0, 0, front_of_clock_z))
             plates = plates.add(motion_works_holder)
             shapes["motion_works_holder"] = motion_works_holder
@@ -3360,11 +3722,11 @@ class SimpleClockPlates(BasePlates):
         shapes["plates"] = plates
         return shapes
 
-    def get_assembled(self, one_peice = True):
+    def get_assembled(self, one_peice = True, progress_callback=None):
         '''
         3D model of teh assembled plates
         '''
-        shapes = self.get_parts_in_situ()
+        shapes = self.get_parts_in_situ(progress_callback=progress_callback)
         if "detail" not in shapes:
             shapes["detail"] = None
 
@@ -3407,10 +3769,51 @@ class SimpleClockPlates(BasePlates):
 
         return base, top, detail
 
-    def get_printable_parts(self):
+    def get_independent_parts(self):
+        '''
+        The slow parts which only depend on the layout and not on each other, so can be built at the same time. {name: (method name, {kwargs})}
+        '''
+        parts = {
+            "back": ("get_plate", {"back": True, "for_printing": True}),
+        }
+        if not self.split_detailed_plate:
+            parts["front"] = ("get_plate", {"back": False, "for_printing": True})
+        if self.back_plate_from_wall > 0:
+            parts["wall_standoff_top"] = ("get_wall_standoff", {"top": True})
+            parts["wall_standoff_bottom"] = ("get_wall_standoff", {"top": False})
+        if self.need_motion_works_holder:
+            parts["motion_works_holder"] = ("get_motion_works_holder", {})
+        if self.motion_works.cannon_pinion_friction_ring:
+            parts["friction_clip"] = ("get_cannon_pinion_friction_clip", {})
+        if len(self.get_screwhole_positions()) > 1:
+            parts["drill_template_6mm"] = ("get_drill_template", {"drillHoleD": 6, "layer_thick": 0.4})
+        return parts
+
+    def get_prebuilt_parts(self, processes=None):
+        '''
+        if processes is set, build all the independent parts in parallel now. Returns a function(name) to get a part, building it here if it wasn't prebuilt
+        '''
+        parts = self.get_independent_parts()
+        prebuilt = {}
+        if processes is not None:
+            prebuilt = build_plate_parts(self, parts, processes=processes)
+
+        def get_part(name):
+            if name in prebuilt:
+                return prebuilt[name]
+            method_name, kwargs = parts[name]
+            return getattr(self, method_name)(**kwargs)
+
+        return get_part
+
+    def get_printable_parts(self, processes=None):
+        '''
+        processes: if set, build the independent parts (plates, standoffs etc) in this many worker processes. None to build everything in this process.
+        '''
+        get_part = self.get_prebuilt_parts(processes)
         parts = []
         strong_part_instructions = "Print with larger nozzle if possible and add extra perimeters, top and bottom layers, for strength"
-        parts.append(BillOfMaterials.PrintedPart("back", self.get_plate(True, for_printing=True), tolerance=self.export_tolerance,
+        parts.append(BillOfMaterials.PrintedPart("back", get_part("back"), tolerance=self.export_tolerance,
                                                  printing_instructions=strong_part_instructions))
 
         if self.split_detailed_plate:
@@ -3422,7 +3825,7 @@ class SimpleClockPlates(BasePlates):
                 parts.append(BillOfMaterials.PrintedPart("front_detail", front_plate_detail, tolerance=self.export_tolerance,
                                             purpose="Detail to be combined with top of front plate", printing_instructions="Combine with front top for multicoloured print"))
         else:
-            parts.append(BillOfMaterials.PrintedPart("front", self.get_plate(False, for_printing=True), tolerance=self.export_tolerance))
+            parts.append(BillOfMaterials.PrintedPart("front", get_part("front"), tolerance=self.export_tolerance))
             detail = self.get_plate_detail(back=False, for_printing=True)
             if detail is not None:
                 parts.append(BillOfMaterials.PrintedPart("front_detail", detail , tolerance=self.export_tolerance))
@@ -3440,19 +3843,19 @@ class SimpleClockPlates(BasePlates):
                                                      printing_instructions=strong_part_instructions))
 
         if self.motion_works.cannon_pinion_friction_ring:
-            parts.append(BillOfMaterials.PrintedPart("friction_clip", self.get_cannon_pinion_friction_clip(),
+            parts.append(BillOfMaterials.PrintedPart("friction_clip", get_part("friction_clip"),
                                         purpose="Clip around cannon pinion to remove slack from minute hand and keep in place"))
 
         if len(self.get_screwhole_positions()) > 1:
             #need a template to help drill the screwholes!
-            parts.append(BillOfMaterials.PrintedPart("drill_template_6mm", self.get_drill_template(6, layer_thick=0.4),
+            parts.append(BillOfMaterials.PrintedPart("drill_template_6mm", get_part("drill_template_6mm"),
                                                      purpose="Guide for drilling holes in wall to hang clock"))
 
         if self.back_plate_from_wall > 0:
-            parts.append(BillOfMaterials.PrintedPart("wall_standoff_top", self.get_wall_standoff(top=True), purpose="Top wall fixing",
+            parts.append(BillOfMaterials.PrintedPart("wall_standoff_top", get_part("wall_standoff_top"), purpose="Top wall fixing",
                                                      printing_instructions=strong_part_instructions))
 
-            bottom_standoff = self.get_wall_standoff(top=False)
+            bottom_standoff = get_part("wall_standoff_bottom")
             if bottom_standoff is not None:
                 parts.append(BillOfMaterials.PrintedPart("wall_standoff_bottom", bottom_standoff, purpose="Bottom wall fixing",
                                                      printing_instructions=strong_part_instructions))
@@ -3473,7 +3876,7 @@ class SimpleClockPlates(BasePlates):
 
 
         if self.need_motion_works_holder:
-            parts.append(BillOfMaterials.PrintedPart("motion_works_holder", self.get_motion_works_holder(),
+            parts.append(BillOfMaterials.PrintedPart("motion_works_holder", get_part("motion_works_holder"),
                                                      purpose="Screws to front plate to hold motion works where a bearing would otherwise be in the way, or for a central seconds hand"))
 
         if self.need_front_anchor_bearing_holder():
@@ -3481,17 +3884,21 @@ class SimpleClockPlates(BasePlates):
                                                      purpose="Screw to front plate to hold anchor for an exposed escapement"))
 
         if self.motion_works.cannon_pinion_friction_ring:
-            parts.append(BillOfMaterials.PrintedPart("friction_clip", self.get_cannon_pinion_friction_clip(), purpose="Hold cannon pinion in place and add friction to remove slack in minute hand"))
+            parts.append(BillOfMaterials.PrintedPart("friction_clip", get_part("friction_clip"), purpose="Hold cannon pinion in place and add friction to remove slack in minute hand"))
 
         return parts
 
-    def output_STLs(self, name="clock", path="../out"):
+    def output_STLs(self, name="clock", path="../out", processes=None):
+        '''
+        processes: if set, build the independent parts (plates, standoffs etc) in this many worker processes first
+        '''
+        get_part = self.get_prebuilt_parts(processes)
 
         if self.dial is not None:
-            self.dial.output_STLs(name, path)
+            self.dial.output_STLs(name, path, processes=processes)
 
         front_detail = self.get_plate_detail(back=False, for_printing=True)
-        export_STL(self.get_plate(True, for_printing=True), "plate_back", name, path, tolerance=self.export_tolerance)
+        export_STL(get_part("back"), "plate_back", name, path, tolerance=self.export_tolerance)
 
 
         if self.split_detailed_plate:
@@ -3500,7 +3907,7 @@ class SimpleClockPlates(BasePlates):
             export_STL(front_plate_top, "plate_front_top", name, path, tolerance=self.export_tolerance)
             export_STL(front_plate_detail, "plate_front_detail", name, path, tolerance=self.export_tolerance)
         else:
-            export_STL(self.get_plate(False, for_printing=True), "plate_front", name, path, tolerance=self.export_tolerance)
+            export_STL(get_part("front"), "plate_front", name, path, tolerance=self.export_tolerance)
             export_STL(front_detail, "plate_front_detail", name, path, tolerance=self.export_tolerance)
 
 
@@ -3514,18 +3921,18 @@ class SimpleClockPlates(BasePlates):
         if self.motion_works.cannon_pinion_friction_ring:
             out = os.path.join(path, "{}_friction_clip.stl".format(name))
             print("Outputting ", out)
-            exporters.export(self.get_cannon_pinion_friction_clip(), out)
+            exporters.export(get_part("friction_clip"), out)
 
         if len(self.get_screwhole_positions()) > 1:
             #need a template to help drill the screwholes!
             out = os.path.join(path, "{}_drill_template_6mm.stl".format(name))
             print("Outputting ", out)
-            exporters.export(self.get_drill_template(6, layer_thick=0.4), out)
+            exporters.export(get_part("drill_template_6mm"), out)
 
         if self.back_plate_from_wall > 0:
-            export_STL(self.get_wall_standoff(top=True), "wall_standoff_top", clock_name=name, path=path)
+            export_STL(get_part("wall_standoff_top"), "wall_standoff_top", clock_name=name, path=path)
 
-            bottom_standoff = self.get_wall_standoff(top=False)
+            bottom_standoff = get_part("wall_standoff_bottom")
             export_STL(bottom_standoff, "wall_standoff_bottom", clock_name=name, path=path)
 
             if self.text_on_standoffs:
@@ -3557,7 +3964,7 @@ class SimpleClockPlates(BasePlates):
         if self.need_motion_works_holder:
             out = os.path.join(path, "{}_motion_works_holder.stl".format(name))
             print("Outputting ", out)
-            exporters.export(self.get_motion_works_holder(), out)
+            exporters.export(get_part("motion_works_holder"), out)
 
         key = self.get_winding_key()
         if key is not None:
@@ -3708,6 +4115,24 @@ class MantelClockPlates(SimpleClockPlates):
     def get_plate_shape(self):
         return PlateShape.MANTEL
 
+    def get_plate_outline_circles(self, back=True):
+        '''
+        as SimpleClockPlates, plus what get_plate adds for the mantel plates: the key bearing and, on the front, the arm for the moon holder
+        and the moon complication fixings
+        '''
+        circles = super().get_plate_outline_circles(back=back)
+        circles.append(((0, 0), self.going_train.powered_wheel.key_bearing.outer_d / 2 + self.bearing_wall_thick * 1.5))
+        if not back and self.moon_complication is not None:
+            #the arm is cut off at the edge of the dial
+            moon_holder_wide = self.get_moon_holder_info()["wide"]
+            circles.append(((0, self.hands_position[1] + self.dial.outside_d/2 - moon_holder_wide/2), moon_holder_wide/2))
+            for i, pos in enumerate(self.get_moon_complication_fixings_absolute()):
+                circles.append((pos, self.moon_complication.arbor_d*2))
+                if i == 1 and not self.moon_complication.on_left:
+                    #the little arm on the right (small_arm_wide in get_plate)
+                    circles.append(((self.bottom_pillar_positions[1][0], pos[1]), 8/2))
+        return circles
+
     def get_top_pillar_positions(self, for_standoffs=True):
 
         if not for_standoffs:
@@ -3908,7 +4333,9 @@ class MantelClockPlates(SimpleClockPlates):
         if thick_override > 0:
             plate_thick = thick_override
 
-        plate = cq.Workplane("XY")
+        #arms and bearing holders are worked out in 2D, anything that needs 3D operations is fused with them at the end
+        outline = PlateOutline()
+        plate_builder = BooleanBuilder()
 
         main_arm_wide = self.plate_width
         medium_arm_wide = get_bearing_info(3).outer_d + self.bearing_wall_thick * 2
@@ -3925,32 +4352,32 @@ class MantelClockPlates(SimpleClockPlates):
 
         #link up the side pillars with each other
         for side in [0,1]:
-            plate = plate.union(get_stroke_line([top_pillar_positions[side], self.bottom_pillar_positions[side]], wide=main_arm_wide, thick = plate_thick))
-            plate = plate.union(get_stroke_line([self.bottom_pillar_positions[side], self.bearing_positions[0][:2]], wide=main_arm_wide, thick=plate_thick))
+            outline.add_stroke_line([top_pillar_positions[side], self.bottom_pillar_positions[side]], wide=main_arm_wide)
+            outline.add_stroke_line([self.bottom_pillar_positions[side], self.bearing_positions[0][:2]], wide=main_arm_wide)
 
         # plate = plate.union(get_stroke_line([self.top_pillar_positions[side], self.bearing_positions[-2][:2]], wide=main_arm_wide, thick=plate_thick))
         if not back:
             #arch over the top
             #not for back because point holding the bearing that isn't there for the anchor arbor!
             if self.symetrical:
-                plate = plate.union(get_stroke_line([top_pillar_positions[0], self.bearing_positions[-1][:2], top_pillar_positions[1]], wide=main_arm_wide, thick=plate_thick))
+                outline.add_stroke_line([top_pillar_positions[0], self.bearing_positions[-1][:2], top_pillar_positions[1]], wide=main_arm_wide)
 
             else:
-                plate = plate.union(get_stroke_line([self.bearing_positions[-2][:2], self.bearing_positions[-1][:2]], wide=main_arm_wide, thick=plate_thick))
-                plate = plate.union(get_stroke_line([self.top_pillar_positions[0], self.bearing_positions[-1][:2]], wide=main_arm_wide, thick=plate_thick))
-                plate = plate.union(get_stroke_line([self.top_pillar_positions[1], self.bearing_positions[-2][:2]], wide=main_arm_wide, thick=plate_thick))
+                outline.add_stroke_line([self.bearing_positions[-2][:2], self.bearing_positions[-1][:2]], wide=main_arm_wide)
+                outline.add_stroke_line([self.top_pillar_positions[0], self.bearing_positions[-1][:2]], wide=main_arm_wide)
+                outline.add_stroke_line([self.top_pillar_positions[1], self.bearing_positions[-2][:2]], wide=main_arm_wide)
 
         if back and not self.symetrical:
             #can't immediately remember what this is for
-            plate = plate.union(get_stroke_line([self.top_pillar_positions[1],self.bearing_positions[-2][:2]], wide=main_arm_wide, thick=plate_thick))
+            outline.add_stroke_line([self.top_pillar_positions[1],self.bearing_positions[-2][:2]], wide=main_arm_wide)
 
         for foot_pos in self.bottom_pillar_positions:
             #give it little feet
-            plate = plate.union(cq.Workplane("XY").rect(self.bottom_pillar_r*2, self.bottom_pillar_r).extrude(plate_thick).edges("|Z and <Y").fillet(self.foot_fillet_r)
+            plate_builder.add(cq.Workplane("XY").rect(self.bottom_pillar_r*2, self.bottom_pillar_r).extrude(plate_thick).edges("|Z and <Y").fillet(self.foot_fillet_r)
                                 .translate(foot_pos).translate((0,-self.bottom_pillar_r/2)))
 
         #barrel to minute wheel
-        plate = plate.union(get_stroke_line([self.bearing_positions[0][:2], self.bearing_positions[self.going_train.powered_wheels][:2]], wide=medium_arm_wide, thick=plate_thick))
+        outline.add_stroke_line([self.bearing_positions[0][:2], self.bearing_positions[self.going_train.powered_wheels][:2]], wide=medium_arm_wide)
 
         left_line = Line(self.bottom_pillar_positions[0], another_point=top_pillar_positions[0])
         right_line = Line(self.bottom_pillar_positions[1], another_point=top_pillar_positions[1])
@@ -3963,7 +4390,7 @@ class MantelClockPlates(SimpleClockPlates):
         right_point = right_line.intersection(cross_support_line)
 
         #across the front of the plate
-        plate = plate.union(get_stroke_line([left_point, right_point], wide=medium_arm_wide, thick=plate_thick))
+        outline.add_stroke_line([left_point, right_point], wide=medium_arm_wide)
 
         link_pillar_index = 0 if self.zigzag_side else 1
         #idea - 3 thin arms all linking to the second hand arbor? medium from barrel to minute wheel, thick just for the edges
@@ -3972,19 +4399,19 @@ class MantelClockPlates(SimpleClockPlates):
                  top_pillar_positions[link_pillar_index]
                  ]
         for link_pos in links:
-            plate = plate.union(get_stroke_line([self.bearing_positions[self.going_train.powered_wheels + 2][:2], link_pos], wide=small_arm_wide, thick=plate_thick))
+            outline.add_stroke_line([self.bearing_positions[self.going_train.powered_wheels + 2][:2], link_pos], wide=small_arm_wide)
 
         if self.symetrical and self.no_upper_wheel_in_centre:
             links = [self.hands_position,
                      self.top_pillar_positions[1]
                      ]
             for link_pos in links:
-                plate = plate.union(get_stroke_line([self.bearing_positions[-2][:2], link_pos], wide=small_arm_wide, thick=plate_thick))
+                outline.add_stroke_line([self.bearing_positions[-2][:2], link_pos], wide=small_arm_wide)
 
         if self.symetrical and self.second_hand and back:
             pillar_index = 1 if self.zigzag_side else 0
             #tidy up the escape wheel bearing holder
-            plate = plate.union(get_stroke_line([top_pillar_positions[pillar_index], self.bearing_positions[-2][:2]], wide=main_arm_wide, thick=plate_thick))
+            outline.add_stroke_line([top_pillar_positions[pillar_index], self.bearing_positions[-2][:2]], wide=main_arm_wide)
 
 
         for i, pos in enumerate(self.bearing_positions):
@@ -3993,9 +4420,9 @@ class MantelClockPlates(SimpleClockPlates):
 
             if not (i == len(self.bearing_positions)-1 and back):
                 #only if not the back plate and the hole for the anchor arbor
-                plate = plate.union(cq.Workplane("XY").circle(bearing_info.outer_d / 2 + self.bearing_wall_thick).extrude(plate_thick).translate(pos[:2]))
+                outline.add_circle(pos[:2], bearing_info.outer_d / 2 + self.bearing_wall_thick)
 
-        plate = plate.union(cq.Workplane("XY").circle(self.going_train.powered_wheel.key_bearing.outer_d / 2 + self.bearing_wall_thick * 1.5).extrude(plate_thick))
+        outline.add_circle((0, 0), self.going_train.powered_wheel.key_bearing.outer_d / 2 + self.bearing_wall_thick * 1.5)
 
         if not back and self.moon_complication is not None:
             #little arm that sticks off the top to hold the moon holder
@@ -4004,30 +4431,33 @@ class MantelClockPlates(SimpleClockPlates):
                                                 wide=moon_holder_wide, thick=plate_thick, style=StrokeStyle.SQUARE)
             moon_holder_arm = moon_holder_arm.intersect(cq.Workplane("XY").moveTo(self.hands_position[0], self.hands_position[1]).circle(self.dial.outside_d/2).extrude(plate_thick))
             moon_holder_arm = moon_holder_arm.edges("|Z").fillet(self.moon_holder.fillet_r)
-            plate = plate.union(moon_holder_arm)
+            plate_builder.add(moon_holder_arm)
 
             for i,pos in enumerate(self.get_moon_complication_fixings_absolute()):
-                plate = plate.union(cq.Workplane("XY").moveTo(pos[0], pos[1]).circle(self.moon_complication.arbor_d*2).extrude(plate_thick))
+                outline.add_circle(pos, self.moon_complication.arbor_d*2)
                 if i == 1 and not self.moon_complication.on_left:
                     #the little arm on the right
-                    plate = plate.union(get_stroke_line([pos, (self.bottom_pillar_positions[1][0], pos[1])], wide=small_arm_wide, thick=plate_thick))
+                    outline.add_stroke_line([pos, (self.bottom_pillar_positions[1][0], pos[1])], wide=small_arm_wide)
                 if not just_basic_shape:
-                    plate = plate.cut(self.moon_complication.screws.get_cutter(with_bridging=True, layer_thick=self.layer_thick).translate(pos))
+                    plate_builder.cut(self.moon_complication.screws.get_cutter(with_bridging=True, layer_thick=self.layer_thick).translate(pos))
+
 
 
+        plate_builder.add(outline.extrude(plate_thick))
+        plate = plate_builder.get_shape()
 
         if just_basic_shape:
             return plate
 
         if back:
-            plate = plate.cut(self.get_fixing_screws_cutter())
+            plate = plate.cut(self.get_plate_outline_model().get_fixing_screws_cutter())
 
             plate = self.rear_additions_to_plate(plate)
 
 
 
         else:
-            plate = plate.cut(self.get_fixing_screws_cutter().translate((0, 0, -self.get_plate_thick(back=True) - self.plate_distance)))
+            plate = plate.cut(self.get_plate_outline_model().get_fixing_screws_cutter().translate((0, 0, -self.get_plate_thick(back=True) - self.plate_distance)))
 
         ratchet_screws_cutter = self.get_spring_ratchet_screws_cutter(back_plate=back, plate_thick=plate_thick)
         if ratchet_screws_cutter is not None:
@@ -4154,7 +4584,7 @@ class MantelClockPlates(SimpleClockPlates):
         standoff = self.cut_anchor_bearing_in_standoff(standoff)
 
         standoff = standoff.translate((0,0,-self.back_plate_from_wall))
-        standoff = standoff.cut(self.get_fixing_screws_cutter())
+        standoff = standoff.cut(self.get_plate_outline_model().get_fixing_screws_cutter())
 
         return standoff
 
@@ -4310,7 +4740,7 @@ class MantelClockPlates(SimpleClockPlates):
             pillar = pillar.extrude(self.plate_distance)
 
         # hack - assume screws are in the same place for both pillars for now
-        pillar = pillar.cut(self.get_fixing_screws_cutter().translate((-self.bottom_pillar_positions[0][0], -self.bottom_pillar_positions[0][1], -self.get_plate_thick(back=True))))
+        pillar = pillar.cut(self.get_plate_outline_model().get_fixing_screws_cutter().translate((-self.bottom_pillar_positions[0][0], -self.bottom_pillar_positions[0][1], -self.get_plate_thick(back=True))))
 
 
         return pillar
@@ -4891,6 +5321,17 @@ class RoundClockPlates(SimpleClockPlates):
 
         return plate
 
+    def get_plate_outline_circles(self, back=True):
+        circles = super().get_plate_outline_circles(back=back)
+        centre = self.hands_position
+        edge_r = self.plate_width / 2
+        if self.fully_round:
+            circles.append((centre, self.radius + edge_r))
+        else:
+            #semicircle over the top
+            circles += [((centre[0] + x * self.radius, centre[1] + y * self.radius), edge_r) for x, y in [(-1, 0), (0, 1), (1, 0)]]
+        return circles
+
     def get_plate(self, back=True, for_printing=True, just_basic_shape=False, thick_override=-1):
 
         plate_thick = self.get_plate_thick(back=back)
@@ -4906,8 +5347,11 @@ class RoundClockPlates(SimpleClockPlates):
 
         # plate = cq.Workplane("XY").moveTo(self.hands_position[0], self.hands_position[1]).circle(self.radius+main_arm_wide/2).circle(self.radius-main_arm_wide/2).extrude(plate_thick)
 
+        #all the arms are fused in one go
+        plate_builder = BooleanBuilder()
+
         if self.fully_round:
-            plate = cq.Workplane("XY").circle(self.radius + main_arm_wide/2).circle(self.radius - main_arm_wide/2).extrude(plate_thick).translate(self.hands_position)
+            plate_builder.add(cq.Workplane("XY").circle(self.radius + main_arm_wide/2).circle(self.radius - main_arm_wide/2).extrude(plate_thick).translate(self.hands_position))
 
             if not self.fewer_arms:
                 #horizontal arm to add extra support to the great wheel
@@ -4919,27 +5363,30 @@ class RoundClockPlates(SimpleClockPlates):
                     extra_width_at_bottom=5
 
                 bottom_arm = cq.Workplane("XY").rect(self.radius * 2, self.bottom_arm_wide + extra_width_at_bottom).extrude(plate_thick).translate(self.bearing_positions[0][:2]).translate((0,-extra_width_at_bottom))
-                plate = plate.union(bottom_arm.intersect(cq.Workplane("XY").circle(self.radius + main_arm_wide/2).extrude(plate_thick).translate(self.hands_position)))
+                plate_builder.add(bottom_arm.intersect(cq.Workplane("XY").circle(self.radius + main_arm_wide/2).extrude(plate_thick).translate(self.hands_position)))
             else:
                 #two angled arms
                 angles = [-math.pi/4, -math.pi*3/4]
                 for angle in angles:
                     line = Line(self.bearing_positions[0][:2], direction=polar(angle))
                     end = line.intersection_with_circle(self.hands_position, self.radius)[0]
-                    plate = plate.union(get_stroke_line([line.start, end], wide=main_arm_wide, thick=plate_thick))
+                    plate_builder.add(get_stroke_line([line.start, end], wide=main_arm_wide, thick=plate_thick))
         else:
             #semicircular with rectangle on the bottom
-            plate = get_stroke_arc((self.radius,centre[1]), (-self.radius,centre[1]), self.radius, main_arm_wide, plate_thick)
+            plate_builder.add(get_stroke_arc((self.radius,centre[1]), (-self.radius,centre[1]), self.radius, main_arm_wide, plate_thick))
 
-            plate = plate.union(get_stroke_line([(self.radius,centre[1]), self.bottom_pillar_positions[1], self.bottom_pillar_positions[0], [-self.radius,centre[1]]], thick=plate_thick, wide=medium_arm_wide))
+            plate_builder.add(get_stroke_line([(self.radius,centre[1]), self.bottom_pillar_positions[1], self.bottom_pillar_positions[0], [-self.radius,centre[1]]], thick=plate_thick, wide=medium_arm_wide))
 
             #beef up bottom arm
-            plate = plate.union(cq.Workplane("XY").rect(self.radius*2, self.bottom_arm_wide).extrude(plate_thick).translate(self.bearing_positions[0][:2]))
+            plate_builder.add(cq.Workplane("XY").rect(self.radius*2, self.bottom_arm_wide).extrude(plate_thick).translate(self.bearing_positions[0][:2]))
 
         #vertical link
         # plate = plate.union(cq.Workplane("XY").rect(medium_arm_wide, self.radius*2).extrude(plate_thick))
         line_wide = medium_arm_wide
 
+        #the straight arms are worked out in 2D and extruded once
+        arms_outline = PlateOutline()
+
         for i, bearing_pos in enumerate(self.bearing_positions):
             if i == self.going_train.powered_wheels and not self.centred_second_hand:
                 #the minute wheel, in the centre (usually)
@@ -4998,16 +5445,19 @@ class RoundClockPlates(SimpleClockPlates):
             if bearing_distance > self.radius:
                 end = bearing_pos[:2]
 
-            plate = plate.union(get_stroke_line([centre, end], line_wide, plate_thick))
+            arms_outline.add_stroke_line([centre, end], line_wide)
 
 
         if self.centred_second_hand and self.going_train.wheels == 3:
             #want some extra arms on the top left
             top_left_pillar = self.top_pillar_positions[0] if self.top_pillar_positions[0][0] < self.top_pillar_positions[1][0] else self.top_pillar_positions[1]
-            plate = plate.union(get_stroke_line([centre, top_left_pillar], small_arm_wide, plate_thick))
+            arms_outline.add_stroke_line([centre, top_left_pillar], small_arm_wide)
 
 
 
+        plate_builder.add(arms_outline.extrude(plate_thick))
+        plate = plate_builder.get_shape()
+
         if just_basic_shape:
 
             try:
@@ -5024,7 +5474,7 @@ class RoundClockPlates(SimpleClockPlates):
             plate = self.add_moon_complication_arms(plate, plate_thick, cut_holes=False)
             return plate
 
-        plate = plate.cut(self.get_fixing_screws_cutter())
+        plate = plate.cut(self.get_plate_outline_model().get_fixing_screws_cutter())
         if back:
 
             plate = self.rear_additions_to_plate(plate)
@@ -5099,7 +5549,7 @@ class RoundClockPlates(SimpleClockPlates):
         for pos in self.leg_pillar_positions:
             legs = legs.union(cq.Workplane("XY").moveTo(pos[0], pos[1]).rect(width,width+self.foot_fillet_r*2).extrude(thick).edges("|Z and <Y").fillet(self.foot_fillet_r))
 
-        legs = legs.cut(self.get_fixing_screws_cutter())
+        legs = legs.cut(self.get_plate_outline_model().get_fixing_screws_cutter())
 
         for pillar_pos in self.leg_pillar_positions:
             if back:
@@ -5268,10 +5718,11 @@ class RoundClockPlates(SimpleClockPlates):
 
     def get_bottom_wall_standoff(self, for_printing=True):
         plate_thick = self.get_plate_thick(standoff=True)
+        outline_model = self.get_plate_outline_model()
 
-        standoff = get_stroke_line(self.bottom_pillar_positions, wide=self.pillar_r*2, thick = plate_thick)
+        standoff = get_stroke_line(outline_model.bottom_pillar_positions, wide=self.pillar_r*2, thick = plate_thick)
 
-        wall_fixing_pos = self.get_screwhole_positions()[1][:2]#(0, self.bottom_pillar_positions[0][1])
+        wall_fixing_pos = outline_model.screwhole_positions[1][:2]#(0, self.bottom_pillar_positions[0][1])
 
         #filled in semicircle. I think it might be overkill:
         # standoff = get_stroke_arc(self.bottom_pillar_positions[0], self.bottom_pillar_positions[1], self.radius, wide=self.pillar_r*2, thick=plate_thick, fill_in=self.wall_mounted)
@@ -5291,7 +5742,7 @@ class RoundClockPlates(SimpleClockPlates):
         standoff = standoff.translate((0, 0, -self.back_plate_from_wall))
         if self.text_on_standoffs:
             standoff = standoff.cut(self.get_text(top_standoff=False))
-        standoff = standoff.cut(self.get_fixing_screws_cutter())
+        standoff = standoff.cut(outline_model.get_fixing_screws_cutter())
 
         if for_printing and self.standoff_pillars_separate:
             standoff = standoff.rotate((0,0,0),(1,0,0),180)
@@ -5303,22 +5754,23 @@ class RoundClockPlates(SimpleClockPlates):
         '''
 
         plate_thick = self.get_plate_thick(standoff=True)
+        outline_model = self.get_plate_outline_model()
         if self.wall_mounted:
-            wall_fixing_pos = self.get_screwhole_positions()[0][:2]
-        distance_to_anchor = get_distance_between_two_points(self.bearing_positions[-1][:2], self.hands_position)
+            wall_fixing_pos = outline_model.screwhole_positions[0][:2]
+        distance_to_anchor = get_distance_between_two_points(outline_model.bearing_positions[-1][:2], outline_model.hands_position)
 
         if distance_to_anchor > self.radius and not self.power_at_bottom:
             #bit of a special case, anchor is at the bottom
-            cock = get_stroke_line(self.top_pillar_positions, wide=self.pillar_r*2, thick = plate_thick)
-            central_point = get_average_of_points(self.top_pillar_positions)
-            cock = cock.union(get_stroke_line([central_point, self.bearing_positions[-1][:2]], wide=self.pillar_r*2, thick = plate_thick))
-            cock = cock.union(get_stroke_arc(self.top_pillar_positions[0], self.top_pillar_positions[1], self.radius, wide=self.pillar_r*2, thick=plate_thick))
+            cock = get_stroke_line(outline_model.top_pillar_positions, wide=self.pillar_r*2, thick = plate_thick)
+            central_point = get_average_of_points(outline_model.top_pillar_positions)
+            cock = cock.union(get_stroke_line([central_point, outline_model.bearing_positions[-1][:2]], wide=self.pillar_r*2, thick = plate_thick))
+            cock = cock.union(get_stroke_arc(outline_model.top_pillar_positions[0], outline_model.top_pillar_positions[1], self.radius, wide=self.pillar_r*2, thick=plate_thick))
 
         else:
             #anchor is at the top or within the radius
             width = self.pillar_r*2
 
-            anchor_holder_fixing_points = self.top_pillar_positions[:]
+            anchor_holder_fixing_points = outline_model.top_pillar_positions[:]
 
             if anchor_holder_fixing_points[0][0] < anchor_holder_fixing_points[1][0]:
                 #swap pillars around to make arc work in right direction
@@ -5339,7 +5791,7 @@ class RoundClockPlates(SimpleClockPlates):
 
             #using sagitta to work out radius of curve that links all points
             l = get_distance_between_two_points(anchor_holder_fixing_points[0], anchor_holder_fixing_points[1])
-            s = abs(anchor_holder_fixing_points[0][1] - self.bearing_positions[-1][1])
+            s = abs(anchor_holder_fixing_points[0][1] - outline_model.bearing_positions[-1][1])
             r_anchor_bearing = s/2 + (l**2)/(8*s)
 
             cock = get_stroke_arc(anchor_holder_fixing_points[0], anchor_holder_fixing_points[1], r_anchor_bearing, wide=width, thick=plate_thick)#, fill_in=self.wall_mounted)
@@ -5350,10 +5802,10 @@ class RoundClockPlates(SimpleClockPlates):
                 # standoff = standoff.union(get_stroke_line(anchor_holder_fixing_points, width, plate_thick))
                 # standoff = standoff.union(get_stroke_line([self.bearing_positions[-1][:2], (0, anchor_holder_fixing_points[0][1])], width*1.5, plate_thick, style=StrokeStyle.SQUARE))
                 # wall_fixing_pos = (0, anchor_holder_fixing_points[0][1] + s/2)
-                if get_distance_between_two_points(wall_fixing_pos, self.hands_position) > self.radius +5:
+                if get_distance_between_two_points(wall_fixing_pos, outline_model.hands_position) > self.radius +5:
                     #the screwhole sticks out the top of the clock, just jut out a little bit
                     holdy_bit_wide=self.plate_width*1.2
-                    cock = cock.union(get_stroke_line([self.bearing_positions[-1][:2], wall_fixing_pos], wide=holdy_bit_wide, thick=plate_thick, style=StrokeStyle.SQUARE))
+                    cock = cock.union(get_stroke_line([outline_model.bearing_positions[-1][:2], wall_fixing_pos], wide=holdy_bit_wide, thick=plate_thick, style=StrokeStyle.SQUARE))
                     cock = cock.union(cq.Workplane("XY").moveTo(wall_fixing_pos[0],wall_fixing_pos[1]).circle(holdy_bit_wide/2).extrude(plate_thick))
 
                 else:
@@ -5364,7 +5816,7 @@ class RoundClockPlates(SimpleClockPlates):
 
                     cock = cock.union(get_stroke_arc(anchor_holder_fixing_points[0], anchor_holder_fixing_points[1], r_wall_fixing, wide=width, thick=plate_thick))
 
-                    gap_size = abs(wall_fixing_pos[1] - self.bearing_positions[-1][1]) - width
+                    gap_size = abs(wall_fixing_pos[1] - outline_model.bearing_positions[-1][1]) - width
                     if gap_size < 2:
                         #don't leave little gaps
                         cock = cock.union(get_stroke_arc(anchor_holder_fixing_points[0], anchor_holder_fixing_points[1], (r_anchor_bearing + r_wall_fixing)/2, wide=width, thick=plate_thick))
@@ -5384,7 +5836,7 @@ class RoundClockPlates(SimpleClockPlates):
         if self.text_on_standoffs:
             cock = cock.cut(self.get_text(top_standoff=True))
 
-        cock = cock.cut(self.get_fixing_screws_cutter())#.translate(np_to_set(np.multiply(-1, self.bearing_positions[-1][:2]))
+        cock = cock.cut(outline_model.get_fixing_screws_cutter())#.translate(np_to_set(np.multiply(-1, self.bearing_positions[-1][:2]))
 
 
         if for_printing and self.standoff_pillars_separate:
@@ -5453,11 +5905,11 @@ class RoundClockPlates(SimpleClockPlates):
         return (lengths, zs)
 
 
-    def get_assembled(self, one_peice=True):
+    def get_assembled(self, one_peice=True, progress_callback=None):
         '''
         TODO switch over to using get_parts_in_situ() properly
         '''
-        plates, pillars, detail, standoff_pillars, standoffs = super().get_assembled(one_peice=False)
+        plates, pillars, detail, standoff_pillars, standoffs = super().get_assembled(one_peice=False, progress_callback=progress_callback)
 
         if not self.wall_mounted:
             plates = plates.add(self.get_legs(back=True).translate((0,0,-self.plate_thick)))
@@ -5518,8 +5970,8 @@ Firmly push all bearings into their slots, a bench vice can help with this. Alte
 
         return bom
 
-    def get_printable_parts(self):
-        parts = super().get_printable_parts()
+    def get_printable_parts(self, processes=None):
+        parts = super().get_printable_parts(processes=processes)
         if not self.wall_mounted:
             parts.append(BillOfMaterials.PrintedPart("legs_back",self.get_legs(back=True), purpose="Rear set of legs"))
             parts.append(BillOfMaterials.PrintedPart("legs_front", self.get_legs(back=False), purpose="Front set of legs"))
@@ -5531,8 +5983,8 @@ Firmly push all bearings into their slots, a bench vice can help with this. Alte
             parts.append(BillOfMaterials.PrintedPart("vanity_plate", self.get_vanity_plate(), purpose="Fixed to front plate behind dial"))
         return parts
 
-    def output_STLs(self, name="clock", path="../out"):
-        super().output_STLs(name, path)
+    def output_STLs(self, name="clock", path="../out", processes=None):
+        super().output_STLs(name, path, processes=processes)
 
         if not self.wall_mounted:
             export_STL(self.get_legs(back=True), "legs_back", name, path)
@@ -5690,6 +6142,10 @@ class RectangularWallClockPlates(RoundClockPlates):
         self.all_pillar_positions = self.bottom_pillar_positions + self.top_pillar_positions
 
 
+    def get_plate_outline_circles(self, back=True):
+        #no ring, the arms go between the bearings and the pillars
+        return SimpleClockPlates.get_plate_outline_circles(self, back=back)
+
     def get_plate(self, back=True, for_printing=True, just_basic_shape=False, thick_override=-1):
 
         plate_thick = self.get_plate_thick(back=back)
@@ -5760,7 +6216,7 @@ class RectangularWallClockPlates(RoundClockPlates):
         if just_basic_shape:
             return plate
 
-        plate = plate.cut(self.get_fixing_screws_cutter())
+        plate = plate.cut(self.get_plate_outline_model().get_fixing_screws_cutter())
         if back:
 
             plate = self.rear_additions_to_plate(plate)
@@ -5825,42 +6281,44 @@ class RectangularWallClockPlates(RoundClockPlates):
         return standoff
 
     def get_bottom_wall_standoff(self, for_printing=True):
-        standoff = get_stroke_line( [self.bottom_pillar_positions[0], self.bearing_positions[0][:2], self.bottom_pillar_positions[1]],
+        outline_model = self.get_plate_outline_model()
+        standoff = get_stroke_line( [outline_model.bottom_pillar_positions[0], outline_model.bearing_positions[0][:2], outline_model.bottom_pillar_positions[1]],
                                     wide=self.plate_width, thick = self.get_plate_thick(standoff=True))
 
-        standoff = self.add_stronger_ends_to_standoff(standoff, self.bottom_pillar_positions)
+        standoff = self.add_stronger_ends_to_standoff(standoff, outline_model.bottom_pillar_positions)
 
-        standoff = self.cut_wall_fixing_hole(standoff, self.get_screwhole_positions()[1], screw_head_d=self.wall_fixing_screw_head_d, add_extra_support=True, plate_thick=self.get_plate_thick(standoff=True))
+        standoff = self.cut_wall_fixing_hole(standoff, outline_model.screwhole_positions[1], screw_head_d=self.wall_fixing_screw_head_d, add_extra_support=True, plate_thick=self.get_plate_thick(standoff=True))
 
-        standoff = standoff.cut(self.get_fixing_screws_cutter().translate((0,0, self.back_plate_from_wall)))
+        standoff = standoff.cut(outline_model.get_fixing_screws_cutter().translate((0,0, self.back_plate_from_wall)))
 
         if not for_printing:
             standoff = standoff.translate((0, 0, -self.back_plate_from_wall))
         return standoff
     def get_back_cock(self, for_printing=True):
-        standoff = get_stroke_line( [self.top_pillar_positions[0], self.bearing_positions[-1][:2], self.top_pillar_positions[1]],
+        outline_model = self.get_plate_outline_model()
+        standoff = get_stroke_line( [outline_model.top_pillar_positions[0], outline_model.bearing_positions[-1][:2], outline_model.top_pillar_positions[1]],
                                     wide=self.plate_width, thick = self.get_plate_thick(standoff=True))
 
-        standoff = self.add_stronger_ends_to_standoff(standoff, self.top_pillar_positions)
+        standoff = self.add_stronger_ends_to_standoff(standoff, outline_model.top_pillar_positions)
 
         if self.top_screw_fixing_on_loop:
             loop = cq.Workplane("XY").circle(self.top_screw_fixing_loop_radius+self.plate_width/2).circle(self.top_screw_fixing_loop_radius - self.plate_width/2).extrude(self.get_plate_thick(standoff=True))
 
-            loop = loop.translate(self.bearing_positions[-1][:2])
+            loop = loop.translate(outline_model.bearing_positions[-1][:2])
 
-            loop_cutter = (cq.Workplane("XY").moveTo(self.top_pillar_positions[0][0], self.top_pillar_positions[0][1]).lineTo(self.bearing_positions[-1][0], self.bearing_positions[-1][1])
-                           .lineTo(self.top_pillar_positions[1][0], self.top_pillar_positions[1][1])
-                           .lineTo(self.top_pillar_positions[1][0], self.top_pillar_positions[1][1]-self.top_screw_fixing_loop_radius*2)
-                           .lineTo(self.top_pillar_positions[0][0], self.top_pillar_positions[0][1]-self.top_screw_fixing_loop_radius*2).close().extrude(self.get_plate_thick(standoff=True)))
+            loop_cutter = (cq.Workplane("XY").moveTo(outline_model.top_pillar_positions[0][0], outline_model.top_pillar_positions[0][1]).lineTo(outline_model.bearing_positions[-1][0], outline_model.bearing_positions[-1][1])
+                           .lineTo(outline_model.top_pillar_positions[1][0], outline_model.top_pillar_positions[1][1])
+                           .lineTo(outline_model.top_pillar_positions[1][0], outline_model.top_pillar_positions[1][1]-self.top_screw_fixing_loop_radius*2)
+                           .lineTo(outline_model.top_pillar_positions[0][0], outline_model.top_pillar_positions[0][1]-self.top_screw_fixing_loop_radius*2).close().extrude(self.get_plate_thick(standoff=True)))
 
             loop = loop.cut(loop_cutter)
             standoff = standoff.union(loop)
 
 
-        standoff = self.cut_wall_fixing_hole(standoff, self.get_screwhole_positions()[0], screw_head_d=self.wall_fixing_screw_head_d, add_extra_support=True, plate_thick=self.get_plate_thick(standoff=True))
+        standoff = self.cut_wall_fixing_hole(standoff, outline_model.screwhole_positions[0], screw_head_d=self.wall_fixing_screw_head_d, add_extra_support=True, plate_thick=self.get_plate_thick(standoff=True))
 
         standoff = self.cut_anchor_bearing_in_standoff(standoff)
-        standoff = standoff.cut(self.get_fixing_screws_cutter().translate((0, 0, self.back_plate_from_wall)))
+        standoff = standoff.cut(outline_model.get_fixing_screws_cutter().translate((0, 0, self.back_plate_from_wall)))
         if not for_printing:
             standoff = standoff.translate((0, 0, -self.back_plate_from_wall))
         return standoff
@@ -6064,11 +6522,11 @@ class RollingBallClockPlates(SimpleClockPlates):
         plate = plate.union(cq.Workplane("XY").circle(self.going_train.powered_wheel.key_bearing.outer_d / 2 + self.bearing_wall_thick * 1.5).extrude(plate_thick))
 
         if back:
-            plate = plate.cut(self.get_fixing_screws_cutter())
+            plate = plate.cut(self.get_plate_outline_model().get_fixing_screws_cutter())
             if not self.text_on_standoffs:
                 plate = plate.cut(self.get_text())
         else:
-            plate = plate.cut(self.get_fixing_screws_cutter().translate((0, 0, -self.get_plate_thick(back=True) - self.plate_distance)))
+            plate = plate.cut(self.get_plate_outline_model().get_fixing_screws_cutter().translate((0, 0, -self.get_plate_thick(back=True) - self.plate_distance)))
 
         if not back:
             plate = self.front_additions_to_plate(plate)
@@ -6225,15 +6683,19 @@ class SlideWhistlePlates(BasePlates):
             self.fixing_screws = MachineScrew(4)
 
     def punch_bearing_holes(self, plate, back, make_plate_bigger=True):
+        '''
+        cuts are batched through a BooleanBuilder like SimpleClockPlates.get_plate, and the punches come from BEARING_PUNCH_LIBRARY.
+        '''
+        plate_builder = BooleanBuilder(plate)
         for i, pos in enumerate(self.bearing_positions):
             bearing = self.arbors_for_plate[i].bearing
             bearing_on_top = back
 
             punch = self.get_bearing_punch(self.plate_thick, bearing, bearing_on_top, with_support=make_plate_bigger)
 
-            plate = plate.cut(punch.translate(pos[:2]))
+            plate_builder.cut(punch.translate(pos[:2]))
 
-        return plate
+        return plate_builder.get_shape()
 
     def get_plate(self, top=True):
         '''
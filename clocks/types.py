@@ -99,6 +99,8 @@ class GearTrainLayout(Enum):
     #new design that attemps to put the seconds wheel in the centre and doesn't care where the minute wheel goes
     #designed with round clock plates in mind
     COMPACT_CENTRE_SECONDS = "compact centre seconds"
+    #search for the smallest layout, see GearLayout2DOptimised. Falls back to the standard layout if that's better
+    OPTIMISED = "optimised"
 
 class PlateStyle(Enum):
     '''
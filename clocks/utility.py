@@ -22,6 +22,8 @@ import os
 import re
 import pathlib
 import json
+import io
+import threading
 from enum import Enum
 
 import numpy as np
@@ -54,6 +56,8 @@ LINE_WIDTH = 0.45
 LAYER_THICK_EXTRATHICK = 0.3
 # default extrusion width, for the odd thing where it matters
 EXTRUSION_WIDTH = 0.45
+#(x, y) mm
+PRINT_BED_SIZE = (250, 210)
 GRAVITY = 9.81
 
 # extra diameter to add to something that should be free to rotate over a rod
@@ -1483,6 +1487,35 @@ def get_pendulum_holder_cutter(pendulum_rod_d=3, z=7.5, extra_nut_space=0.2, ext
 
     return shape
 
+def get_simple_settings(thing):
+    '''
+    hashable snapshot of all the attributes of thing which are simple values, or (nested) lists/tuples of simple values. Anything else (shapes, caches, other objects) is ignored.
+    For building cache keys from objects which get reconfigured after creation
+    '''
+    def get_simple(value):
+        #returns the hashable version of value, or None if it isn't simple
+        if value is None or isinstance(value, (int, float, str, bool, Enum)):
+            return (value,)
+        if isinstance(value, (list, tuple)):
+            items = [get_simple(item) for item in value]
+            if all([item is not None for item in items]):
+                return (tuple([item[0] for item in items]),)
+        return None
+    settings = []
+    for key, value in vars(thing).items():
+        simple = get_simple(value)
+        if simple is not None:
+            settings.append((key, simple[0]))
+    return tuple(sorted(settings))
+
+#rendering text through the OCCT fonts is slow and the same strings get rendered repeatedly while fitting text into spaces
+#(font cache key, text, size, thick) -> centred text shape
+TEXT_SHAPE_CACHE = {}
+#(font cache key, text, size, thick, inverted, angle) -> (xlen, ylen) of the text as placed by TextSpace
+TEXT_BOUNDING_BOX_CACHE = {}
+#the autoclock server generates in several threads, so only fill the text caches while holding this
+TEXT_CACHE_LOCK = threading.RLock()
+
 class Font:
     '''
     found myself starting to pass more and more info about rather than just the name of the font - so wrap it all up in a single object.
@@ -1495,7 +1528,20 @@ class Font:
         self.dial_scale = dial_scale
         self.custom = False
 
+    def get_cache_key(self):
+        return (type(self).__name__, self.name, self.kind, self.filepath)
+
     def get_text(self, text, text_size, thick):
+        '''
+        text centred on the origin. Cached in TEXT_SHAPE_CACHE, the result is a fresh workplane so it's safe to add() to
+        '''
+        key = (self.get_cache_key(), text, text_size, thick)
+        with TEXT_CACHE_LOCK:
+            if key not in TEXT_SHAPE_CACHE:
+                TEXT_SHAPE_CACHE[key] = self.make_text(text, text_size, thick)
+            return cq.Workplane("XY").add(TEXT_SHAPE_CACHE[key])
+
+    def make_text(self, text, text_size, thick):
         shape = cq.Workplane("XY").text(text, text_size, thick, kind=self.kind, font=self.name, fontPath=self.filepath)
         bb = shape.val().BoundingBox()
 
@@ -1517,7 +1563,10 @@ class CustomFont(Font):
         self.custom_font_class = custom_font_class
         self.custom = True
 
-    def get_text(self, text, text_size, thick):
+    def get_cache_key(self):
+        return (type(self).__name__, self.custom_font_class)
+
+    def make_text(self, text, text_size, thick):
         font = self.custom_font_class(height=text_size, thick=thick)
         return font.get_text(text)
 
@@ -1564,9 +1613,11 @@ class TextSpace:
     def set_size(self, size):
         self.text_size = size
 
-    def get_text_shape(self):
+    def get_text_shape(self, positioned=True):
         '''
         get the text centred properly
+
+        positioned: if False, leave the (rotated) text centred on the origin rather than moving it to x,y
         '''
         # shape = cq.Workplane("XY").text(self.text, self.text_size, self.thick, kind=self.font.kind, font=self.font.name, fontPath=self.font.filepath)  # , font="Comic Sans MS")
         # bb = shape.val().BoundingBox()
@@ -1580,25 +1631,32 @@ class TextSpace:
 
         shape = shape.rotate((0, 0, 0), (0, 0, 1), rad_to_deg(self.angle_rad))
 
-        shape = shape.translate((self.x, self.y))
+        if positioned:
+            shape = shape.translate((self.x, self.y))
 
         return shape
 
+    def get_text_bounding_box_size(self):
+        '''
+        (xlen, ylen) of the text shape, cached so fitting text doesn't render the same string again and again
+        '''
+        key = (self.font.get_cache_key(), self.text, self.text_size, self.thick, self.inverted, self.angle_rad)
+        with TEXT_CACHE_LOCK:
+            if key not in TEXT_BOUNDING_BOX_CACHE:
+                bb = self.get_text_shape(positioned=False).val().BoundingBox()
+                TEXT_BOUNDING_BOX_CACHE[key] = (bb.xlen, bb.ylen)
+            return TEXT_BOUNDING_BOX_CACHE[key]
+
     def get_text_width(self):
-        shape = self.get_text_shape()
-        bb = shape.val().BoundingBox()
-        return bb.xlen
+        return self.get_text_bounding_box_size()[0]
 
     def get_text_height(self):
-        shape = self.get_text_shape()
-        bb = shape.val().BoundingBox()
-        return bb.ylen
+        return self.get_text_bounding_box_size()[1]
 
     def get_text_max_size(self):
-        shape = self.get_text_shape()
-        bb = shape.val().BoundingBox()
-        width_ratio = self.width / bb.xlen
-        height_ratio = self.height / bb.ylen
+        x_len, y_len = self.get_text_bounding_box_size()
+        width_ratio = self.width / x_len
+        height_ratio = self.height / y_len
 
         return self.text_size * min(width_ratio, height_ratio)
 
@@ -1611,6 +1669,25 @@ def export_STL(object, object_name, clock_name="clock", path="../out", tolerance
     exporters.export(object, out, tolerance=tolerance, angularTolerance=tolerance)
 
 
+def shape_to_brep(shape):
+    '''
+    serialise a cq.Workplane or cq.Shape to BREP text so it can be passed between processes
+    '''
+    if shape is None:
+        return None
+    if isinstance(shape, cq.Workplane):
+        shapes = [val for val in shape.vals() if isinstance(val, cq.Shape)]
+        shape = shapes[0] if len(shapes) == 1 else cq.Compound.makeCompound(shapes)
+    brep = io.BytesIO()
+    shape.exportBrep(brep)
+    return brep.getvalue()
+
+def brep_to_shape(brep):
+    if brep is None:
+        return None
+    return cq.Workplane("XY").add(cq.Shape.importBrep(io.BytesIO(brep)))
+
+
 class Dome:
 
     def __init__(self, radius=100, height=250, thickness=3):
@@ -52,3 +52,77 @@ show_object(dial.get_all_detail(), options={"color": Colour.BLACK}, name="Detail
 # show_object(dial.get_supports(), options={"color": Colour.BRASS}, name="Support")
 #
 # motionWorks = MotionWorks(compensate_loose_arbour=True, compact=True, bearing=get_bearing_info(3))
+
+#tiling a dial too big for the print bed
+assert get_print_bed_tile_angles(100, 250, 210) == []
+for radius, max_wide, max_long, expected_tiles in [(130, 250, 210, 3), (150, 250, 210, 4), (200, 250, 210, 6), (160, 180, 180, 6)]:
+    tile_angles = get_print_bed_tile_angles(radius, max_wide, max_long)
+    assert len(tile_angles) == expected_tiles, f"radius {radius} split into {len(tile_angles)} tiles, expected {expected_tiles}"
+    for start, end in get_sectors(tile_angles):
+        assert abs((end - start) - math.pi * 2 / expected_tiles) < 1e-9, f"radius {radius} tile {start}-{end} isn't an equal share"
+        assert size_fits_print_bed(get_sector_extents(radius, start, end), max_wide, max_long), f"radius {radius} tile {start}-{end} doesn't fit"
+    for angle in tile_angles:
+        #halfway between the hour marks
+        hours = angle / (math.pi * 2 / 12)
+        assert abs(hours - math.floor(hours) - 0.5) < 1e-9, f"radius {radius} split at {angle} is on an hour mark"
+    #first tile is the one at the top
+    top_start, top_end = get_sectors(tile_angles)[0]
+    assert top_start <= math.pi/2 <= top_end or top_start <= math.pi*5/2 <= top_end
+    print(f"radius {radius} split into {len(tile_angles)} tiles at {[round(math.degrees(a)) for a in tile_angles]}")
+#sectors all include the centre, so this can't be done
+try:
+    get_print_bed_tile_angles(300, 250, 210)
+    raise AssertionError("radius 300 can't fit on a 250x210 bed")
+except ValueError as e:
+    print(e)
+
+#cached details are handed out as fresh workplanes, so adding to one mustn't grow the cache
+fancy_dial = Dial(150, DialStyle.FANCY_WATCH_NUMBERS, dial_width=25)
+first_numbers = fancy_dial.get_fancy_watch_numbers_detail(75, 25, 1)
+second_numbers = fancy_dial.get_fancy_watch_numbers_detail(75, 25, 1)
+assert first_numbers is not second_numbers
+assert len(first_numbers.vals()) == len(second_numbers.vals()), f"numbers detail grew from {len(first_numbers.vals())} to {len(second_numbers.vals())} objects"
+print("cached numbers detail not modified by get_fancy_watch_numbers_detail")
+
+#dials of different styles with the same layout share a cached base, and should still come out as they did before the base was cached
+def get_volume(shape):
+    return sum([solid.Volume() for solid in shape.solids().vals()])
+base_cache_size = len(DIAL_BASE_CACHE)
+for style, old_volume, old_detail_volume in [(DialStyle.LINES_ARC, 20656.06, 616.18), (DialStyle.LINES_RECT_DIAMONDS_INDICATORS, 20962.04, 310.2)]:
+    cached_dial = Dial(150, style, dial_width=25)
+    cached_dial.configure_dimensions(support_length=10, support_d=15)
+    for attempt in range(2):
+        assert abs(get_volume(cached_dial.get_dial()) - old_volume) < 0.01, f"{style.value} dial volume {get_volume(cached_dial.get_dial())}, was {old_volume}"
+        assert abs(get_volume(cached_dial.get_all_detail()) - old_detail_volume) < 0.01
+assert len(DIAL_BASE_CACHE) == base_cache_size + 1
+print("cached dial bases match the old dials")
+
+#the vectorised spiral should be exactly the old point by point formula
+def get_old_spiral_pos(spiral, angle):
+    direction = -1 if spiral.clockwise else 1
+    r = (spiral.r * (direction * angle + spiral.start_angle) / (math.pi * 2)) ** spiral.power
+    return (r * math.cos(angle) * spiral.x_scale + spiral.start_pos[0], r * math.sin(angle) * spiral.y_scale + spiral.start_pos[1])
+
+for spiral, from_angle, to_angle in [(ArithmeticSpiral(r=10, start_pos=(3, 4), x_scale=1.2, start_angle=math.pi), 0, math.pi * 3),
+                                     (ArithmeticSpiral(r=8, y_scale=0.8, start_angle=-math.pi / 2, power=1.5, clockwise=True), -math.pi * 4, -math.pi)]:
+    angles = np.linspace(from_angle, to_angle, 50)
+    assert np.allclose(spiral.get_positions(angles), [get_old_spiral_pos(spiral, angle) for angle in angles])
+    for angle in angles:
+        before, after = get_old_spiral_pos(spiral, angle - 0.01), get_old_spiral_pos(spiral, angle + 0.01)
+        if spiral.clockwise:
+            before, after = after, before
+        old_tangent = np.subtract(after, before) / get_distance_between_two_points(after, before)
+        assert np.allclose(spiral.get_tangent(angle), old_tangent)
+    #the default, evenly spaced, drawing is the same points as before
+    info = spiral.get_draw_info(from_angle, to_angle)
+    direction = 1 if from_angle < to_angle else -1
+    old_angles = [from_angle + direction * i * math.pi * 2 / 15 for i in range(math.ceil(15 * abs(from_angle - to_angle) / (math.pi * 2)) + 1)]
+    assert np.allclose(info["points"], [get_old_spiral_pos(spiral, angle) for angle in old_angles])
+
+#same volume as the old sequential unions, and following the curvature shouldn't change the shape much
+spiral = ArithmeticSpiral(r=10, start_pos=(3, 4), x_scale=1.2, start_angle=math.pi)
+even_volume = get_volume(spiral.draw(0, math.pi * 3, wide=1, thick=2))
+assert abs(even_volume - 270.55) < 0.01, f"spiral volume {even_volume}, was 270.55"
+curvature_volume = get_volume(spiral.draw(0, math.pi * 3, wide=1, thick=2, max_turn_angle=math.pi * 2 / 15))
+assert abs(curvature_volume - even_volume) / even_volume < 0.05, f"spiral volume {curvature_volume} drawn by curvature, {even_volume} evenly spaced"
+print("spirals match the old point by point spirals")
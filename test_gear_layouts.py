@@ -35,4 +35,42 @@ train.gen_gears(module_size=1, module_reduction=moduleReduction, thick=2.4, thic
 # train.print_info(weight_kg=5)
 train.print_info(for_runtime_hours=24*7)
 
-#With a weight of 2.5kg, this results in an average power usage of 47.1uW
\ No newline at end of file
+#With a weight of 2.5kg, this results in an average power usage of 47.1uW
+
+#every layout should place all the arbors without tripping over the arbors which don't have pinions
+for layout in [GearLayout2D.get_vertical_layout(train), GearLayout2D.get_compact_vertical_layout(train), GearLayout2D.get_compact_layout(train)]:
+    positions = layout.get_positions()
+    assert len(positions) == train.total_arbors
+    print(positions)
+
+#the grid index should find exactly the same clashes as checking every pair
+import random
+random.seed(1)
+index = CircleCollisionIndex()
+circles = [((random.uniform(-100, 100), random.uniform(-100, 100)), random.uniform(1, 30)) for i in range(50)]
+positions = CollisionIndexedPositions([centre for centre, r in circles], index, lambda i: circles[i][1] if i > 0 else None)
+#move a few after the index has been built
+for i in range(1, 50, 7):
+    positions[i] = (random.uniform(-100, 100), random.uniform(-100, 100))
+for query in range(20):
+    centre, r = (random.uniform(-120, 120), random.uniform(-120, 120)), random.uniform(1, 30)
+    found = [clash['key'] for clash in index.get_clashes(centre, r, gap=2)]
+    expected = [i for i in range(1, 50) if get_distance_between_two_points(centre, positions[i]) < r + circles[i][1] + 2]
+    assert found == expected, f"{found} != {expected}"
+print("collision index agrees with brute force")
+
+#the search on its own (get_positions would fall back to the standard layout) should find a valid layout smaller than the standard one
+standard = GearLayout2D.get_compact_layout(train)
+optimised = GearLayout2D.get_old_gear_train_layout(train, GearTrainLayout.OPTIMISED, centred_arbors=standard.centred_arbors)
+standard_score, standard_penalty = optimised.get_scores(np.array([[position[:2] for position in standard.get_positions()]], dtype=float))
+searched_positions, searched_score, searched_penalty = optimised.search()
+print(f"standard layout score {standard_score[0]:.1f} (penalty {standard_penalty[0]:.3f}), searched {searched_score:.1f} (penalty {searched_penalty:.3f})")
+assert searched_penalty < 1e-6, f"optimised layout has clashes, penalty {searched_penalty}"
+assert searched_score < standard_score[0]
+assert len(searched_positions) == train.total_arbors
+#meshing arbors are exactly their mesh distance apart
+for i in range(train.total_arbors - 1):
+    distance = get_distance_between_two_points(searched_positions[i], searched_positions[i + 1])
+    assert abs(distance - optimised.distances[i]) < 1e-6, f"arbor {i} is {distance} from arbor {i + 1}, not {optimised.distances[i]}"
+for i in standard.centred_arbors:
+    assert abs(searched_positions[i][0]) < 1e-9
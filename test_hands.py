@@ -49,4 +49,47 @@ hands.show_hands(show_object=show_object, show_second_hand=False)
 # show_object(hands.get_basic_hand_shape(hour=False, minute=False, second=True, colour=None, thick=1))
 
 # show_object(spade_hand(hand_width=5, thick=3,length=100))
-# show_object(diamond_hand(base_r=15, hand_width=5, thick=3,length=100))
\ No newline at end of file
+# show_object(diamond_hand(base_r=15, hand_width=5, thick=3,length=100))
+
+#the analytic mass properties should match shapes where the answer is known
+rectangle = get_polygon_mass_properties([(-2, 0), (2, 0), (2, 10), (-2, 10)])
+assert abs(rectangle["area"] - 40) < 1e-9
+assert abs(rectangle["centroid"][0]) < 1e-9 and abs(rectangle["centroid"][1] - 5) < 1e-9
+#integral of y^2 dA over the rectangle is width * height^3 / 3
+assert abs(rectangle["second_moment"][1] - 4 * 10 ** 3 / 3) < 1e-9
+#winding shouldn't matter
+assert abs(get_polygon_mass_properties([(-2, 0), (-2, 10), (2, 10), (2, 0)])["area"] - 40) < 1e-9
+
+circle = get_circle_mass_properties((3, 4), 5)
+sampled_circle = get_polygon_mass_properties([(3 + 5 * math.cos(a), 4 + 5 * math.sin(a)) for a in np.linspace(0, math.pi * 2, 1000, endpoint=False)])
+for key in ["area", "first_moment", "second_moment"]:
+    assert np.allclose(circle[key], sampled_circle[key], rtol=1e-4), f"{key}: {circle[key]} != {sampled_circle[key]}"
+
+#ring balanced on the origin
+ring = combine_mass_properties([get_circle_mass_properties((0, 0), 10)], [get_circle_mass_properties((0, 0), 4)])
+assert abs(ring["area"] - math.pi * (100 - 16)) < 1e-9
+assert np.allclose(ring["first_moment"], (0, 0))
+print("mass properties match known shapes")
+
+#any style can be balanced with the automatic counterweight
+for style in [HandStyle.SPADE, HandStyle.BREGUET]:
+    balanced_hands = Hands(style=style, length=60, thick=3, outline=0, second_length=25, auto_counterweight=True)
+    balance = balanced_hands.get_balance(HandType.SECOND)
+    assert np.linalg.norm(balance["centre_of_mass"]) < 0.1, f"{style.value} second hand centre of mass {balance['centre_of_mass']}"
+print("automatic counterweights balance the second hand")
+
+#reconfiguring the hands (or their generator) after creating them must miss the cache
+cached_hands = Hands(style=HandStyle.BAROQUE, length=60, thick=3, outline=0, second_length=25)
+first_minute = cached_hands.get_hand(HandType.MINUTE)
+assert cached_hands.get_hand(HandType.MINUTE) is first_minute
+state = cached_hands.get_cache_state()
+cached_hands.configure_length(70)
+assert cached_hands.get_cache_state() != state
+longer_minute = cached_hands.get_hand(HandType.MINUTE)
+assert longer_minute is not first_minute
+assert longer_minute.val().BoundingBox().ymax > first_minute.val().BoundingBox().ymax
+state = cached_hands.get_cache_state()
+cached_hands.generator.line_width *= 2
+assert cached_hands.get_cache_state() != state
+assert cached_hands.get_hand(HandType.MINUTE) is not longer_minute
+print("hand cache invalidated on reconfigure")
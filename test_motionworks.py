@@ -24,4 +24,26 @@ parts = motionWorks.get_parts_in_situ()
 for part in parts:
     show_object(parts[part], name=part)
 
-#With a weight of 2.5kg, this results in an average power usage of 47.1uW
\ No newline at end of file
+#With a weight of 2.5kg, this results in an average power usage of 47.1uW
+
+#the moon complication caches its arbors, positions and moon, they should come out as they did before they were cached, and not change however often they're fetched
+def get_volume(shape):
+    return sum([solid.Volume() for solid in shape.solids().vals()])
+moon = MoonPhaseComplication3D(gear_style=GearStyle.ARCS, first_gear_angle_deg=205, on_left=False, bevel_module=1.1, module=0.9, moon_radius=13, bevel_angle_from_hands_deg=90,
+                               moon_from_hands=40, moon_inside_dial=True)
+moon_motion_works = MotionWorks(extra_height=22, style=GearStyle.ARCS, thick=3, compensate_loose_arbour=False, compact=True, moon_complication=moon, cannon_pinion_to_hour_holder_gap_size=0.6)
+moon.set_motion_works_sizes(moon_motion_works)
+for attempt in range(2):
+    arbors = [moon.get_arbor_shape(i) for i in range(3)]
+    assert np.allclose([get_volume(arbor) for arbor in arbors], [5069.45, 3489.71, 5878.21], atol=0.01)
+    assert abs(get_volume(moon.get_moon_half()) - 4456.85) < 0.01
+    assert np.allclose(moon.get_arbor_positions_relative_to_motion_works(), [(28.957, -13.503, 0.5), (27.998, 20.684, 0.5), (0, 38.712, 4.1)], atol=0.001)
+    #adding to what we're given mustn't change the cache
+    arbors[0].add(cq.Workplane("XY").box(10, 10, 10))
+    moon.get_arbor_positions_relative_to_motion_works().append((0, 0, 0))
+#different motion works should miss the cache
+first_pinion_thick = moon.first_pinion_thick
+moon.set_motion_works_sizes(MotionWorks(extra_height=30, style=GearStyle.ARCS, thick=4, compensate_loose_arbour=False, compact=True, moon_complication=moon))
+assert moon.first_pinion_thick != first_pinion_thick
+assert abs(get_volume(moon.get_arbor_shape(0)) - 5069.45) > 0.01
+print("moon complication cache matches the uncached parts")
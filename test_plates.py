@@ -0,0 +1,75 @@
+from clocks import *
+
+outputSTL = False
+
+if 'show_object' not in globals():
+    #don't output STL when we're in cadquery editor
+    outputSTL = True
+    def show_object(*args, **kwargs):
+        pass
+
+def get_volume(shape):
+    return sum([solid.Volume() for solid in shape.solids().vals()])
+
+def get_bounds(shape):
+    bb = shape.val().BoundingBox()
+    return np.array([bb.xmin, bb.ymin, bb.zmin, bb.xmax, bb.ymax, bb.zmax])
+
+#based on wall_clock_36
+escapement = AnchorEscapement(drop=1.5, lift=3, teeth=40, lock=1.5, tooth_tip_angle=5, tooth_base_angle=4, anchor_thick=10, style=AnchorStyle.CURVED_MATCHING_WHEEL)
+train = GoingTrain(pendulum_period=1.5, fourth_wheel=False, escapement=escapement, max_weight_drop=1000, chain_at_back=False, powered_wheels=0, runtime_hours=30,
+                   use_pulley=True, huygens_maintaining_power=False, escape_wheel_pinion_at_front=True)
+train.calculate_ratios(max_wheel_teeth=130, min_pinion_teeth=10, wheel_min_teeth=60, pinion_max_teeth=15, max_error=0.1, module_reduction=1)
+train.gen_cord_wheels(ratchet_thick=5, cord_thick=1, ratchet_diameter=20, cap_diameter=60)
+train.gen_gears(module_size=1.25, module_reduction=1, thick=2, powered_wheel_thick=3, style=None, pinion_thick_multiplier=3, powered_wheel_pinion_thick_multiplier=3,
+                pendulum_fixing=PendulumFixing.DIRECT_ARBOR_SMALL_BEARINGS)
+motion_works = MotionWorks(extra_height=0, style=None, module=1, compensate_loose_arbour=False, compact=True, inset_at_base=MotionWorks.STANDARD_INSET_DEPTH)
+motion_works.calculate_size(30)
+dial = Dial(outside_d=140, bottom_fixing=False, top_fixing=True)
+plates = SimpleClockPlates(train, motion_works, plate_thick=7, pendulum_sticks_out=25, name="test plates", gear_train_layout=GearTrainLayout.VERTICAL, back_plate_from_wall=40,
+                           pendulum_fixing=PendulumFixing.DIRECT_ARBOR_SMALL_BEARINGS, pendulum_at_front=False, centred_second_hand=False, chain_through_pillar_required=True,
+                           dial=dial, pillars_separate=True, escapement_on_front=True)
+
+back_plate = plates.get_plate(back=True)
+front_plate = plates.get_plate(back=False)
+show_object(back_plate)
+show_object(front_plate.translate((0, 0, 50)))
+
+#batched booleans should give the same shape as one union/cut at a time
+base = cq.Workplane("XY").rect(100, 60).extrude(5)
+additions = [cq.Workplane("XY").circle(8).extrude(5).translate((x, 30, 0)) for x in [-40, 0, 40]] + [cq.Workplane("XY").rect(10, 80).extrude(3).translate((0, 0, 5))]
+cutters = [cq.Workplane("XY").circle(3).extrude(20).translate((x, y, -5)) for x in [-40, -20, 0, 20, 40] for y in [-20, 30]]
+builder = BooleanBuilder(base)
+sequential = base
+for addition in additions:
+    builder.add(addition)
+    sequential = sequential.union(addition)
+for cutter in cutters:
+    builder.cut(cutter)
+    sequential = sequential.cut(cutter)
+batched = builder.get_shape()
+assert abs(get_volume(batched) - get_volume(sequential)) < 1e-3, f"{get_volume(batched)} != {get_volume(sequential)}"
+assert np.allclose(get_bounds(batched), get_bounds(sequential), atol=1e-3)
+print("BooleanBuilder matches sequential booleans")
+
+#the bearing punches are shared between plates, building the plates again mustn't change them
+for back, plate in [(True, back_plate), (False, front_plate)]:
+    again = plates.get_plate(back=back)
+    assert abs(get_volume(again) - get_volume(plate)) < 1e-3, f"back={back} plate volume changed from {get_volume(plate)} to {get_volume(again)}"
+print("plates build the same twice")
+
+#a plate outline built in 2D and extruded once should match the same shapes extruded and unioned in 3D
+points = [(0, 0), (30, 40), (-10, 80), (-10, 80.00001), (20, 100)]
+outline = PlateOutline().add_stroke_line(points, wide=10).add_circle((30, 40), 12).add_rect((-10, 0), 30, 8, angle_deg=30).cut_circle((0, 0), 3)
+flat = outline.extrude(5)
+solid = get_stroke_line(points, wide=10, thick=5).union(cq.Workplane("XY").circle(12).extrude(5).translate((30, 40)))
+solid = solid.union(cq.Workplane("XY").rect(30, 8).extrude(5).rotate((0, 0, 0), (0, 0, 1), 30).translate((-10, 0))).cut(cq.Workplane("XY").circle(3).extrude(5))
+assert abs(get_volume(flat) - get_volume(solid)) < 1e-2, f"{get_volume(flat)} != {get_volume(solid)}"
+assert np.allclose(get_bounds(flat), get_bounds(solid), atol=1e-3)
+print("PlateOutline matches 3D unions")
+
+#volume and bounds of these plates from before they were built with BooleanBuilder and PlateOutline
+for back, plate, old_volume in [(True, back_plate, 37172.6), (False, front_plate, 37108.8)]:
+    assert abs(get_volume(plate) - old_volume) < 0.1, f"back={back} plate volume {get_volume(plate)}, was {old_volume}"
+    assert np.allclose(get_bounds(plate), [-16.31, -92.74, 0, 16.31, 207.06, 7], atol=0.01)
+print("plates match the old 3D path")